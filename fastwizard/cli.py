@@ -3,6 +3,7 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
 from rich.prompt import IntPrompt
+from pathlib import Path
 from typing import List
 import os
 
@@ -113,7 +114,8 @@ def new():
         console.print(f"   cd {project_name}")
         console.print("   pip install -r requirements.txt")
         console.print("   Sans Docker :")
-        console.print("   python -m uvicorn main:app --reload")
+        console.print("   python server.py                  (dev, rechargement automatique)")
+        console.print("   python server.py --profile prod   (workers, uvloop, httptools)")
         console.print("   Avec Docker :")
         console.print("   docker compose up --build")
         console.print("   Avec Makefile :")
@@ -332,6 +334,30 @@ def select_modules() -> List[str]:
 
 
 
+@app.command()
+def update(path: str = typer.Argument(".", help="Dossier du projet FastWizard")):
+    """
+    Met à jour un projet existant : régénère la table des routers (app/core/routers.py)
+    """
+    project_path = Path(path)
+    try:
+        routers = project_generator.update_project(project_path)
+    except ValueError as e:
+        console.print(f"❌ [red]{e}[/red]")
+        raise typer.Exit(1)
+
+    console.print(f"✅ [green]Table des routers régénérée[/green] ({len(routers)} routers)")
+    for router in routers:
+        console.print(f"   • [cyan]{router['prefix']}[/cyan] → {router['module']}")
+
+    main_file = project_path / "main.py"
+    if main_file.exists() and "include_routers" not in main_file.read_text():
+        console.print("\n⚠️ [yellow]main.py n'utilise pas encore la table des routers.[/yellow]")
+        console.print("   Remplacez les include_router et la boucle sur app/domains par :")
+        console.print("   from app.core.routers import include_routers")
+        console.print("   include_routers(app)")
+
+
 def confirm_generation(project_name: str, selected_modules: List[str]):
     """
     Confirmation avant génération du projet
@@ -10,6 +10,9 @@ from ..modules import ModuleManager
 
 from .submodules.base_structure import create_base_structure
 from .submodules.main_files import generate_main_files
+from .submodules.load_tests import generate_load_tests
+from .submodules.pytest_suite import generate_pytest_suite
+from .submodules.routers import generate_router_table
 
 
 console = Console()
@@ -79,6 +82,20 @@ class ProjectGenerator:
             self._generate_modules(project_path, selected_modules)
             progress.update(task3, completed=True)
 
+        # Tests : suite pytest et tests de charge (selon les modules et entités CRUD)
+        test_entities = crud_entities if "crud" in selected_modules else {}
+        generate_pytest_suite(project_path, selected_modules, test_entities)
+        generate_load_tests(project_path, selected_modules, test_entities)
+
+        # Table des routers (après les modules : elle reflète les fichiers générés)
+        generate_router_table(project_path, self.module_manager)
+
+    def update_project(self, project_path: Path) -> List[Dict[str, Any]]:
+        """Régénère les fichiers dérivés du contenu d'un projet existant (table des routers)"""
+        if not (project_path / "app" / "domains").is_dir():
+            raise ValueError(f"'{project_path}' n'est pas un projet FastWizard (app/domains introuvable)")
+        return generate_router_table(project_path, self.module_manager)
+
     def _generate_modules(self, project_path: Path, selected_modules: List[str]):
         """Génère les fichiers des modules sélectionnés"""
         
@@ -0,0 +1,16 @@
+from pathlib import Path
+from typing import Dict, List
+
+from fastwizard.templates.tests.load_harness import get_load_harness_template
+from fastwizard.templates.tests.load_runner import get_load_runner_template
+from fastwizard.templates.tests.load_scenarios import get_load_scenarios_template
+
+
+def generate_load_tests(project_path: Path, selected_modules: List[str], crud_entities: Dict[str, dict]):
+    """Génère tests/load/ : scénarios de charge construits d'après les modules choisis"""
+    load_dir = project_path / "tests" / "load"
+    load_dir.mkdir(parents=True, exist_ok=True)
+
+    (load_dir / "harness.py").write_text(get_load_harness_template())
+    (load_dir / "scenarios.py").write_text(get_load_scenarios_template(selected_modules, crud_entities))
+    (load_dir / "run.py").write_text(get_load_runner_template())
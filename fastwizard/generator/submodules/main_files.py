@@ -7,6 +7,9 @@ from fastwizard.templates.main.env import generate_env_example
 from fastwizard.templates.main.readme import generate_readme
 from fastwizard.templates.main.gitignore import get_gitignore_template
 from fastwizard.templates.main.makefile import generate_makefile
+from fastwizard.templates.main.startup_benchmark import get_startup_benchmark_template
+from fastwizard.templates.main.server import get_server_template
+from fastwizard.templates.main.server_load_benchmark import get_server_load_template
 
 def generate_main_files(
     project_path: Path,
@@ -21,6 +24,9 @@ def generate_main_files(
     main_content = get_main_template(project_name, selected_modules)
     (project_path / "main.py").write_text(main_content)
 
+    # server.py (profils dev / prod)
+    (project_path / "server.py").write_text(get_server_template(selected_modules))
+
     # requirements.txt
     requirements = generate_requirements(module_manager, selected_modules)
     (project_path / "requirements.txt").write_text(requirements)
@@ -37,6 +43,11 @@ def generate_main_files(
     gitignore_content = get_gitignore_template()
     (project_path / ".gitignore").write_text(gitignore_content)
 
+    # benchmarks/startup.py (budget de temps d'import)
+    (project_path / "benchmarks").mkdir(exist_ok=True)
+    (project_path / "benchmarks" / "startup.py").write_text(get_startup_benchmark_template())
+    (project_path / "benchmarks" / "server_load.py").write_text(get_server_load_template())
+
     # Makefile
     if "makefile" in selected_modules:
         makefile_content = generate_makefile(selected_modules)
@@ -0,0 +1,43 @@
+from pathlib import Path
+from typing import Dict, List
+
+from fastwizard.templates.tests.pytest_auth import get_auth_benchmarks_template, get_auth_tests_template
+from fastwizard.templates.tests.pytest_crud import get_crud_benchmarks_template, get_crud_tests_template
+from fastwizard.templates.tests.pytest_suite import (
+    get_conftest_template,
+    get_database_module,
+    get_main_tests_template,
+    get_pytest_ini_template,
+    get_requirements_dev_template,
+)
+from fastwizard.templates.tests.pytest_websocket import get_websocket_tests_template
+
+
+def generate_pytest_suite(project_path: Path, selected_modules: List[str], crud_entities: Dict[str, dict]):
+    """Génère la suite pytest : fixtures, tests fonctionnels et micro-benchmarks des services"""
+    tests_dir = project_path / "tests"
+    tests_dir.mkdir(parents=True, exist_ok=True)
+
+    (project_path / "pytest.ini").write_text(get_pytest_ini_template())
+    (project_path / "requirements-dev.txt").write_text(get_requirements_dev_template(selected_modules))
+    (tests_dir / "conftest.py").write_text(get_conftest_template(selected_modules))
+    (tests_dir / "test_main.py").write_text(get_main_tests_template())
+    if "websocket" in selected_modules:
+        (tests_dir / "test_websocket.py").write_text(get_websocket_tests_template())
+
+    # Sans base de données, les routes d'authentification et CRUD ne sont pas testables
+    if get_database_module(selected_modules) is None:
+        return
+
+    benchmarks_dir = tests_dir / "benchmarks"
+    benchmarks_dir.mkdir(exist_ok=True)
+    (benchmarks_dir / "__init__.py").touch()
+
+    if "auth-jwt" in selected_modules:
+        (tests_dir / "test_auth.py").write_text(get_auth_tests_template())
+        (benchmarks_dir / "test_auth_services.py").write_text(get_auth_benchmarks_template())
+
+    if "crud" in selected_modules:
+        for app_name, entity in crud_entities.items():
+            (tests_dir / f"test_{app_name}.py").write_text(get_crud_tests_template(app_name, entity))
+            (benchmarks_dir / f"test_{app_name}_services.py").write_text(get_crud_benchmarks_template(app_name, entity))
@@ -0,0 +1,41 @@
+from pathlib import Path
+from typing import Dict, List
+
+from fastwizard.templates.core.routers import get_template
+
+ROUTER_TABLE_PATH = "app/core/routers.py"
+
+
+def collect_routers(project_path: Path, module_manager) -> List[Dict]:
+    """Liste les routers présents dans le projet, dans un ordre stable.
+
+    D'abord ceux des modules (préfixe déclaré dans modules.py) dont le fichier existe,
+    puis un router par domaine (app/domains/<nom>/router.py, CRUD) monté sous /api/v1/<nom>.
+    """
+    routers = []
+    seen = set()
+
+    for module in module_manager.modules.values():
+        for router in module.config.get("routers", []):
+            module_file = project_path / (router["module"].replace(".", "/") + ".py")
+            if router["module"] not in seen and module_file.exists():
+                routers.append(router)
+                seen.add(router["module"])
+
+    for router_file in sorted((project_path / "app" / "domains").glob("*/router.py")):
+        domain = router_file.parent.name
+        module_name = f"app.domains.{domain}.router"
+        if module_name not in seen:
+            routers.append({"module": module_name, "prefix": f"/api/v1/{domain}", "tags": []})
+            seen.add(module_name)
+
+    return routers
+
+
+def generate_router_table(project_path: Path, module_manager) -> List[Dict]:
+    """(Ré)écrit app/core/routers.py à partir des routers présents dans le projet"""
+    routers = collect_routers(project_path, module_manager)
+    table_file = project_path / ROUTER_TABLE_PATH
+    table_file.parent.mkdir(parents=True, exist_ok=True)
+    table_file.write_text(get_template({"routers": routers}))
+    return routers
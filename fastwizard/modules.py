@@ -136,7 +136,8 @@ class ModuleManager:
                 "secret_key": "your-secret-key-here",
                 "algorithm": "HS256",
                 "access_token_expire_minutes": 30,
-                "refresh_token_expire_days": 7
+                "refresh_token_expire_days": 7,
+                "routers": [{"module": "app.domains.auth.router", "prefix": "/api/v1/auth", "tags": ["auth"]}]
             }
         )
         
@@ -244,21 +245,137 @@ class ModuleManager:
             id="logging",
             name="Logging",
             description="Configuration des outils de logging (loguru)",
-            dependencies=["loguru==0.7.3", "rich==14.2.0"],
+            dependencies=["loguru==0.7.3", "rich==14.2.0", "orjson==3.11.4"],
             files=[
                 {
                     "path": "app/core/logging.py",
                     "template": "core/logging.py"
+                },
+                {
+                    "path": "app/core/request_context.py",
+                    "template": "core/request_context.py"
+                },
+                {
+                    "path": "app/core/routing.py",
+                    "template": "core/routing.py"
+                }
+            ],
+            config={}
+        )
+
+        # Module Réponses JSON orjson
+        modules["orjson"] = ModuleInfo(
+            id="orjson",
+            name="Réponses JSON rapides",
+            description="Réponses JSON sérialisées avec orjson et Pydantic (sans jsonable_encoder), avec benchmark de sérialisation des schémas.",
+            dependencies=["orjson==3.11.4"],
+            files=[
+                {
+                    "path": "app/core/responses.py",
+                    "template": "core/responses.py"
+                },
+                {
+                    "path": "benchmarks/serialization.py",
+                    "template": "core/serialization_benchmark.py"
+                }
+            ],
+            config={}
+        )
+
+        # Module Métriques Prometheus
+        modules["metrics"] = ModuleInfo(
+            id="metrics",
+            name="Métriques Prometheus",
+            description="Endpoint /metrics : latence par route, requêtes en cours, statuts, pool SQLAlchemy, cache et WebSocket (compatible multi-workers).",
+            dependencies=["prometheus-client==0.26.0"],
+            files=[
+                {
+                    "path": "app/core/metrics.py",
+                    "template": "core/metrics.py"
+                },
+                {
+                    "path": "app/core/routing.py",
+                    "template": "core/routing.py"
+                },
+                {
+                    "path": "benchmarks/metrics_overhead.py",
+                    "template": "core/metrics_benchmark.py"
+                }
+            ],
+            config={}
+        )
+
+        # Module Compression des réponses
+        modules["compression"] = ModuleInfo(
+            id="compression",
+            name="Compression des réponses",
+            description="Compression zstd, Brotli ou gzip des réponses selon Accept-Encoding (taille minimale, types et niveaux configurables), avec benchmark octets économisés / CPU.",
+            dependencies=["brotli==1.2.0", "zstandard==0.25.0"],
+            files=[
+                {
+                    "path": "app/core/compression.py",
+                    "template": "core/compression.py"
+                },
+                {
+                    "path": "benchmarks/compression.py",
+                    "template": "core/compression_benchmark.py"
+                }
+            ],
+            config={}
+        )
+
+        # Module Traces OpenTelemetry
+        modules["otel"] = ModuleInfo(
+            id="otel",
+            name="Traces OpenTelemetry",
+            description="Traces des requêtes FastAPI, de SQLAlchemy, de Redis/Valkey et des appels httpx (OAuth, mails), exportées en OTLP ou dans un fichier local.",
+            dependencies=[
+                "opentelemetry-sdk==1.45.1",
+                "opentelemetry-exporter-otlp-proto-http==1.45.1",
+                "opentelemetry-instrumentation-fastapi==0.66b1",
+                "opentelemetry-instrumentation-sqlalchemy==0.66b1",
+                "opentelemetry-instrumentation-redis==0.66b1",
+                "opentelemetry-instrumentation-httpx==0.66b1",
+            ],
+            files=[
+                {
+                    "path": "app/core/tracing.py",
+                    "template": "core/tracing.py"
+                },
+                {
+                    "path": "app/core/config.py",
+                    "template": "core/config.py"
                 }
             ],
             config={}
         )
 
+        # Module Profilage des requêtes
+        modules["profiling"] = ModuleInfo(
+            id="profiling",
+            name="Profilage des requêtes",
+            description="Profile des requêtes individuelles (en-tête ou échantillonnage) avec pyinstrument ou cProfile ; activation à chaud par un endpoint d'administration.",
+            dependencies=["pyinstrument==5.1.3"],
+            files=[
+                {
+                    "path": "app/core/profiling.py",
+                    "template": "core/profiling.py"
+                },
+                {
+                    "path": "app/domains/profiling/router.py",
+                    "template": "core/profiling_router.py"
+                }
+            ],
+            config={
+                "routers": [{"module": "app.domains.profiling.router", "prefix": "/api/v1/profiling", "tags": ["profiling"]}]
+            }
+        )
+
         # Module Cache Redis
         modules["cache-redis"] = ModuleInfo(
             id="cache-redis",
             name="Cache Redis",
-            description="Intégration de Redis pour le cache, les sessions et les tâches en arrière-plan.",
+            description="Intégration de Redis pour le cache et les sessions (et la file du module tasks).",
             dependencies=["redis==7.0.1"],
             files=[
                 {
@@ -288,12 +405,41 @@ class ModuleManager:
             }
         )
 
+        # Module Tâches en arrière-plan (worker sur Redis/Valkey)
+        modules["tasks"] = ModuleInfo(
+            id="tasks",
+            name="Tâches en arrière-plan",
+            description="File de tâches sur Redis/Valkey avec worker dédié : réessais avec backoff, tâches différées et planifiées, limites de concurrence.",
+            dependencies=["redis==7.0.1"],
+            files=[
+                {
+                    "path": "app/core/tasks.py",
+                    "template": "tasks/tasks_module.py"
+                },
+                {
+                    "path": "app/worker.py",
+                    "template": "tasks/tasks_worker.py"
+                },
+                {
+                    "path": "app/domains/tasks/jobs.py",
+                    "template": "tasks/tasks_jobs.py"
+                },
+                {
+                    "path": "app/domains/tasks/router.py",
+                    "template": "tasks/tasks_router.py"
+                }
+            ],
+            config={
+                "routers": [{"module": "app.domains.tasks.router", "prefix": "/api/v1/tasks", "tags": ["tasks"]}]
+            }
+        )
+
         # Module WebSocket (via Starlette / FastAPI)
         modules["websocket"] = ModuleInfo(
             id="websocket",
             name="WebSocket",
-            description="Module WebSocket pour FastAPI utilisant Starlette pour la gestion des connexions et rooms.",
-            dependencies=[],  # pas besoin de dépendances externes, FastAPI/Starlette suffisent
+            description="Module WebSocket pour FastAPI (rooms partagées entre workers via Redis/Valkey pub/sub ou Streams).",
+            dependencies=["msgpack==1.1.1"],  # protocole binaire optionnel fw.msgpack
             files=[
                 {
                     "path": "app/core/websocket.py",
@@ -302,17 +448,39 @@ class ModuleManager:
                 {
                     "path": "app/domains/ws/router.py",
                     "template": "websocket/websocket_router.py"
+                },
+                {
+                    "path": "benchmarks/ws_fanout.py",
+                    "template": "websocket/websocket_benchmark.py"
+                },
+                {
+                    "path": "benchmarks/ws_codecs.py",
+                    "template": "websocket/websocket_codec_benchmark.py"
                 }
             ],
-            config={}
+            config={
+                "routers": [{"module": "app.domains.ws.router", "prefix": "/ws", "tags": ["ws"]}]
+            }
         )
 
+        # Fichiers partagés par les fournisseurs d'emails (interface, outbox, rendu Jinja2)
+        mail_common_files = [
+            {"path": "app/domains/mails/sender.py", "template": "mails/sender.py"},
+            {"path": "app/domains/mails/outbox.py", "template": "mails/outbox.py"},
+            {"path": "app/domains/mails/renderer.py", "template": "mails/renderer.py"},
+            {"path": "app/domains/mails/routes.py", "template": "mails/routes.py"},
+            {"path": "app/domains/mails/schemas.py", "template": "mails/schemas.py"},
+            {"path": "app/templates/mails/welcome.subject", "template": "mails/examples/welcome_subject.py"},
+            {"path": "app/templates/mails/welcome.txt", "template": "mails/examples/welcome_txt.py"},
+            {"path": "app/templates/mails/welcome.html", "template": "mails/examples/welcome_html.py"},
+        ]
+
         # Module Brevo
         modules["mail-brevo"] = ModuleInfo(
             id="mail-brevo",
             name="Gestion de mails Brevo",
-            description="Module d'envoi d'emails via Brevo (ex-Sendinblue)",
-            dependencies=["brevo-python==1.2.0", "requests==2.32.5"],
+            description="Module d'envoi d'emails via Brevo (ex-Sendinblue), avec file d'envoi par lots et gabarits Jinja2.",
+            dependencies=["httpx[http2]==0.28.1", "jinja2==3.1.6"],
             files=[
                 {
                     "path": "app/domains/mails/brevo_service.py",
@@ -322,11 +490,12 @@ class ModuleManager:
                     "path": "app/domains/mails/brevo_router.py",
                     "template": "mails/brevo/brevo_router.py"
                 }
-            ],
+            ] + mail_common_files,
             config={
                 "api_key": "YOUR_BREVO_API_KEY",
                 "sender_email": "example@example.com",
-                "sender_name": "Mon Application"
+                "sender_name": "Mon Application",
+                "routers": [{"module": "app.domains.mails.brevo_router", "prefix": "/api/v1/brevo", "tags": ["mails"]}]
             }
         )
 
@@ -334,8 +503,8 @@ class ModuleManager:
         modules["mail-mailjet"] = ModuleInfo(
             id="mail-mailjet",
             name="Gestion de mails Mailjet",
-            description="Module d'envoi d'emails via Mailjet",
-            dependencies=["mailjet_rest==1.5.1"],
+            description="Module d'envoi d'emails via Mailjet, avec file d'envoi par lots et gabarits Jinja2.",
+            dependencies=["httpx[http2]==0.28.1", "jinja2==3.1.6"],
             files=[
                 {
                     "path": "app/domains/mails/mailjet_service.py",
@@ -345,43 +514,55 @@ class ModuleManager:
                     "path": "app/domains/mails/mailjet_router.py",
                     "template": "mails/mailjet/mailjet_router.py"
                 }
-            ],
+            ] + mail_common_files,
             config={
                 "api_key": "YOUR_MAILJET_API_KEY",
                 "api_secret": "YOUR_MAILJET_SECRET",
                 "sender_email": "example@example.com",
-                "sender_name": "Mon Application"
+                "sender_name": "Mon Application",
+                "routers": [{"module": "app.domains.mails.mailjet_router", "prefix": "/api/v1/mailjet", "tags": ["mails"]}]
             }
         )
 
+        # Fichiers du moteur OAuth partagés par tous les providers
+        oauth_common_files = [
+            {"path": "app/domains/oauth/registry.py", "template": "auth/oauth/oauth_registry.py"},
+            {"path": "app/domains/oauth/state.py", "template": "auth/oauth/oauth_state.py"},
+            {"path": "app/domains/oauth/services.py", "template": "auth/oauth/oauth_services.py"},
+            {"path": "app/domains/oauth/routes.py", "template": "auth/oauth/oauth_router.py"},
+            {"path": "app/domains/oauth/oidc.py", "template": "auth/oauth/oidc.py"},
+        ]
+        oauth_routers = [{"module": "app.domains.oauth.routes", "prefix": "/api/v1/oauth", "tags": ["oauth"]}]
+
         # Module OAuth Google
         modules["auth-oauth-google"] = ModuleInfo(
             id="auth-oauth-google",
             name="OAuth2 Google",
             description="Module OAuth2 pour Google, permet à l'utilisateur de se connecter via son compte Google.",
-            dependencies=["httpx==0.28.1"],
+            dependencies=["httpx[http2]==0.28.1", "python-jose[cryptography]==3.5.0"],
             files=[
                 {
-                    "path": "app/domains/oauth/google/oauth_provider.py",
+                    "path": "app/domains/oauth/providers/google.py",
                     "template": "auth/oauth/oauth_provider.py"
                 },
                 {
-                    "path": "app/domains/oauth/google/oauth_services.py",
-                    "template": "auth/oauth/oauth_services.py"
-                },
-                {
-                    "path": "app/domains/oauth/google/oauth_router.py",
-                    "template": "auth/oauth/oauth_router.py"
+                    "path": "scripts/fake_oidc_server.py",
+                    "template": "auth/oauth/fake_oidc_server.py"
                 }
-            ],
+            ] + oauth_common_files,
             config={
                 "provider": "google",
+                "label": "Google",
+                "issuer": "https://accounts.google.com",
                 "auth_url": "https://accounts.google.com/o/oauth2/v2/auth",
                 "token_url": "https://oauth2.googleapis.com/token",
                 "user_info_url": "https://www.googleapis.com/oauth2/v3/userinfo",
+                "scopes": ["openid", "email", "profile"],
+                "claims": {"subject": "sub", "email": "email", "username": "name"},
                 "client_id": "YOUR_GOOGLE_CLIENT_ID",
                 "client_secret": "YOUR_GOOGLE_CLIENT_SECRET",
-                "redirect_uri": "http://localhost:8000/api/v1/google_oauth/callback"
+                "redirect_uri": "http://localhost:8000/api/v1/oauth/google/callback",
+                "routers": oauth_routers
             }
         )
         
@@ -391,29 +572,26 @@ class ModuleManager:
             id="auth-oauth-github",
             name="OAuth2 GitHub",
             description="Module OAuth2 pour GitHub, permet à l'utilisateur de se connecter via son compte GitHub.",
-            dependencies=["httpx", "python-dotenv"],
+            dependencies=["httpx[http2]==0.28.1", "python-jose[cryptography]==3.5.0"],
             files=[
                 {
-                    "path": "app/domains/oauth/github/oauth_provider.py",
+                    "path": "app/domains/oauth/providers/github.py",
                     "template": "auth/oauth/oauth_provider.py"
-                },
-                {
-                    "path": "app/domains/oauth/github/oauth_services.py",
-                    "template": "auth/oauth/oauth_services.py"
-                },
-                {
-                    "path": "app/domains/oauth/github/oauth_router.py",
-                    "template": "auth/oauth/oauth_router.py"
                 }
-            ],
+            ] + oauth_common_files,
             config={
                 "provider": "github",
+                "label": "GitHub",
                 "auth_url": "https://github.com/login/oauth/authorize",
                 "token_url": "https://github.com/login/oauth/access_token",
                 "user_info_url": "https://api.github.com/user",
+                "emails_url": "https://api.github.com/user/emails",
+                "scopes": ["read:user", "user:email"],
+                "claims": {"subject": "id", "email": "email", "username": "login"},
                 "client_id": "YOUR_GITHUB_CLIENT_ID",
                 "client_secret": "YOUR_GITHUB_CLIENT_SECRET",
-                "redirect_uri": "http://localhost:8000/api/v1/github_oauth/callback"
+                "redirect_uri": "http://localhost:8000/api/v1/oauth/github/callback",
+                "routers": oauth_routers
             }
         )
 
@@ -1,13 +1,21 @@
 """Template pour les dépendances d'authentification"""
 def get_template(config):
-    return '''from fastapi import Depends, HTTPException, status
+    selected_modules = config.get("selected_modules", [])
+    if "logging" in selected_modules:
+        context_import = "from app.core.request_context import set_user_id\n"
+        context_set = "\n    # Utilisateur visible dans les logs de la requête\n    set_user_id(user.id)\n"
+    else:
+        context_import = ""
+        context_set = ""
+
+    return f'''from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from typing import Optional
 from app.domains.auth.jwt_handler import verify_token
 from app.domains.auth.model import User
 from app.database import get_db
-
+{context_import}
 # Schéma de sécurité HTTP Bearer
 security = HTTPBearer()
 
@@ -23,7 +31,7 @@ def get_current_user(
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token invalide ou expiré",
-            headers={"WWW-Authenticate": "Bearer"},
+            headers={{"WWW-Authenticate": "Bearer"}},
         )
     
     # Récupérer l'ID utilisateur
@@ -32,7 +40,7 @@ def get_current_user(
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token invalide",
-            headers={"WWW-Authenticate": "Bearer"},
+            headers={{"WWW-Authenticate": "Bearer"}},
         )
     
     # Récupérer l'utilisateur depuis la base de données
@@ -41,9 +49,9 @@ def get_current_user(
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Utilisateur non trouvé",
-            headers={"WWW-Authenticate": "Bearer"},
+            headers={{"WWW-Authenticate": "Bearer"}},
         )
-    
+{context_set}
     return user
 
 def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
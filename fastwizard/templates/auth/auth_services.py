@@ -3,7 +3,7 @@ def get_template(config):
     selected_modules = config.get("selected_modules", [])
     oauth_module = next((m for m in selected_modules if m.startswith("auth-oauth")), None)
 
-    if oauth_module == "auth-oauth-google" or oauth_module == "auth-oauth-github":
+    if oauth_module:
         oauth_functions = '''def get_user_by_email(db, email: str):
     return db.query(User).filter(User.email == email).first()
 
@@ -15,9 +15,11 @@ def get_template(config):
 
     template='''from fastapi import APIRouter, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from app.domains.auth.model import Role
-from typing import List
+from typing import List, Optional
 from app.domains.auth.model import User
 from app.domains.auth.schemas import (
     UserCreate, UserResponse, Token, TokenRefresh, 
@@ -29,29 +31,52 @@ from app.domains.auth.jwt_handler import (
     verify_token
 )
 
-async def register_user_service(user: UserCreate, db: Session) -> UserResponse:
-    """Logique d'enregistrement d'un nouvel utilisateur avec role par défaut 'user'."""
+# Cache process-wide de l'id du rôle par défaut (évite une requête par inscription)
+_default_role_id: Optional[int] = None
 
-    # Vérifier si l'utilisateur existe déjà
-    if db.query(User).filter(User.username == user.username).first():
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Le nom d'utilisateur est déjà utilisé"
-        )
+def get_default_role_id(db: Session) -> int:
+    """Retourne l'id du rôle 'user', mis en cache après la première lecture."""
+    global _default_role_id
+    if _default_role_id is None:
+        role_id = db.query(Role.id).filter(Role.name == "user").scalar()
+        if role_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Le rôle par défaut 'user' n'existe pas dans la base"
+            )
+        _default_role_id = role_id
+    return _default_role_id
+
+def _raise_conflict(db: Session, username: Optional[str], email: Optional[str], exclude_id: Optional[int] = None):
+    """Identifie en une seule requête le champ unique en conflit et lève l'erreur adaptée."""
+    filters = []
+    if username:
+        filters.append(User.username == username)
+    if email:
+        filters.append(User.email == email)
+    if filters:
+        query = db.query(User.username, User.email).filter(or_(*filters))
+        if exclude_id is not None:
+            query = query.filter(User.id != exclude_id)
+        for existing_username, existing_email in query.limit(2).all():
+            if username and existing_username == username:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Le nom d'utilisateur est déjà utilisé"
+                )
+            if email and existing_email == email:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="L'email est déjà utilisé"
+                )
 
-    if db.query(User).filter(User.email == user.email).first():
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="L'email est déjà utilisé"
-        )
+async def register_user_service(user: UserCreate, db: Session) -> UserResponse:
+    """Logique d'enregistrement d'un nouvel utilisateur avec role par défaut 'user'.
 
-    # Récupérer le rôle 'user' par défaut
-    default_role = db.query(Role).filter(Role.name == "user").first()
-    if not default_role:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Le rôle par défaut 'user' n'existe pas dans la base"
-        )
+    L'unicité du username/email est garantie par les contraintes de la base :
+    l'insertion est tentée directement et une IntegrityError est traduite en 400.
+    """
+    global _default_role_id
 
     # Créer le nouvel utilisateur
     hashed_password = get_password_hash(user.password)
@@ -59,11 +84,21 @@ async def register_user_service(user: UserCreate, db: Session) -> UserResponse:
         username=user.username,
         email=user.email,
         hashed_password=hashed_password,
-        role_id=default_role.id  # rôle par défaut
+        role_id=get_default_role_id(db)  # rôle par défaut
     )
 
     db.add(db_user)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        _raise_conflict(db, user.username, user.email)
+        # Aucun doublon trouvé : le rôle en cache n'existe plus (FK)
+        _default_role_id = None
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Impossible de créer l'utilisateur avec le rôle par défaut"
+        )
     db.refresh(db_user)
 
     return db_user
@@ -130,24 +165,8 @@ async def update_current_user_service(
 ) -> UserResponse:
     """Met à jour les informations du profil utilisateur"""
 
-    # Vérifier les conflits d'username
-    if user_update.username and user_update.username != current_user.username:
-        if db.query(User).filter(User.username == user_update.username).first():
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Le nom d'utilisateur est déjà utilisé"
-            )
-
-    # Vérifier les conflits d'email
-    if user_update.email and user_update.email != current_user.email:
-        if db.query(User).filter(User.email == user_update.email).first():
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="L'email est déjà utilisé"
-            )
-
     # Préparer les données à mettre à jour
-    update_data = user_update.dict(exclude_unset=True)
+    update_data = user_update.model_dump(exclude_unset=True)
 
     # Si le mot de passe est présent, le hacher
     if "password" in update_data:
@@ -157,7 +176,13 @@ async def update_current_user_service(
     for field, value in update_data.items():
         setattr(current_user, field, value)
 
-    db.commit()
+    # Les contraintes d'unicité font foi : pas de vérification préalable
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        _raise_conflict(db, update_data.get("username"), update_data.get("email"), exclude_id=current_user.id)
+        raise
     db.refresh(current_user)
 
     return current_user
@@ -10,18 +10,12 @@ def get_template(config):
     oauth_account_created_at = Column(DateTime, nullable=True)
     """
     
-    if "auth-oauth-google" in selected_modules and "auth-oauth-github" in selected_modules:
-        oauth_functions += """
-    google_id = Column(String, nullable=True, unique=True)
-    github_id = Column(String, nullable=True, unique=True)
-    """
-    elif "auth-oauth-google" in selected_modules:
-        oauth_functions += """
-    google_id = Column(String, nullable=True, unique=True)
-    """
-    elif "auth-oauth-github" in selected_modules:
-        oauth_functions += """
-    github_id = Column(String, nullable=True, unique=True)
+    # Une colonne d'identifiant par provider OAuth (google_id, github_id...)
+    for module_id in selected_modules:
+        if module_id.startswith("auth-oauth-"):
+            provider = module_id[len("auth-oauth-"):]
+            oauth_functions += f"""
+    {provider}_id = Column(String, nullable=True, unique=True)
     """
     
     all_roles = ["admin", "user"] + custom_roles
@@ -55,6 +49,11 @@ class User(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 ''' + oauth_functions + ''' 
     
+    @property
+    def is_admin(self) -> bool:
+        """Vrai si l'utilisateur a le rôle admin (UserResponse, get_current_admin_user)"""
+        return self.role is not None and self.role.name == "admin"
+
     def __repr__(self):
         return f"<User(id={self.id}, username='{self.username}', email='{self.email}')>"
 '''
\ No newline at end of file
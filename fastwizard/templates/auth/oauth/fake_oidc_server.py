@@ -0,0 +1,116 @@
+"""Template pour le serveur OIDC factice (tests locaux de la connexion OAuth)"""
+def get_template(config):
+    return '''"""
+Serveur OpenID Connect factice pour tester la connexion OAuth sans réseau.
+Automatically generated by FastWizard 🧙‍♂️
+
+Sert la découverte, le JWKS, /authorize, /token (ID token signé RS256) et /userinfo.
+
+    python scripts/fake_oidc_server.py --port 9000
+    GOOGLE_OIDC_ISSUER=http://localhost:9000 uvicorn main:app
+
+En test, l'application peut aussi être montée en mémoire :
+    create_client(transport=httpx.ASGITransport(app=create_app("http://fake-oidc")))
+"""
+import argparse
+import base64
+import hashlib
+import os
+import secrets
+import time
+from urllib.parse import urlencode
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi import FastAPI, Form, Header, HTTPException
+from fastapi.responses import RedirectResponse
+from jose import jwk, jwt
+
+FAKE_OIDC_EMAIL = os.getenv("FAKE_OIDC_EMAIL", "jane.doe@example.com")
+FAKE_OIDC_NAME = os.getenv("FAKE_OIDC_NAME", "Jane Doe")
+
+
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def create_app(issuer: str, email: str = FAKE_OIDC_EMAIL, name: str = FAKE_OIDC_NAME) -> FastAPI:
+    issuer = issuer.rstrip("/")
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    )
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    kid = secrets.token_hex(8)
+    public_jwk = {**jwk.construct(public_pem, "RS256").to_dict(), "kid": kid, "use": "sig"}
+    user = {"sub": "fake-" + hashlib.sha256(email.encode()).hexdigest()[:16], "email": email, "email_verified": True, "name": name}
+    codes = {}
+    tokens = {}
+
+    app = FastAPI(title="Fake OIDC provider")
+    app.state.requests = {"discovery": 0, "jwks": 0, "token": 0, "userinfo": 0}
+
+    @app.get("/.well-known/openid-configuration")
+    async def discovery():
+        app.state.requests["discovery"] += 1
+        return {
+            "issuer": issuer,
+            "authorization_endpoint": f"{issuer}/authorize",
+            "token_endpoint": f"{issuer}/token",
+            "userinfo_endpoint": f"{issuer}/userinfo",
+            "jwks_uri": f"{issuer}/jwks",
+            "id_token_signing_alg_values_supported": ["RS256"],
+        }
+
+    @app.get("/jwks")
+    async def jwks():
+        app.state.requests["jwks"] += 1
+        return {"keys": [public_jwk]}
+
+    @app.get("/authorize")
+    async def authorize(client_id: str, redirect_uri: str, state: str = ""):
+        # Consentement automatique : renvoie directement un code à l'application
+        code = secrets.token_urlsafe(16)
+        codes[code] = client_id
+        return RedirectResponse(f"{redirect_uri}?{urlencode({'code': code, 'state': state})}")
+
+    @app.post("/token")
+    async def token(code: str = Form(...), client_id: str = Form(...)):
+        app.state.requests["token"] += 1
+        # Un code inconnu est accepté pour pouvoir appeler /callback directement en test
+        if codes.pop(code, client_id) != client_id:
+            raise HTTPException(status_code=400, detail="invalid_grant")
+        access_token = secrets.token_urlsafe(24)
+        tokens[access_token] = user
+        digest = hashlib.sha256(access_token.encode()).digest()
+        now = int(time.time())
+        id_token = jwt.encode(
+            {**user, "iss": issuer, "aud": client_id, "iat": now, "exp": now + 3600, "at_hash": _b64(digest[:16])},
+            private_pem.decode(),
+            algorithm="RS256",
+            headers={"kid": kid},
+        )
+        return {"access_token": access_token, "id_token": id_token, "token_type": "Bearer", "expires_in": 3600}
+
+    @app.get("/userinfo")
+    async def userinfo(authorization: str = Header("")):
+        app.state.requests["userinfo"] += 1
+        claims = tokens.get(authorization.removeprefix("Bearer "))
+        if claims is None:
+            raise HTTPException(status_code=401, detail="invalid_token")
+        return claims
+
+    return app
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Serveur OIDC factice")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    args = parser.parse_args()
+    uvicorn.run(create_app(f"http://{args.host}:{args.port}"), host=args.host, port=args.port)
+'''
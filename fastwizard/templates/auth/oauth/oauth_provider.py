@@ -1,20 +1,37 @@
-"""Template pour le provider OAuth"""
+"""Template pour la configuration d'un provider OAuth"""
 def get_template(config):
     provider = config.get("provider", "")
-    auth_url = config.get("auth_url", "")
-    token_url = config.get("token_url", "")
-    user_info_url = config.get("user_info_url", "")
-    client_id = config.get("client_id", "")
-    client_secret = config.get("client_secret", "")
-    redirect_uri = config.get("redirect_uri", "")
+    prefix = provider.upper()
+    label = config.get("label", provider.capitalize())
+    scopes = config.get("scopes", [])
+    claims = config.get("claims", {})
 
-    return f'''
-# OAuth Provider configuration
-PROVIDER = "{provider}"
-AUTH_URL = "{auth_url}"
-TOKEN_URL = "{token_url}"
-USER_INFO_URL = "{user_info_url}"
-CLIENT_ID = "{client_id}"
-CLIENT_SECRET = "{client_secret}"
-REDIRECT_URI = "{redirect_uri}"
+    extras = ""
+    if config.get("issuer"):
+        extras += f'\n    issuer=os.getenv("{prefix}_OIDC_ISSUER", "{config["issuer"]}"),'
+    if config.get("emails_url"):
+        extras += f'\n    emails_url="{config["emails_url"]}",'
+    if config.get("auth_params"):
+        extras += f'\n    auth_params={config["auth_params"]!r},'
+
+    return f'''"""
+Provider OAuth {label}.
+Automatically generated by FastWizard 🧙‍♂️
+"""
+import os
+
+from app.domains.oauth.registry import OAuthProvider, register_provider
+
+provider = register_provider(OAuthProvider(
+    name="{provider}",
+    label="{label}",
+    client_id=os.getenv("{prefix}_CLIENT_ID", "{config.get('client_id', '')}"),
+    client_secret=os.getenv("{prefix}_CLIENT_SECRET", "{config.get('client_secret', '')}"),
+    redirect_uri=os.getenv("{prefix}_REDIRECT_URI", "{config.get('redirect_uri', '')}"),
+    auth_url="{config.get('auth_url', '')}",
+    token_url="{config.get('token_url', '')}",
+    userinfo_url="{config.get('user_info_url', '')}",
+    scopes={scopes!r},
+    claims={claims!r},{extras}
+))
 '''
@@ -0,0 +1,63 @@
+"""Template pour le registre des providers OAuth"""
+def get_template(config):
+    return '''"""
+Registre des providers OAuth.
+Automatically generated by FastWizard 🧙‍♂️
+
+Un provider n'est que de la configuration : URLs, scopes et correspondance des
+claims. Chaque fichier de `app/domains/oauth/providers/` enregistre le sien avec
+register_provider ; le client HTTP, le stockage du `state` et les routes sont
+communs à tous (voir services.py et routes.py).
+"""
+import importlib
+import pkgutil
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+@dataclass
+class OAuthProvider:
+    name: str
+    label: str
+    client_id: str
+    client_secret: str
+    redirect_uri: str
+    auth_url: str
+    token_url: str
+    userinfo_url: str
+    scopes: List[str] = field(default_factory=list)
+    # Claim du provider pour chaque champ utilisateur : subject, email, username
+    claims: Dict[str, str] = field(default_factory=lambda: {"subject": "sub", "email": "email", "username": "name"})
+    # Émetteur OpenID Connect : ID token vérifié localement (vide = OAuth2 simple)
+    issuer: str = ""
+    # Endpoint listant les emails vérifiés, appelé en parallèle du profil (GitHub)
+    emails_url: str = ""
+    # Paramètres supplémentaires de l'URL d'autorisation (prompt, access_type...)
+    auth_params: Dict[str, str] = field(default_factory=dict)
+
+
+PROVIDERS: Dict[str, OAuthProvider] = {}
+
+
+def register_provider(provider: OAuthProvider) -> OAuthProvider:
+    PROVIDERS[provider.name] = provider
+    return provider
+
+
+def get_provider(name: str) -> Optional[OAuthProvider]:
+    return PROVIDERS.get(name)
+
+
+def load_providers(package: str = "app.domains.oauth.providers"):
+    """Importe chaque module de `package` : chacun enregistre son provider."""
+    module = importlib.import_module(package)
+    for info in pkgutil.iter_modules(module.__path__):
+        importlib.import_module(f"{package}.{info.name}")
+
+
+load_providers()
+'''
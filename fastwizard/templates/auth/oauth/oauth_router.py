@@ -1,126 +1,84 @@
-"""Template pour le router OAuth multi-provider"""
+"""Template pour le router OAuth commun à tous les providers"""
 def get_template(config):
-    provider = config.get("provider", "")
-    return f'''
-from fastapi import APIRouter, HTTPException, Depends
+    return '''"""
+Routes OAuth, identiques pour chaque provider du registre.
+Automatically generated by FastWizard 🧙‍♂️
+"""
+import httpx
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from app.domains.auth.jwt_handler import create_token_pair
+
 from app.database import get_db
-from app.domains.oauth.{provider}.oauth_services import get_or_create_oauth_user
-from app.domains.auth.services import get_user_by_email
-import requests
-import httpx
+from app.domains.auth.jwt_handler import create_token_pair
 
-from .oauth_provider import PROVIDER, CLIENT_ID, CLIENT_SECRET, REDIRECT_URI, AUTH_URL, TOKEN_URL, USER_INFO_URL
+from .oidc import InvalidIdToken
+from .registry import PROVIDERS, OAuthProvider, get_provider
+from .services import (
+    consume_state,
+    get_access_token,
+    get_authorization_url,
+    get_or_create_oauth_user,
+    get_user_claims,
+    issue_state,
+    map_identity,
+)
 
 router = APIRouter()
 
-@router.get("/login")
-async def oauth_login():
-    """
-    Redirige l'utilisateur vers le provider OAuth pour se connecter.
-    """
-    scope = "openid email profile"
-    if PROVIDER.lower() == "github":
-        scope = "read:user user:email"
-
-    return {{
-        "auth_url": f"{{AUTH_URL}}?client_id={{CLIENT_ID}}&redirect_uri={{REDIRECT_URI}}&response_type=code&scope={{scope}}"
-    }}
 
-@router.get("/callback")
-async def oauth_callback(code: str, db: Session = Depends(get_db)):
-    """
-    Callback OAuth pour Google ou GitHub
-    """
-    token_data = {{}}
+def _provider_or_404(name: str) -> OAuthProvider:
+    provider = get_provider(name)
+    if provider is None:
+        raise HTTPException(status_code=404, detail="Unknown OAuth provider")
+    return provider
 
-    if PROVIDER.lower() == "google":
-        # Échange code → token
-        token_res = requests.post(
-            TOKEN_URL,
-            data={{
-                "code": code,
-                "client_id": CLIENT_ID,
-                "client_secret": CLIENT_SECRET,
-                "redirect_uri": REDIRECT_URI,
-                "grant_type": "authorization_code",
-            }},
-        )
-        token_data = token_res.json()
-        if "access_token" not in token_data:
-            raise HTTPException(status_code=400, detail="Invalid Google token")
 
-        # Récupération des infos utilisateur
-        user_info = requests.get(
-            USER_INFO_URL,
-            headers={{"Authorization": f"Bearer {{token_data['access_token']}}"}}
-        ).json()
-        email = user_info.get("email")
-        oauth_id = user_info.get("sub")
-        username = user_info.get("name")
-        if not email:
-            raise HTTPException(status_code=400, detail="Google email not available")
+@router.get("/providers")
+async def list_providers():
+    """Providers OAuth disponibles."""
+    return [{"name": p.name, "label": p.label} for p in PROVIDERS.values()]
 
-        user = get_user_by_email(db, email=email)
-        if not user:
-           user = await get_or_create_oauth_user(email=email, username=username, provider="google", oauth_id=oauth_id, db=db)
 
-    elif PROVIDER.lower() == "github":
-        # Échange code → token
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(
-                TOKEN_URL,
-                data={{
-                    "code": code,
-                    "client_id": CLIENT_ID,
-                    "client_secret": CLIENT_SECRET,
-                    "redirect_uri": REDIRECT_URI
-                }},
-                headers={{"Accept": "application/json"}}
-            )
-            resp.raise_for_status()
-            token_data = resp.json()
+@router.get("/{provider}/login")
+async def oauth_login(provider: str):
+    """
+    Redirige l'utilisateur vers le provider OAuth pour se connecter.
+    """
+    oauth_provider = _provider_or_404(provider)
+    state = await issue_state(oauth_provider)
+    return {"auth_url": await get_authorization_url(oauth_provider, state)}
 
-        access_token = token_data.get("access_token")
-        if not access_token:
-            raise HTTPException(status_code=400, detail="Invalid GitHub token")
 
-        # Récupération des infos utilisateur
-        async with httpx.AsyncClient() as client:
-            user_resp = await client.get(
-                USER_INFO_URL,
-                headers={{"Authorization": f"Bearer {{access_token}}" }}
-            )
-            user_resp.raise_for_status()
-            user_info = user_resp.json()
-            username = user_info.get("login")
-            github_id = str(user_info.get("id"))
+@router.get("/{provider}/callback")
+async def oauth_callback(provider: str, code: str, state: str, db: Session = Depends(get_db)):
+    """
+    Callback OAuth : vérifie le state, échange le code puis connecte l'utilisateur.
+    """
+    oauth_provider = _provider_or_404(provider)
+    label = oauth_provider.label
+    if not await consume_state(oauth_provider, state):
+        raise HTTPException(status_code=400, detail="Invalid or expired OAuth state")
 
-            # Récupération email principal
-            email_resp = await client.get(
-                "https://api.github.com/user/emails",
-                headers={{"Authorization": f"Bearer {{access_token}}" }}
-            )
-            email_resp.raise_for_status()
-            emails = email_resp.json()
-            email = next((e["email"] for e in emails if e.get("primary") and e.get("verified")), None)
-            if not email:
-                raise HTTPException(status_code=400, detail="GitHub email not available")
+    # Échange code → token, puis identité (ID token vérifié localement, ou userinfo)
+    try:
+        token_data = await get_access_token(oauth_provider, code)
+        if not token_data.get("access_token"):
+            raise HTTPException(status_code=400, detail=f"Invalid {label} token")
+        claims = await get_user_claims(oauth_provider, token_data)
+    except InvalidIdToken:
+        raise HTTPException(status_code=400, detail=f"Invalid {label} ID token")
+    except httpx.HTTPStatusError:
+        raise HTTPException(status_code=400, detail=f"Invalid {label} token")
+    except httpx.HTTPError:
+        raise HTTPException(status_code=502, detail=f"{label} unavailable")
 
-        # Création/utilisateur OAuth
-        user = await get_or_create_oauth_user(
-            email=email,
-            username=username,
-            provider="github",
-            oauth_id=github_id,
-            db=db
-        )
+    identity = map_identity(oauth_provider, claims)
+    if not identity.email:
+        raise HTTPException(status_code=400, detail=f"{label} email not available")
 
-    else:
-        raise HTTPException(status_code=400, detail="Unknown OAuth provider")
+    # Création/utilisateur OAuth
+    user = await get_or_create_oauth_user(identity, oauth_provider, db)
 
     # Génération tokens
-    tokens = create_token_pair(user_id=user.id, username=user.username)
-    return tokens
+    return create_token_pair(user_id=user.id, username=user.username)
 '''
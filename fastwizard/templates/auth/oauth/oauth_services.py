@@ -1,91 +1,208 @@
-"""Template pour le service OAuth multi-provider"""
+"""Template pour le service OAuth commun à tous les providers"""
 def get_template(config):
-    return f'''
+    return '''"""
+Moteur OAuth commun : un client HTTP, un stockage de state, tous les providers.
+Automatically generated by FastWizard 🧙‍♂️
+"""
+import asyncio
+import os
+import secrets
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional
+from urllib.parse import urlencode
+
 import httpx
+from fastapi import FastAPI
 from sqlalchemy.orm import Session
-from app.domains.auth.model import User
+
 from app.domains.auth.jwt_handler import get_password_hash
-from datetime import datetime
-import secrets
-from .oauth_provider import PROVIDER, AUTH_URL, TOKEN_URL, USER_INFO_URL, CLIENT_ID, CLIENT_SECRET, REDIRECT_URI
+from app.domains.auth.model import User
+from app.domains.auth.services import get_default_role_id
+
+from .oidc import OIDCProvider
+from .registry import PROVIDERS, OAuthProvider
+from .state import state_store
+
+HTTP_TIMEOUT = float(os.getenv("OAUTH_HTTP_TIMEOUT", "10"))
+
+# Un seul client (pool keep-alive, HTTP/2) pour tous les providers,
+# ouvert et fermé par `lifespan`
+_client: Optional[httpx.AsyncClient] = None
+_oidc: Dict[str, OIDCProvider] = {}
+
+
+def create_client(transport: Optional[httpx.AsyncBaseTransport] = None) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        headers={"Accept": "application/json"},
+        timeout=httpx.Timeout(HTTP_TIMEOUT, connect=5.0),
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30),
+        http2=True,
+        transport=transport,
+    )
+
 
-async def get_or_create_oauth_user(email: str, username: str, provider: str, oauth_id: str, db: Session):
-    """Trouve ou crée un utilisateur lié à OAuth (Google ou GitHub)"""
+def get_client() -> httpx.AsyncClient:
+    """Client partagé ; créé à la demande hors lifespan (scripts, tests)."""
+    global _client
+    if _client is None:
+        _client = create_client()
+    return _client
 
-    user = db.query(User).filter(User.email == email).first()
+
+def get_oidc(provider: OAuthProvider) -> Optional[OIDCProvider]:
+    """Découverte OIDC + JWKS en cache du provider, s'il déclare un émetteur."""
+    if not provider.issuer:
+        return None
+    if provider.name not in _oidc:
+        _oidc[provider.name] = OIDCProvider(provider.issuer, provider.client_id, get_client)
+    return _oidc[provider.name]
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """FastAPI lifespan context to open the OAuth HTTP client and preload OIDC metadata."""
+    get_client()
+    oidc_providers = [oidc for oidc in map(get_oidc, PROVIDERS.values()) if oidc is not None]
+    await asyncio.gather(*(oidc.start() for oidc in oidc_providers))
+    try:
+        yield
+    finally:
+        for oidc in oidc_providers:
+            await oidc.stop()
+        global _client
+        if _client is not None:
+            await _client.aclose()
+            _client = None
+
+
+async def _endpoint(provider: OAuthProvider, name: str, default: str) -> str:
+    oidc = get_oidc(provider)
+    return await oidc.endpoint(name, default) if oidc else default
+
+
+async def issue_state(provider: OAuthProvider) -> str:
+    state = secrets.token_urlsafe(32)
+    await state_store.put(state, {"provider": provider.name})
+    return state
+
+
+async def consume_state(provider: OAuthProvider, state: str) -> bool:
+    data = await state_store.pop(state)
+    return data is not None and data.get("provider") == provider.name
+
+
+async def get_authorization_url(provider: OAuthProvider, state: str) -> str:
+    """URL d'autorisation du provider (issue de la découverte OIDC si disponible)"""
+    params = {
+        "client_id": provider.client_id,
+        "redirect_uri": provider.redirect_uri,
+        "response_type": "code",
+        "scope": " ".join(provider.scopes),
+        "state": state,
+        **provider.auth_params,
+    }
+    return f"{await _endpoint(provider, 'authorization_endpoint', provider.auth_url)}?{urlencode(params)}"
+
+
+async def get_access_token(provider: OAuthProvider, code: str) -> dict:
+    """Échange le code OAuth contre un access token"""
+    resp = await get_client().post(
+        await _endpoint(provider, "token_endpoint", provider.token_url),
+        data={
+            "grant_type": "authorization_code",
+            "code": code,
+            "client_id": provider.client_id,
+            "client_secret": provider.client_secret,
+            "redirect_uri": provider.redirect_uri,
+        },
+    )
+    resp.raise_for_status()
+    return resp.json()
+
+
+async def get_user_info(provider: OAuthProvider, access_token: str) -> dict:
+    """Récupère les informations de l'utilisateur depuis le provider"""
+    client = get_client()
+    headers = {"Authorization": f"Bearer {access_token}"}
+    userinfo_url = await _endpoint(provider, "userinfo_endpoint", provider.userinfo_url)
+
+    if not provider.emails_url:
+        resp = await client.get(userinfo_url, headers=headers)
+        resp.raise_for_status()
+        return resp.json()
+
+    # Profil et emails en parallèle : une seule attente réseau au lieu de deux
+    resp, email_resp = await asyncio.gather(
+        client.get(userinfo_url, headers=headers),
+        client.get(provider.emails_url, headers=headers),
+    )
+    resp.raise_for_status()
+    email_resp.raise_for_status()
+    user_info = resp.json()
+    user_info[provider.claims["email"]] = next(
+        (e["email"] for e in email_resp.json() if e.get("primary") and e.get("verified")), None
+    )
+    return user_info
+
+
+async def get_user_claims(provider: OAuthProvider, token_data: dict) -> dict:
+    """Identité de l'utilisateur : ID token vérifié localement si disponible, sinon userinfo"""
+    oidc = get_oidc(provider)
+    id_token = token_data.get("id_token")
+    if oidc is not None and id_token:
+        claims = await oidc.verify_id_token(id_token, access_token=token_data.get("access_token"))
+        if not claims.get("email_verified", False):
+            claims.pop("email", None)
+        return claims
+    return await get_user_info(provider, token_data["access_token"])
+
+
+@dataclass
+class OAuthIdentity:
+    subject: str
+    email: Optional[str]
+    username: Optional[str]
+
+
+def map_identity(provider: OAuthProvider, claims: dict) -> OAuthIdentity:
+    """Applique la correspondance des claims déclarée par le provider."""
+    subject = claims.get(provider.claims["subject"])
+    return OAuthIdentity(
+        subject=str(subject) if subject is not None else "",
+        email=claims.get(provider.claims["email"]),
+        username=claims.get(provider.claims["username"]),
+    )
+
+
+async def get_or_create_oauth_user(identity: OAuthIdentity, provider: OAuthProvider, db: Session):
+    """Trouve ou crée un utilisateur lié à OAuth"""
+
+    user = db.query(User).filter(User.email == identity.email).first()
     if user:
         return user
 
-    random_password = secrets.token_hex(32)
-    user_kwargs = {{
-        "email": email,
+    username = identity.username or identity.email.split("@")[0]
+    if db.query(User.id).filter(User.username == username).first():
+        username = f"{username[:43]}_{secrets.token_hex(3)}"
+
+    user_kwargs = {
+        "email": identity.email,
         "username": username,
-        "hashed_password": get_password_hash(random_password),
+        "hashed_password": get_password_hash(secrets.token_hex(32)),
         "is_active": True,
-        "oauth_provider": provider,
-        "oauth_account_created_at": datetime.utcnow()
-    }}
-
-    if provider.lower() == "google":
-        user_kwargs["google_id"] = oauth_id
-    elif provider.lower() == "github":
-        user_kwargs["github_id"] = oauth_id
+        "role_id": get_default_role_id(db),
+        "oauth_provider": provider.name,
+        "oauth_account_created_at": datetime.utcnow(),
+    }
+    # Colonne d'identifiant propre au provider (google_id, github_id...)
+    if hasattr(User, f"{provider.name}_id"):
+        user_kwargs[f"{provider.name}_id"] = identity.subject
 
     new_user = User(**user_kwargs)
     db.add(new_user)
     db.commit()
     db.refresh(new_user)
     return new_user
-
-async def get_access_token(code: str) -> dict:
-    """Échange le code OAuth contre un access token"""
-    async with httpx.AsyncClient() as client:
-        resp = await client.post(
-            TOKEN_URL,
-            data={{
-                "grant_type": "authorization_code",
-                "code": code,
-                "client_id": CLIENT_ID,
-                "client_secret": CLIENT_SECRET,
-                "redirect_uri": REDIRECT_URI
-            }},
-            headers={{"Accept": "application/json"}}
-        )
-        resp.raise_for_status()
-        return resp.json()
-
-async def get_user_info(access_token: str) -> dict:
-    """Récupère les informations de l'utilisateur depuis le provider"""
-    async with httpx.AsyncClient() as client:
-        user_info = {{}}
-
-        if PROVIDER.lower() == "github":
-            # Infos de base
-            resp = await client.get(
-                "https://api.github.com/user",
-                headers={{"Authorization": f"Bearer {{access_token}}" }}
-            )
-            resp.raise_for_status()
-            user_info = resp.json()
-
-            # Emails
-            email_resp = await client.get(
-                "https://api.github.com/user/emails",
-                headers={{"Authorization": f"Bearer {{access_token}}" }}
-            )
-            email_resp.raise_for_status()
-            emails = email_resp.json()
-            primary_email = next((e["email"] for e in emails if e.get("primary") and e.get("verified")), None)
-            user_info["email"] = primary_email
-
-        else:
-            # Google ou autres providers
-            resp = await client.get(
-                USER_INFO_URL,
-                headers={{"Authorization": f"Bearer {{access_token}}" }}
-            )
-            resp.raise_for_status()
-            user_info = resp.json()
-
-    return user_info
 '''
@@ -0,0 +1,87 @@
+"""Template pour le stockage du paramètre state OAuth"""
+def get_template(config):
+    selected_modules = config.get("selected_modules", [])
+    if "cache-redis" in selected_modules:
+        cache_import, cache_getter, default_backend = "\nfrom app.core.cache import get_redis\n", "get_redis", "redis"
+    elif "cache-valkey" in selected_modules:
+        cache_import, cache_getter, default_backend = "\nfrom app.core.cache import get_valkey\n", "get_valkey", "redis"
+    else:
+        cache_import, cache_getter, default_backend = "", "", "memory"
+
+    if cache_getter:
+        redis_store = f'''
+
+class RedisStateStore(StateStore):
+    """Stockage partagé entre workers (cache de l'application), usage unique via GETDEL."""
+
+    async def put(self, state: str, data: Dict[str, Any]):
+        redis = await {cache_getter}()
+        await redis.set(f"oauth:state:{{state}}", json.dumps(data), ex=OAUTH_STATE_TTL)
+
+    async def pop(self, state: str) -> Optional[Dict[str, Any]]:
+        redis = await {cache_getter}()
+        raw = await redis.getdel(f"oauth:state:{{state}}")
+        return json.loads(raw) if raw else None
+'''
+        redis_branch = '''
+    if OAUTH_STATE_BACKEND == "redis":
+        return RedisStateStore()'''
+        json_import = "import json\n"
+    else:
+        redis_store = ""
+        redis_branch = ""
+        json_import = ""
+
+    return f'''"""
+Stockage du paramètre `state` OAuth (protection CSRF du callback).
+Automatically generated by FastWizard 🧙‍♂️
+
+Chaque `state` est émis par /login, expire après OAUTH_STATE_TTL secondes et
+ne peut être consommé qu'une fois par /callback. Le stockage mémoire ne
+convient qu'à un seul processus : avec plusieurs workers, utilisez le cache.
+"""
+{json_import}import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+{cache_import}
+OAUTH_STATE_BACKEND = os.getenv("OAUTH_STATE_BACKEND", "{default_backend}")
+OAUTH_STATE_TTL = int(os.getenv("OAUTH_STATE_TTL", "600"))
+OAUTH_STATE_MAX = int(os.getenv("OAUTH_STATE_MAX", "10000"))
+
+
+class StateStore:
+    async def put(self, state: str, data: Dict[str, Any]):
+        raise NotImplementedError
+
+    async def pop(self, state: str) -> Optional[Dict[str, Any]]:
+        """Retourne les données associées au state et l'invalide (usage unique)."""
+        raise NotImplementedError
+
+
+class MemoryStateStore(StateStore):
+    def __init__(self, ttl: int = OAUTH_STATE_TTL, maxsize: int = OAUTH_STATE_MAX):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._states: "OrderedDict[str, tuple]" = OrderedDict()
+
+    async def put(self, state: str, data: Dict[str, Any]):
+        now = time.monotonic()
+        # Les entrées sont triées par date d'émission : on purge par la tête
+        while self._states and (len(self._states) >= self.maxsize or next(iter(self._states.values()))[0] <= now):
+            self._states.popitem(last=False)
+        self._states[state] = (now + self.ttl, data)
+
+    async def pop(self, state: str) -> Optional[Dict[str, Any]]:
+        entry = self._states.pop(state, None)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+{redis_store}
+
+def create_state_store() -> StateStore:{redis_branch}
+    return MemoryStateStore()
+
+
+state_store = create_state_store()
+'''
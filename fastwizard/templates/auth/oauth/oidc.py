@@ -0,0 +1,150 @@
+"""Template pour la découverte OIDC et le cache JWKS"""
+def get_template(config):
+    return '''"""
+Découverte OpenID Connect et vérification locale des ID tokens.
+Automatically generated by FastWizard 🧙‍♂️
+
+Le document de découverte et le JWKS du provider sont chargés une fois,
+gardés en cache (durée : Cache-Control max-age du JWKS, sinon OIDC_CACHE_TTL)
+et rafraîchis en tâche de fond avant expiration. Un ID token est vérifié
+localement (signature, iss, aud, exp, at_hash) : la connexion ne coûte
+qu'un aller-retour réseau (échange du code), sans appel à userinfo.
+"""
+import asyncio
+import logging
+import os
+import re
+import time
+from contextlib import suppress
+from typing import Callable, Dict, Optional
+
+import httpx
+from jose import jwk, jwt
+from jose.exceptions import JOSEError
+
+OIDC_CACHE_TTL = float(os.getenv("OIDC_CACHE_TTL", "3600"))
+# Rechargement anticipé du JWKS pour un `kid` inconnu (rotation des clés), au plus une fois par intervalle
+OIDC_MIN_REFRESH_INTERVAL = float(os.getenv("OIDC_MIN_REFRESH_INTERVAL", "60"))
+OIDC_ALGORITHMS = ["RS256", "RS384", "RS512", "ES256", "ES384", "ES512"]
+
+logger = logging.getLogger(__name__)
+_MAX_AGE = re.compile(r"max-age=(\\d+)")
+
+
+class InvalidIdToken(Exception):
+    """ID token refusé (signature, émetteur, audience ou expiration invalide)."""
+
+
+class OIDCProvider:
+    def __init__(self, issuer: str, client_id: str, http: Callable[[], httpx.AsyncClient]):
+        self.issuer = issuer.rstrip("/")
+        self.client_id = client_id
+        self.http = http
+        self.discovery: Dict = {}
+        self.keys: Dict[str, object] = {}
+        self.expires_at = 0.0
+        self.loaded_at = 0.0
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @property
+    def issuers(self):
+        # Google émet aussi bien "https://accounts.google.com" que "accounts.google.com"
+        issuer = self.discovery.get("issuer", self.issuer)
+        return {issuer, issuer.split("://", 1)[-1]}
+
+    async def load(self, force: bool = False):
+        """Charge (ou recharge) le document de découverte et le JWKS."""
+        async with self._lock:
+            if not force and self.keys and time.monotonic() < self.expires_at:
+                return
+            client = self.http()
+            resp = await client.get(f"{self.issuer}/.well-known/openid-configuration")
+            resp.raise_for_status()
+            discovery = resp.json()
+            jwks_resp = await client.get(discovery["jwks_uri"])
+            jwks_resp.raise_for_status()
+
+            keys = {}
+            for key in jwks_resp.json().get("keys", []):
+                alg = key.get("alg") or ("RS256" if key.get("kty") == "RSA" else "ES256")
+                if key.get("use", "sig") != "sig" or alg not in OIDC_ALGORITHMS:
+                    continue
+                # Clé construite une seule fois, réutilisée pour chaque vérification
+                keys[key.get("kid", "")] = jwk.construct(key, algorithm=alg)
+
+            match = _MAX_AGE.search(jwks_resp.headers.get("cache-control", ""))
+            ttl = float(match.group(1)) if match else OIDC_CACHE_TTL
+            self.discovery = discovery
+            self.keys = keys
+            self.loaded_at = time.monotonic()
+            self.expires_at = self.loaded_at + ttl
+            logger.info("OIDC metadata loaded from %s (%d keys, ttl %.0fs)", self.issuer, len(keys), ttl)
+
+    async def start(self):
+        """Préchargement au démarrage (non bloquant en cas d'échec) et rafraîchissement de fond."""
+        try:
+            await self.load()
+        except (httpx.HTTPError, KeyError, ValueError) as exc:
+            logger.warning("OIDC discovery failed for %s: %s", self.issuer, exc)
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._refresh_task
+            self._refresh_task = None
+
+    async def _refresh_loop(self):
+        while True:
+            # Rafraîchit à 90 % de la durée de vie ; réessaie vite si le cache est vide ou périmé
+            delay = (self.expires_at - time.monotonic()) * 0.9 if self.keys else 0
+            await asyncio.sleep(max(delay, OIDC_MIN_REFRESH_INTERVAL))
+            try:
+                await self.load(force=True)
+            except Exception as exc:
+                # On garde les clés en cache tant que le provider est injoignable
+                logger.warning("OIDC refresh failed for %s: %s", self.issuer, exc)
+
+    async def endpoint(self, name: str, default: str) -> str:
+        """URL issue de la découverte (authorization_endpoint, token_endpoint...)."""
+        if not self.discovery:
+            with suppress(httpx.HTTPError, KeyError, ValueError):
+                await self.load()
+        return self.discovery.get(name, default)
+
+    async def _key(self, kid: str):
+        if not self.keys or time.monotonic() >= self.expires_at:
+            await self.load()
+        key = self.keys.get(kid)
+        if key is None and time.monotonic() - self.loaded_at >= OIDC_MIN_REFRESH_INTERVAL:
+            # kid inconnu : le provider a probablement fait tourner ses clés
+            await self.load(force=True)
+            key = self.keys.get(kid)
+        return key
+
+    async def verify_id_token(self, id_token: str, access_token: Optional[str] = None) -> Dict:
+        """Vérifie localement un ID token et renvoie ses claims."""
+        try:
+            header = jwt.get_unverified_header(id_token)
+        except JOSEError as exc:
+            raise InvalidIdToken(str(exc)) from exc
+        if header.get("alg") not in OIDC_ALGORITHMS:
+            raise InvalidIdToken(f"Unsupported algorithm: {header.get('alg')}")
+        key = await self._key(header.get("kid", ""))
+        if key is None:
+            raise InvalidIdToken("Unknown signing key")
+        try:
+            return jwt.decode(
+                id_token,
+                key,
+                algorithms=[header["alg"]],
+                audience=self.client_id,
+                issuer=self.issuers,
+                access_token=access_token,
+            )
+        except JOSEError as exc:
+            raise InvalidIdToken(str(exc)) from exc
+'''
@@ -0,0 +1,205 @@
+"""Template pour la compression des réponses HTTP"""
+def get_template(config):
+    return '''"""
+Compression des réponses HTTP (zstd, Brotli, gzip) selon l'en-tête Accept-Encoding.
+Automatically generated by FastWizard 🧙‍♂️
+
+L'encodage retenu est le premier de COMPRESSION_ENCODINGS accepté par le client (et dont la
+bibliothèque est installée). Une réponse est envoyée telle quelle si :
+- ce n'est pas une requête HTTP (WebSocket, lifespan) ou c'est une requête HEAD ;
+- elle est déjà encodée (Content-Encoding), partielle (206) ou marquée `no-transform` ;
+- son type n'est pas dans COMPRESSION_CONTENT_TYPES ;
+- elle est en streaming (StreamingResponse, gros fichiers) : le corps n'est pas connu d'avance ;
+- son corps fait moins de COMPRESSION_MINIMUM_SIZE octets (le gain ne paie pas le CPU).
+
+Les corps de plus de COMPRESSION_THREADPOOL_SIZE octets sont compressés dans un thread pour
+ne pas bloquer la boucle asyncio. Mesurez le compromis débit / CPU avec
+`python benchmarks/compression.py`.
+"""
+import gzip
+import threading
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+
+from fastapi import FastAPI
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import brotli
+except ImportError:  # Brotli facultatif : ignoré s'il n'est pas installé
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # zstd facultatif : ignoré s'il n'est pas installé
+    zstandard = None
+
+
+class CompressionSettings(BaseSettings):
+    # Ordre de préférence du serveur, parmi zstd, br et gzip
+    COMPRESSION_ENCODINGS: List[str] = ["zstd", "br", "gzip"]
+    # En dessous (octets), la réponse tient dans un paquet : compresser coûte plus que ça ne rapporte
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    # Types compressés (préfixes) ; les images, vidéos et archives le sont déjà
+    COMPRESSION_CONTENT_TYPES: List[str] = [
+        "application/json",
+        "application/problem+json",
+        "application/javascript",
+        "application/xml",
+        "image/svg+xml",
+        "text/",
+    ]
+    # Préfixes de chemins jamais compressés
+    COMPRESSION_EXCLUDE_PATHS: List[str] = []
+    # Niveaux : compromis rapide pour du contenu dynamique (max : gzip 9, br 11, zstd 22)
+    COMPRESSION_GZIP_LEVEL: int = Field(default=6, ge=1, le=9)
+    COMPRESSION_BROTLI_QUALITY: int = Field(default=4, ge=0, le=11)
+    COMPRESSION_ZSTD_LEVEL: int = Field(default=3, ge=1, le=22)
+    # Au-delà (octets), compression dans un thread plutôt que dans la boucle asyncio
+    COMPRESSION_THREADPOOL_SIZE: int = 256 * 1024
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+
+settings = CompressionSettings()
+
+
+def create_compressors(settings: CompressionSettings) -> Dict[str, Callable[[bytes], bytes]]:
+    """Compresseurs disponibles, dans l'ordre de préférence du serveur."""
+    available: Dict[str, Callable[[bytes], bytes]] = {}
+    for encoding in settings.COMPRESSION_ENCODINGS:
+        if encoding == "zstd" and zstandard is not None:
+            local = threading.local()  # un ZstdCompressor ne doit pas servir à deux threads à la fois
+            level = settings.COMPRESSION_ZSTD_LEVEL
+
+            def compress_zstd(body: bytes, local=local, level=level) -> bytes:
+                compressor = getattr(local, "compressor", None)
+                if compressor is None:
+                    compressor = local.compressor = zstandard.ZstdCompressor(level=level)
+                return compressor.compress(body)
+
+            available["zstd"] = compress_zstd
+        elif encoding == "br" and brotli is not None:
+            quality = settings.COMPRESSION_BROTLI_QUALITY
+            available["br"] = lambda body, quality=quality: brotli.compress(body, mode=brotli.MODE_TEXT, quality=quality)
+        elif encoding == "gzip":
+            level = settings.COMPRESSION_GZIP_LEVEL
+            # mtime=0 : sortie reproductible, sans horodatage dans l'en-tête gzip
+            available["gzip"] = lambda body, level=level: gzip.compress(body, compresslevel=level, mtime=0)
+    return available
+
+
+@lru_cache(maxsize=256)
+def negotiate(accept_encoding: str, preferences: Tuple[str, ...]) -> Optional[str]:
+    """Premier encodage du serveur accepté par le client (valeurs d'en-tête peu variées : mis en cache)."""
+    accepted: Dict[str, float] = {}
+    for item in accept_encoding.lower().split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip()] = quality
+    wildcard = accepted.get("*", 0.0)
+    for encoding in preferences:
+        if accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+
+class CompressionMiddleware:
+    """Middleware ASGI : compresse les réponses complètes, laisse passer le reste sans copie."""
+
+    def __init__(self, app, settings: CompressionSettings = settings):
+        self.app = app
+        self.compressors = create_compressors(settings)
+        self.preferences = tuple(self.compressors)
+        self.minimum_size = settings.COMPRESSION_MINIMUM_SIZE
+        self.content_types = tuple(settings.COMPRESSION_CONTENT_TYPES)
+        self.exclude_paths = tuple(settings.COMPRESSION_EXCLUDE_PATHS)
+        self.threadpool_size = settings.COMPRESSION_THREADPOOL_SIZE
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] == "HEAD"
+            or (self.exclude_paths and scope["path"].startswith(self.exclude_paths))
+        ):
+            await self.app(scope, receive, send)
+            return
+        accept_encoding = Headers(scope=scope).get("accept-encoding")
+        encoding = negotiate(accept_encoding, self.preferences) if accept_encoding else None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[dict] = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                if self._compressible(message):
+                    start_message = message  # retenu jusqu'au corps : les en-têtes vont changer
+                else:
+                    passthrough = True
+                    await send(message)
+                return
+            if message["type"] != "http.response.body" or start_message is None:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            if message.get("more_body", False) or len(body) < self.minimum_size:
+                # Streaming (corps en plusieurs morceaux) ou trop petit : envoyé tel quel
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            compress = self.compressors[encoding]
+            if len(body) >= self.threadpool_size:
+                compressed = await run_in_threadpool(compress, body)
+            else:
+                compressed = compress(body)
+            headers = MutableHeaders(scope=start_message)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                headers["ETag"] = "W/" + etag  # représentation différente : l'ETag fort ne vaut plus
+            await send(start_message)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_compressed)
+
+    def _compressible(self, message) -> bool:
+        status = message["status"]
+        if status < 200 or status in (204, 206, 304):
+            return False
+        headers = MutableHeaders(scope=message)
+        if "content-encoding" in headers or "no-transform" in headers.get("cache-control", ""):
+            return False
+        if not headers.get("content-type", "").startswith(self.content_types):
+            return False
+        # La réponse varie selon Accept-Encoding, même quand elle n'est finalement pas compressée
+        headers.add_vary_header("Accept-Encoding")
+        return True
+
+
+def setup_compression(app: FastAPI):
+    app.add_middleware(CompressionMiddleware)
+'''
@@ -0,0 +1,183 @@
+"""Template pour le benchmark de la compression des réponses"""
+def get_template(config):
+    return '''"""
+Compression des réponses : octets économisés contre temps CPU (app/core/compression.py).
+Automatically generated by FastWizard 🧙‍♂️
+
+1. Pour des listes CRUD de 10, 100 et 1000 objets (ou une réponse réelle, --payload),
+   compresse le JSON avec chaque encodage et plusieurs niveaux : taille, temps de compression
+   et gain net = temps de transfert économisé au débit --bandwidth moins le temps CPU.
+2. Appelle directement l'application ASGI (sans réseau) avec et sans CompressionMiddleware,
+   réglé comme l'application (.env), pour chaque Accept-Encoding.
+
+Un gain net négatif signifie que la compression ralentit la réponse à ce débit (réseau local
+rapide, par exemple) : augmentez COMPRESSION_MINIMUM_SIZE ou baissez le niveau.
+
+Usage :
+    python benchmarks/compression.py --bandwidth 50
+    curl -s localhost:8000/api/v1/shop/items/ > items.json && python benchmarks/compression.py --payload items.json
+"""
+import argparse
+import asyncio
+import gzip
+import json
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from app.core.compression import CompressionMiddleware, brotli, settings, zstandard  # noqa: E402
+
+WORDS = (
+    "alpha bravo charlie delta echo foxtrot golf hotel india juliet kilo lima mike november "
+    "oscar papa quebec romeo sierra tango uniform victor whiskey xray yankee zulu"
+).split()
+
+
+def crud_rows(count: int, seed: int = 42) -> list:
+    """Liste proche d'une réponse GET /<entité>s/ : champs répétés, valeurs variées."""
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    return [
+        {
+            "id": i + 1,
+            "name": f"{rng.choice(WORDS)} {rng.choice(WORDS)} {rng.randint(1, 9999)}",
+            "description": " ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 20))),
+            "price": round(rng.uniform(1, 500), 2),
+            "quantity": rng.randint(0, 1000),
+            "is_active": rng.random() < 0.8,
+            "created_at": (start + timedelta(seconds=rng.randint(0, 10**7))).isoformat(),
+        }
+        for i in range(count)
+    ]
+
+
+def codecs() -> list:
+    """(encodage, niveau, fonction) ; niveaux bas, par défaut et maximum."""
+    result = [("gzip", level, lambda body, level=level: gzip.compress(body, compresslevel=level, mtime=0)) for level in (1, 6, 9)]
+    if brotli is not None:
+        result += [
+            ("br", quality, lambda body, quality=quality: brotli.compress(body, mode=brotli.MODE_TEXT, quality=quality))
+            for quality in (1, 4, 11)
+        ]
+    if zstandard is not None:
+        result += [("zstd", level, zstandard.ZstdCompressor(level=level).compress) for level in (1, 3, 19)]
+    return result
+
+
+def timed(fn, body: bytes, budget: float = 0.2) -> float:
+    """Durée moyenne (s) d'un appel, répété pendant environ `budget` secondes."""
+    fn(body)  # échauffement
+    runs, start = 0, time.perf_counter()
+    while True:
+        fn(body)
+        runs += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= budget:
+            return elapsed / runs
+
+
+def codec_table(label: str, body: bytes, bandwidth_mbps: float):
+    transfer_ms = len(body) * 8 / (bandwidth_mbps * 1e6) * 1000
+    print(f"\\n{label} : {len(body)} octets, {transfer_ms:.2f} ms de transfert à {bandwidth_mbps:g} Mbit/s")
+    print(f"{'encodage':<10} {'niveau':>6} {'octets':>9} {'ratio':>7} {'CPU µs':>10} {'Mo/s':>8} {'gain net ms':>12}")
+    for encoding, level, compress in codecs():
+        compressed = compress(body)
+        duration = timed(compress, body)
+        saved_ms = (len(body) - len(compressed)) * 8 / (bandwidth_mbps * 1e6) * 1000
+        print(
+            f"{encoding:<10} {level:>6} {len(compressed):>9} {len(compressed) / len(body):>7.1%} "
+            f"{duration * 1e6:>10.1f} {len(body) / duration / 1e6:>8.1f} {saved_ms - duration * 1000:>+12.3f}"
+        )
+
+
+def build_app(body: bytes, with_compression: bool):
+    from fastapi import FastAPI, Response
+
+    app = FastAPI()
+
+    @app.get("/items")
+    async def read_items():
+        return Response(body, media_type="application/json")
+
+    if with_compression:
+        app.add_middleware(CompressionMiddleware)
+    return app
+
+
+async def per_request(app, accept_encoding: str, requests: int):
+    """Durée moyenne (µs) d'un appel ASGI complet et taille du corps envoyé."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/items",
+        "raw_path": b"/items",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench"), (b"accept-encoding", accept_encoding.encode())],
+        "client": ("127.0.0.1", 50000),
+        "server": ("127.0.0.1", 8000),
+    }
+    sent = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal sent
+        if message["type"] == "http.response.body":
+            sent += len(message.get("body", b""))
+
+    for _ in range(20):  # échauffement (construction de la pile de middlewares)
+        await app(dict(scope), receive, send)
+    sent = 0
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - start) / requests * 1e6, sent // requests
+
+
+def middleware_table(body: bytes, requests: int):
+    print(
+        f"\\nMiddleware ({len(body)} octets, minimum {settings.COMPRESSION_MINIMUM_SIZE}, "
+        f"gzip {settings.COMPRESSION_GZIP_LEVEL}, br {settings.COMPRESSION_BROTLI_QUALITY}, "
+        f"zstd {settings.COMPRESSION_ZSTD_LEVEL}) : µs par requête"
+    )
+    print(f"{'Accept-Encoding':<18} {'sans':>9} {'avec':>9} {'surcoût':>9} {'octets':>9}")
+    plain, compressed = build_app(body, False), build_app(body, True)
+    for accept_encoding in ("identity", "gzip", "br", "zstd", "zstd, br, gzip"):
+        without, _ = asyncio.run(per_request(plain, accept_encoding, requests))
+        with_, size = asyncio.run(per_request(compressed, accept_encoding, requests))
+        print(f"{accept_encoding:<18} {without:>9.1f} {with_:>9.1f} {with_ - without:>+9.1f} {size:>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Octets économisés contre CPU de la compression")
+    parser.add_argument("--items", type=int, nargs="+", default=[10, 100, 1000], help="objets par liste")
+    parser.add_argument("--payload", type=Path, help="réponse JSON réelle à compresser à la place")
+    parser.add_argument("--bandwidth", type=float, default=100, help="débit du client en Mbit/s")
+    parser.add_argument("--requests", type=int, default=500, help="appels ASGI par mesure du middleware")
+    args = parser.parse_args()
+
+    if brotli is None or zstandard is None:
+        print("⚠️ brotli ou zstandard non installé : encodage ignoré")
+    if args.payload:
+        bodies = {args.payload.name: args.payload.read_bytes()}
+    else:
+        bodies = {f"{count} objets": json.dumps(crud_rows(count), separators=(",", ":")).encode() for count in args.items}
+
+    for label, body in bodies.items():
+        codec_table(label, body, args.bandwidth)
+    middleware_table(list(bodies.values())[-1], args.requests)
+
+
+if __name__ == "__main__":
+    main()
+'''
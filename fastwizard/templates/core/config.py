@@ -2,6 +2,26 @@
 
 def get_template(config):
     app_name = config.get("app_name", "Mon Projet FastAPI")
+    selected_modules = config.get("selected_modules", [])
+
+    typing_imports = "List"
+    pydantic_import = ""
+    tracing_settings = ""
+    if "otel" in selected_modules:
+        tracing_settings = '''
+    # --- Traces OpenTelemetry (app/core/tracing.py) ---
+    # Désactivé par défaut : à activer avec un exporteur adapté (otlp en production)
+    TRACING_ENABLED: bool = False
+    # otlp (collecteur) | file (JSON lines, hors ligne) | console | none
+    TRACING_EXPORTER: Literal["otlp", "file", "console", "none"] = "file"
+    TRACING_OTLP_ENDPOINT: str = "http://localhost:4318/v1/traces"
+    TRACING_FILE: str = "logs/traces.jsonl"
+    # Part des traces conservées (0.0 à 1.0) ; une requête dont l'appelant a déjà décidé suit sa décision
+    TRACING_SAMPLE_RATIO: float = Field(default=1.0, ge=0.0, le=1.0)
+    TRACING_EXCLUDED_URLS: List[str] = ["/health", "/metrics"]
+'''
+        typing_imports = "List, Literal"
+        pydantic_import = "from pydantic import Field\n"
 
     return f'''"""
 Configuration centralisée de l'application FastAPI
@@ -9,8 +29,8 @@ Toutes les valeurs proviennent du fichier .env ou de valeurs par défaut.
 """
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from functools import lru_cache
-from typing import List
-
+from typing import {typing_imports}
+{pydantic_import}
 class Settings(BaseSettings):
     # --- Application ---
     APP_NAME: str = "{app_name}"
@@ -54,12 +74,14 @@ class Settings(BaseSettings):
 
     # --- Base de données ---
     DATABASE_URL: str | None = None
-
+{tracing_settings}
     # --- Configuration du modèle ---
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
-        case_sensitive=False
+        case_sensitive=False,
+        # .env est partagé avec les réglages des modules (LOG_*, LAZY_ROUTERS, ...)
+        extra="ignore"
     )
 
 @lru_cache()
@@ -1,14 +1,33 @@
 """Template de logging de base."""
 def get_template(config):
     return """# app/core/logging.py
+import atexit
+import copy
 import logging
+import queue
+import random
 import sys
+import time
+from datetime import datetime, timezone
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
-from pydantic_settings import BaseSettings
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from rich.logging import RichHandler
 from rich.console import Console
-from typing import Literal
+from typing import Dict, List, Literal, Optional, Tuple
+
+from app.core.request_context import RequestContextFilter
+
+try:
+    import orjson
+
+    def _dumps(data: dict) -> str:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:  # orjson est optionnel : repli sur la bibliothèque standard
+    import json
+
+    def _dumps(data: dict) -> str:
+        return json.dumps(data, ensure_ascii=False, default=str)
 
 
 class LoggingSettings(BaseSettings):
@@ -17,26 +36,204 @@ class LoggingSettings(BaseSettings):
     LOG_FILE: str = "logs/app.log"
     LOG_MAX_BYTES: int = 10_000_000  # 10 MB
     LOG_BACKUP_COUNT: int = 5
+    # File entre l'application et le thread d'écriture (0 = illimitée)
+    LOG_QUEUE_SIZE: int = 10_000
+    # File pleine : "newest" jette le nouveau record, "oldest" le plus ancien en attente
+    LOG_QUEUE_DROP: Literal["newest", "oldest"] = "newest"
+
+    # --- Access log (émis par RequestContextMiddleware, avec la latence) ---
+    LOG_ACCESS_LOG: bool = True
+    # Chemins jamais journalisés, sauf erreur ou lenteur (health checks, sondes)
+    LOG_ACCESS_SUPPRESS_PATHS: List[str] = ["/health"]
+    # Fraction des requêtes journalisées (0.1 = une sur dix en moyenne)
+    LOG_ACCESS_SAMPLE_RATE: float = 1.0
+    # Au plus N lignes par route et par seconde (0 = illimité)
+    LOG_ACCESS_RATE_LIMIT: int = 0
+    # Niveau par gabarit complet de route, ex. {"/api/v1/items/{item_id}": "DEBUG"}
+    LOG_ACCESS_ROUTE_LEVELS: Dict[str, str] = {}
+    # Toujours journalisées : réponses >= ce statut (ERROR) et requêtes plus lentes (WARNING)
+    LOG_ACCESS_ERROR_STATUS: int = 500
+    LOG_ACCESS_SLOW_MS: float = 1000
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+
+class DroppingQueueHandler(QueueHandler):
+    \"\"\"QueueHandler non bloquant : une file pleine perd des records au lieu de ralentir les requêtes.\"\"\"
+
+    def __init__(self, log_queue: queue.Queue, drop: str = "newest"):
+        super().__init__(log_queue)
+        self.drop = drop
+        self.dropped = 0
+        self._unreported = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Seul le message est résolu ici (les args peuvent changer ensuite) ; le formatage
+        # et exc_info sont laissés au thread d'écriture (tracebacks Rich)
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if self.drop == "oldest":
+                try:
+                    self.queue.get_nowait()
+                    self.queue.put_nowait(record)
+                except (queue.Empty, queue.Full):
+                    pass
+            self.dropped += 1
+            self._unreported += 1
+            return
+        if self._unreported:
+            # Signale les pertes dès que la file a de nouveau de la place
+            lost, self._unreported = self._unreported, 0
+            warning = logging.makeLogRecord({
+                "name": __name__,
+                "levelno": logging.WARNING,
+                "levelname": "WARNING",
+                "msg": f"{lost} log records dropped (queue full, LOG_QUEUE_SIZE={self.queue.maxsize})",
+            })
+            try:
+                self.queue.put_nowait(warning)
+            except queue.Full:
+                self._unreported += lost
+
+
+# Attributs standard d'un LogRecord : tout le reste vient de `extra=` et est exporté tel quel
+_RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime", "taskName"}
+_CONTEXT_ATTRS = ("request_id", "user_id", "method", "route")
+
+
+class JsonFormatter(logging.Formatter):
+    \"\"\"Une ligne JSON par record : champs fixes, contexte de requête et champs `extra`.\"\"\"
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key in _CONTEXT_ATTRS:
+            value = getattr(record, key, None)
+            if value is not None:
+                data[key] = value
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and key not in data and key not in _CONTEXT_ATTRS:
+                data[key] = value
+        if record.exc_info:
+            data["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            data["exc"] = record.exc_text
+        if record.stack_info:
+            data["stack"] = self.formatStack(record.stack_info)
+        return _dumps(data)
+
+
+class AccessLogSampler:
+    \"\"\"Décide si une requête terminée est journalisée, et à quel niveau.
+
+    Erreurs et requêtes lentes passent toujours ; les autres sont filtrées par chemin,
+    par niveau de route, par échantillonnage aléatoire puis par débit maximal par route.
+    Le nombre de lignes écartées depuis la dernière ligne de la route est renvoyé avec
+    la décision (champ `suppressed`). Appelé uniquement depuis la boucle asyncio.
+    \"\"\"
+
+    MAX_ROUTES = 1024
 
-    class Config:
-        env_prefix = "LOG_"
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+    def __init__(self, settings: LoggingSettings):
+        self.suppress_paths = frozenset(settings.LOG_ACCESS_SUPPRESS_PATHS)
+        self.sample_rate = settings.LOG_ACCESS_SAMPLE_RATE
+        self.rate_limit = settings.LOG_ACCESS_RATE_LIMIT
+        self.route_levels = {
+            route: logging.getLevelName(level.upper()) for route, level in settings.LOG_ACCESS_ROUTE_LEVELS.items()
+        }
+        self.error_status = settings.LOG_ACCESS_ERROR_STATUS
+        self.slow_ms = settings.LOG_ACCESS_SLOW_MS
+        self.logger = logging.getLogger("app.access")
+        # route -> [début de la fenêtre d'une seconde, lignes émises, lignes écartées]
+        self._routes: Dict[str, list] = {}
+
+    def _stats(self, route: str) -> list:
+        stats = self._routes.get(route)
+        if stats is None:
+            if len(self._routes) >= self.MAX_ROUTES:
+                self._routes.clear()  # chemins bruts (404) en nombre arbitraire : table bornée
+            stats = self._routes[route] = [time.monotonic(), 0, 0]
+        return stats
+
+    def decide(self, route: str, path: str, status: int, duration_ms: float) -> Optional[Tuple[int, int]]:
+        \"\"\"Retourne (niveau, lignes écartées) ou None si la requête n'est pas journalisée.\"\"\"
+        stats = self._stats(route)
+        if status >= self.error_status:
+            level = logging.ERROR
+        elif duration_ms >= self.slow_ms:
+            level = logging.WARNING
+        else:
+            level = self.route_levels.get(route, logging.INFO)
+            if (
+                path in self.suppress_paths
+                or not self.logger.isEnabledFor(level)
+                or (self.sample_rate < 1.0 and random.random() >= self.sample_rate)
+            ):
+                stats[2] += 1
+                return None
+            if self.rate_limit:
+                now = time.monotonic()
+                if now - stats[0] >= 1.0:
+                    stats[0], stats[1] = now, 0
+                if stats[1] >= self.rate_limit:
+                    stats[2] += 1
+                    return None
+        stats[1] += 1
+        suppressed, stats[2] = stats[2], 0
+        return level, suppressed
+
+
+def create_access_sampler() -> Optional[AccessLogSampler]:
+    settings = LoggingSettings()
+    return AccessLogSampler(settings) if settings.LOG_ACCESS_LOG else None
+
+
+_listener: Optional[QueueListener] = None
+
+
+def stop_logging():
+    \"\"\"Vide la file et arrête le thread d'écriture (appelé à l'arrêt de l'application).\"\"\"
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
 
 
 def setup_logging():
+    global _listener
     settings = LoggingSettings()
     log_level = settings.LOG_LEVEL.upper()
 
+    # --- Un seul thread d'écriture, même si setup_logging est rappelé (reload) ---
+    stop_logging()
+
     # --- Crée le dossier de log si nécessaire ---
     log_path = Path(settings.LOG_FILE)
     log_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # --- File handler avec rotation ---
-    file_formatter = logging.Formatter(
-        "[%(asctime)s] [%(levelname)s] %(name)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    # --- File handler avec rotation (JSON aussi sur disque si LOG_FORMAT=json) ---
+    if settings.LOG_FORMAT == "json":
+        file_formatter = JsonFormatter()
+    else:
+        file_formatter = logging.Formatter(
+            "[%(asctime)s] [%(levelname)s] %(name)s - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
     file_handler = RotatingFileHandler(
         settings.LOG_FILE,
         maxBytes=settings.LOG_MAX_BYTES,
@@ -48,9 +245,7 @@ def setup_logging():
 
     # --- Stream handler pour la console ---
     if settings.LOG_FORMAT == "json":
-        stream_formatter = logging.Formatter(
-            '{"time": "%(asctime)s", "level": "%(levelname)s", "logger": "%(name)s", "msg": "%(message)s"}'
-        )
+        stream_formatter = JsonFormatter()
         stream_handler = logging.StreamHandler(sys.stdout)
         stream_handler.setLevel(log_level)
         stream_handler.setFormatter(stream_formatter)
@@ -76,20 +271,36 @@ def setup_logging():
         )
         stream_handler.setLevel(log_level)
 
+    # --- File bornée + thread d'écriture : aucune I/O disque ou terminal dans la boucle asyncio ---
+    log_queue: queue.Queue = queue.Queue(maxsize=settings.LOG_QUEUE_SIZE)
+    queue_handler = DroppingQueueHandler(log_queue, drop=settings.LOG_QUEUE_DROP)
+    # Le contexte de requête (contextvars) est lu dans le thread appelant, avant la file
+    queue_handler.addFilter(RequestContextFilter())
+    _listener = QueueListener(log_queue, stream_handler, file_handler, respect_handler_level=True)
+    _listener.start()
+
     # --- Configure le root logger ---
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
-    root_logger.handlers = [stream_handler, file_handler]
+    root_logger.handlers = [queue_handler]
     root_logger.propagate = True
 
     # --- Réduction du bruit SQLAlchemy ---
     logging.getLogger("sqlalchemy").setLevel(logging.WARNING)
 
-    # --- Remplace les logs Uvicorn ---
+    # --- Remplace les logs Uvicorn (sans propagation : un seul passage par la file) ---
     for name in ("uvicorn.access", "uvicorn.error"):
         logger = logging.getLogger(name)
-        logger.handlers = [stream_handler, file_handler]
+        logger.handlers = [queue_handler]
         logger.setLevel(log_level)
+        logger.propagate = False
+
+    # --- L'access log d'Uvicorn (sans latence ni échantillonnage) est remplacé par app.access ---
+    logging.getLogger("uvicorn.access").disabled = True
+
+    # --- Les records encore en file sont écrits avant la sortie du processus ---
+    atexit.unregister(stop_logging)
+    atexit.register(stop_logging)
 
     # --- Log de démarrage ---
     logging.getLogger(__name__).info("✅ Logging initialized: console + file")
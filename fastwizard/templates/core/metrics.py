@@ -0,0 +1,251 @@
+"""Template pour les métriques Prometheus"""
+def get_template(config):
+    selected_modules = config.get("selected_modules", [])
+    has_db = any(m.startswith("db-") for m in selected_modules)
+    has_ws = "websocket" in selected_modules
+    if "cache-redis" in selected_modules:
+        cache_getter = "get_redis"
+    elif "cache-valkey" in selected_modules:
+        cache_getter = "get_valkey"
+    else:
+        cache_getter = None
+
+    sources = ["- MetricsMiddleware (ASGI) : latence par gabarit de route, requêtes en cours, statuts."]
+    imports = [
+        "from pydantic_settings import BaseSettings, SettingsConfigDict",
+        "from starlette.concurrency import run_in_threadpool",
+    ]
+    local_imports = ["from app.core.routing import route_template"]
+    sections = []
+    setup_calls = []
+
+    if has_db:
+        sources.append("- Pool SQLAlchemy : connexions ouvertes et empruntées (événements du pool).")
+        imports.append("from sqlalchemy import event")
+        imports.append("from sqlalchemy.pool import QueuePool")
+        local_imports.append("from app.database import engine")
+        sections.append('''
+# --- Pool de connexions SQLAlchemy (un pool par worker, additionnés) ---
+DB_POOL_SIZE = Gauge("db_pool_size", "Taille configurée du pool", multiprocess_mode="livesum")
+DB_POOL_OPEN = Gauge("db_pool_connections_open", "Connexions ouvertes vers la base", multiprocess_mode="livesum")
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_connections_checked_out", "Connexions empruntées au pool", multiprocess_mode="livesum"
+)
+DB_POOL_CHECKOUTS = Counter("db_pool_checkouts", "Emprunts de connexion au pool")
+
+
+def instrument_db_pool():
+    pool = engine.pool
+    if isinstance(pool, QueuePool):  # NullPool, StaticPool, SingletonThreadPool (SQLite) : pas de taille
+        DB_POOL_SIZE.set(pool.size())
+        # Connexions ouvertes avant l'instrumentation (ex. create_all à l'import)
+        DB_POOL_OPEN.set(pool.checkedin() + pool.checkedout())
+        DB_POOL_CHECKED_OUT.set(pool.checkedout())
+
+    @event.listens_for(engine, "connect")
+    def _connect(dbapi_connection, connection_record):
+        DB_POOL_OPEN.inc()
+
+    @event.listens_for(engine, "close")
+    def _close(dbapi_connection, connection_record):
+        DB_POOL_OPEN.dec()
+
+    @event.listens_for(engine, "close_detached")
+    def _close_detached(dbapi_connection):
+        DB_POOL_OPEN.dec()
+
+    @event.listens_for(engine, "checkout")
+    def _checkout(dbapi_connection, connection_record, connection_proxy):
+        DB_POOL_CHECKED_OUT.inc()
+        DB_POOL_CHECKOUTS.inc()
+
+    @event.listens_for(engine, "checkin")
+    def _checkin(dbapi_connection, connection_record):
+        DB_POOL_CHECKED_OUT.dec()
+''')
+        setup_calls.append("    instrument_db_pool()")
+
+    if cache_getter:
+        sources.append("- Cache : succès et échecs de lecture (INFO stats du serveur, relu à chaque scrape).")
+        imports.append("from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily")
+        imports.append("from redis.exceptions import RedisError")
+        local_imports.append(f"from app.core.cache import {cache_getter}")
+        sections.append(f'''
+# --- Cache : compteurs du serveur (communs à tous les workers, donc non agrégés) ---
+class CacheCollector:
+    def __init__(self):
+        self.stats: Optional[dict] = None
+
+    async def refresh(self):
+        try:
+            client = await {cache_getter}()
+            self.stats = await asyncio.wait_for(client.info("stats"), timeout=1)
+        except (RedisError, OSError, asyncio.TimeoutError):
+            self.stats = None
+
+    def collect(self):
+        if not self.stats:
+            return
+        hits = self.stats.get("keyspace_hits", 0)
+        misses = self.stats.get("keyspace_misses", 0)
+        yield CounterMetricFamily("cache_keyspace_hits", "Lectures de clé réussies (serveur de cache)", value=hits)
+        yield CounterMetricFamily("cache_keyspace_misses", "Lectures de clé absente (serveur de cache)", value=misses)
+        yield GaugeMetricFamily(
+            "cache_hit_ratio", "Part des lectures réussies depuis le démarrage du cache",
+            value=hits / (hits + misses) if hits + misses else 0.0,
+        )
+
+
+cache_collector = CacheCollector()
+''')
+
+    if has_ws:
+        sources.append("- WebSocket : connexions ouvertes (mis à jour par ConnectionManager).")
+        sections.append('''
+# --- WebSocket (app.core.websocket) ---
+WS_CONNECTIONS = Gauge("websocket_connections", "Connexions WebSocket ouvertes", multiprocess_mode="livesum")
+''')
+
+    refresh = "    await cache_collector.refresh()\n" if cache_getter else ""
+    register_cache = "registry.register(cache_collector)\n" if cache_getter else ""
+    imports_block = "\n".join(sorted(imports))
+    imports_block += "\n\n" + "\n".join(sorted(local_imports))
+    asyncio_import = "import asyncio\n" if cache_getter else ""
+    optional_import = "Optional, " if cache_getter else ""
+
+    return f'''"""
+Métriques Prometheus de l'application, exposées sur METRICS_PATH (/metrics).
+Automatically generated by FastWizard 🧙‍♂️
+
+{chr(10).join(sources)}
+
+Plusieurs workers : server.py (profil prod) crée et vide PROMETHEUS_MULTIPROC_DIR avant de
+lancer les workers ; chacun y écrit ses valeurs et /metrics agrège tous les fichiers.
+"""
+{asyncio_import}import os
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, List, {optional_import}Tuple
+
+from fastapi import FastAPI, Response
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+{imports_block}
+
+
+class MetricsSettings(BaseSettings):
+    METRICS_PATH: str = "/metrics"
+    # Chemins non mesurés, en plus de METRICS_PATH (ex. sondes de santé très fréquentes)
+    METRICS_EXCLUDE_PATHS: List[str] = []
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+
+MULTIPROCESS = bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+# Seuils en secondes, de 5 ms à 10 s
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+KNOWN_METHODS = frozenset({{"GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"}})
+# Chemins sans route (404) regroupés : un label par URL brute ferait exploser la cardinalité
+UNMATCHED_ROUTE = "<unmatched>"
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds", "Durée des requêtes HTTP", ["method", "route"], buckets=LATENCY_BUCKETS
+)
+REQUESTS = Counter("http_requests", "Requêtes HTTP terminées", ["method", "route", "status"])
+IN_FLIGHT = Gauge("http_requests_in_flight", "Requêtes HTTP en cours", multiprocess_mode="livesum")
+{"".join(sections)}
+
+class MetricsMiddleware:
+    """Middleware ASGI : une mesure par requête HTTP, enregistrée une fois la réponse envoyée."""
+
+    def __init__(self, app, exclude_paths: Tuple[str, ...] = ()):
+        self.app = app
+        self.exclude_paths = frozenset(exclude_paths)
+        # Séries déjà résolues : évite .labels() (verrou + recherche) à chaque requête
+        self._latency: Dict[tuple, object] = {{}}
+        self._requests: Dict[tuple, object] = {{}}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        root_path = scope.get("root_path", "")
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self._record(scope, root_path, status, time.perf_counter() - start)
+            IN_FLIGHT.dec()
+
+    def _record(self, scope, root_path: str, status: int, duration: float):
+        template = route_template(scope, root_path) or UNMATCHED_ROUTE
+        method = scope["method"] if scope["method"] in KNOWN_METHODS else "OTHER"
+
+        key = (method, template)
+        latency = self._latency.get(key)
+        if latency is None:
+            latency = self._latency[key] = REQUEST_LATENCY.labels(method, template)
+        latency.observe(duration)
+
+        key = (method, template, status)
+        requests = self._requests.get(key)
+        if requests is None:
+            requests = self._requests[key] = REQUESTS.labels(method, template, str(status))
+        requests.inc()
+
+
+def create_registry() -> CollectorRegistry:
+    if not MULTIPROCESS:
+        return REGISTRY  # inclut les métriques du processus (mémoire, CPU, GC)
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+registry = create_registry()
+{register_cache}
+
+async def metrics_endpoint():
+{refresh}    # En mode multiprocess, lecture des fichiers de chaque worker : hors de la boucle asyncio
+    content = await run_in_threadpool(generate_latest, registry)
+    return Response(content, media_type=CONTENT_TYPE_LATEST)
+
+
+def setup_metrics(app: FastAPI):
+    """Ajoute le middleware (le plus externe s'il est appelé en dernier) et la route /metrics."""
+    settings = MetricsSettings()
+    app.add_middleware(MetricsMiddleware, exclude_paths=(settings.METRICS_PATH, *settings.METRICS_EXCLUDE_PATHS))
+    app.add_api_route(settings.METRICS_PATH, metrics_endpoint, methods=["GET"], include_in_schema=False)
+{chr(10).join(setup_calls)}
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    if MULTIPROCESS:
+        # Les jauges "live" de ce worker ne comptent plus dans l'agrégat
+        multiprocess.mark_process_dead(os.getpid())
+'''
@@ -0,0 +1,133 @@
+"""Template pour le benchmark du coût des métriques Prometheus"""
+def get_template(config):
+    return '''"""
+Coût par requête du MetricsMiddleware (app/core/metrics.py).
+Automatically generated by FastWizard 🧙‍♂️
+
+Appelle directement l'application ASGI (sans réseau) sur une route paramétrée, avec et
+sans le middleware, en mode mémoire (un worker) puis en mode multiprocess (valeurs dans
+PROMETHEUS_MULTIPROC_DIR, comme en prod avec plusieurs workers). Mesure aussi le coût
+d'un scrape de /metrics.
+
+Usage :
+    python benchmarks/metrics_overhead.py --requests 20000
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+def build_app(with_metrics: bool):
+    from fastapi import FastAPI
+
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def read_item(item_id: int):
+        return {"id": item_id}
+
+    if with_metrics:
+        from app.core.metrics import MetricsMiddleware
+
+        app.add_middleware(MetricsMiddleware, exclude_paths=("/metrics",))
+    return app
+
+
+async def per_request(app, requests: int) -> float:
+    """Durée moyenne (µs) d'un appel ASGI complet."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/items/42",
+        "raw_path": b"/items/42",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("127.0.0.1", 8000),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    for _ in range(200):  # échauffement (construction de la pile de middlewares)
+        await app(dict(scope), receive, send)
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - start) / requests * 1e6
+
+
+def measure(requests: int, rounds: int):
+    """Exécuté dans un processus neuf : le mode (mémoire/multiprocess) est fixé à l'import."""
+    from prometheus_client import generate_latest
+
+    from app.core.metrics import registry
+
+    plain, instrumented = build_app(False), build_app(True)
+    without, with_ = [], []
+    for _ in range(rounds):  # alternance : le bruit de la machine touche les deux mesures
+        without.append(asyncio.run(per_request(plain, requests)))
+        with_.append(asyncio.run(per_request(instrumented, requests)))
+    start = time.perf_counter()
+    size = len(generate_latest(registry))
+    scrape_ms = (time.perf_counter() - start) * 1000
+    print(f"{statistics.median(without)} {statistics.median(with_)} {scrape_ms} {size}")
+
+
+def run_mode(label: str, args, multiproc_dir=None):
+    env = {k: v for k, v in os.environ.items() if k != "PROMETHEUS_MULTIPROC_DIR"}
+    if multiproc_dir:
+        env["PROMETHEUS_MULTIPROC_DIR"] = multiproc_dir
+    result = subprocess.run(
+        [sys.executable, __file__, "--child", "--requests", str(args.requests), "--rounds", str(args.rounds)],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        sys.exit(f"❌ Mesure '{label}' impossible :\\n{result.stderr[-3000:]}")
+    without, with_, scrape_ms, size = (float(v) for v in result.stdout.split()[-4:])
+    print(
+        f"{label:<14} {without:>9.1f} {with_:>9.1f} {with_ - without:>+9.1f} "
+        f"{(with_ - without) / without:>+8.1%} {scrape_ms:>9.2f} {int(size):>9}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Coût par requête des métriques Prometheus")
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        measure(args.requests, args.rounds)
+        return
+
+    print(f"{args.requests} requêtes x {args.rounds} (µs par requête, médiane)")
+    print(f"{'mode':<14} {'sans':>9} {'avec':>9} {'surcoût':>9} {'':>8} {'scrape ms':>9} {'octets':>9}")
+    run_mode("mémoire", args)
+    with tempfile.TemporaryDirectory() as multiproc_dir:
+        run_mode("multiprocess", args, multiproc_dir)
+
+
+if __name__ == "__main__":
+    main()
+'''
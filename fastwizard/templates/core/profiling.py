@@ -0,0 +1,265 @@
+"""Template pour le profilage des requêtes"""
+def get_template(config):
+    selected_modules = config.get("selected_modules", [])
+
+    # Sans module de permissions, l'endpoint d'administration est protégé par PROFILING_TOKEN
+    token_dependency = ""
+    token_comment = "même si inactif"
+    fastapi_imports = "FastAPI"
+    if "auth-permissions" not in selected_modules:
+        fastapi_imports = "FastAPI, Header, HTTPException, status"
+        token_comment = "même si inactif ; protège aussi l'endpoint d'administration"
+        token_dependency = '''
+
+def require_profiling_token(x_profiling_token: Optional[str] = Header(default=None)):
+    """Protège l'endpoint d'administration : en-tête X-Profiling-Token égal à PROFILING_TOKEN."""
+    if not settings.PROFILING_TOKEN or not x_profiling_token or not secrets.compare_digest(
+        x_profiling_token, settings.PROFILING_TOKEN
+    ):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Jeton de profilage invalide")
+'''
+
+    return f'''"""
+Profilage de requêtes individuelles (pyinstrument ou cProfile).
+Automatically generated by FastWizard 🧙‍♂️
+
+Une requête est profilée si le profilage est actif (PROFILING_ENABLED, ou activé à chaud par
+l'endpoint /api/v1/profiling pour une durée limitée) et qu'elle porte l'en-tête X-Profile ou
+est tirée au sort (taux d'échantillonnage). Avec PROFILING_TOKEN, l'en-tête
+`X-Profile: <jeton>` déclenche le profilage même quand il est inactif.
+
+Sorties dans PROFILING_DIR (logs/profiles/), identifiant renvoyé dans l'en-tête X-Profile-Id :
+- pyinstrument : <id>.html (arbre d'appels) et <id>.speedscope.json (flamegraph, speedscope.app)
+- cprofile     : <id>.prof (pstats : snakeviz, flameprof, gprof2dot)
+
+Un seul profil à la fois par worker : les requêtes concurrentes passent sans profilage.
+cProfile trace tout le thread de la boucle asyncio pendant la requête, y compris les autres
+requêtes en cours ; pyinstrument (mode async) ne garde que la tâche profilée.
+"""
+import cProfile
+import json
+import os
+import random
+import re
+import secrets
+import time
+from pathlib import Path
+from typing import List, Literal, Optional
+
+from fastapi import {fastapi_imports}
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from pyinstrument import Profiler
+from pyinstrument.renderers import HTMLRenderer, SpeedscopeRenderer
+from starlette.concurrency import run_in_threadpool
+
+Engine = Literal["pyinstrument", "cprofile"]
+
+
+class ProfilingSettings(BaseSettings):
+    # Actif en permanence (sinon, activation temporaire via l'endpoint d'administration)
+    PROFILING_ENABLED: bool = False
+    # Part des requêtes profilées quand le profilage est actif (0.0 = en-tête X-Profile seulement)
+    PROFILING_SAMPLE_RATE: float = 0.0
+    PROFILING_ENGINE: Engine = "pyinstrument"
+    # Intervalle d'échantillonnage de pyinstrument (secondes)
+    PROFILING_INTERVAL: float = 0.001
+    PROFILING_HEADER: str = "X-Profile"
+    # Jeton secret : `X-Profile: <jeton>` profile {token_comment}
+    PROFILING_TOKEN: str = ""
+    # Préfixes jamais profilés (endpoint d'administration, scrape des métriques)
+    PROFILING_EXCLUDE_PATHS: List[str] = ["/api/v1/profiling", "/metrics"]
+    PROFILING_DIR: str = "logs/profiles"
+    # Fichiers conservés (les plus anciens sont supprimés)
+    PROFILING_MAX_FILES: int = 200
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+
+settings = ProfilingSettings()
+PROFILE_SUFFIXES = (".html", ".speedscope.json", ".prof")
+# Délai minimal entre deux lectures du fichier d'état partagé
+STATE_REFRESH_SECONDS = 1.0
+
+
+class ProfilingState:
+    """Réglages modifiables à chaud, partagés entre workers par un fichier JSON dans PROFILING_DIR."""
+
+    def __init__(self, directory: Path):
+        self.path = directory / "state.json"
+        self.enabled_until = 0.0  # horodatage (time.time) de fin d'activation temporaire
+        self.sample_rate = settings.PROFILING_SAMPLE_RATE
+        self.engine: Engine = settings.PROFILING_ENGINE
+        self._mtime: Optional[int] = None
+        self._checked = 0.0
+
+    @property
+    def active(self) -> bool:
+        return settings.PROFILING_ENABLED or time.time() < self.enabled_until
+
+    def refresh(self):
+        """Relit l'état écrit par un autre worker : au plus un stat() par seconde."""
+        now = time.monotonic()
+        if now - self._checked < STATE_REFRESH_SECONDS:
+            return
+        self._checked = now
+        try:
+            mtime = self.path.stat().st_mtime_ns
+            if mtime == self._mtime:
+                return
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        self._mtime = mtime
+        self.enabled_until = float(data.get("enabled_until", 0.0))
+        self.sample_rate = float(data.get("sample_rate", self.sample_rate))
+        if data.get("engine") in ("pyinstrument", "cprofile"):
+            self.engine = data["engine"]
+
+    def update(self, enabled: bool, duration: int, sample_rate: Optional[float] = None, engine: Optional[Engine] = None):
+        self.refresh()
+        self.enabled_until = time.time() + duration if enabled else 0.0
+        if sample_rate is not None:
+            self.sample_rate = sample_rate
+        if engine is not None:
+            self.engine = engine
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_suffix(".tmp")
+        temporary.write_text(json.dumps({{
+            "enabled_until": self.enabled_until,
+            "sample_rate": self.sample_rate,
+            "engine": self.engine,
+        }}), encoding="utf-8")
+        os.replace(temporary, self.path)  # atomique : un worker ne lit jamais un fichier à moitié écrit
+        self._checked = 0.0
+
+    def as_dict(self) -> dict:
+        self.refresh()
+        return {{
+            "active": self.active,
+            "permanent": settings.PROFILING_ENABLED,
+            "remaining_seconds": max(0, round(self.enabled_until - time.time())),
+            "sample_rate": self.sample_rate,
+            "engine": self.engine,
+        }}
+
+
+state = ProfilingState(Path(settings.PROFILING_DIR))
+
+
+def list_profiles() -> List[dict]:
+    """Profils enregistrés, du plus récent au plus ancien."""
+    directory = Path(settings.PROFILING_DIR)
+    if not directory.is_dir():
+        return []
+    files = [path for path in directory.iterdir() if path.name.endswith(PROFILE_SUFFIXES)]
+    files.sort(key=lambda path: path.stat().st_mtime, reverse=True)
+    return [{{"name": path.name, "size": path.stat().st_size}} for path in files]
+
+
+def prune_profiles(directory: Path, keep: int):
+    files = [path for path in directory.iterdir() if path.name.endswith(PROFILE_SUFFIXES)]
+    if len(files) <= keep:
+        return
+    files.sort(key=lambda path: path.stat().st_mtime)
+    for path in files[:len(files) - keep]:
+        path.unlink(missing_ok=True)
+
+
+class PyinstrumentRecorder:
+    def __init__(self):
+        # async_mode="enabled" : seul le temps de la tâche profilée est attribué (pas des autres requêtes)
+        self.profiler = Profiler(interval=settings.PROFILING_INTERVAL, async_mode="enabled")
+
+    def start(self):
+        self.profiler.start()
+
+    def stop(self):
+        self.profiler.stop()
+
+    def write(self, base: Path):
+        base.with_name(base.name + ".html").write_text(self.profiler.output(HTMLRenderer()), encoding="utf-8")
+        base.with_name(base.name + ".speedscope.json").write_text(
+            self.profiler.output(SpeedscopeRenderer()), encoding="utf-8"
+        )
+
+
+class CProfileRecorder:
+    def __init__(self):
+        self.profiler = cProfile.Profile()
+
+    def start(self):
+        self.profiler.enable()
+
+    def stop(self):
+        self.profiler.disable()
+
+    def write(self, base: Path):
+        self.profiler.dump_stats(base.with_name(base.name + ".prof"))
+
+
+RECORDERS = {{"pyinstrument": PyinstrumentRecorder, "cprofile": CProfileRecorder}}
+
+
+class ProfilingMiddleware:
+    """Middleware ASGI : profile la requête si elle est sélectionnée, écrit le profil après la réponse."""
+
+    def __init__(self, app):
+        self.app = app
+        self.header = settings.PROFILING_HEADER.lower().encode("latin-1")
+        self.exclude_paths = tuple(settings.PROFILING_EXCLUDE_PATHS)
+        self.directory = Path(settings.PROFILING_DIR)
+        self._busy = False  # un seul profileur par processus (cProfile l'impose, le coût aussi)
+
+    def _selected(self, scope) -> bool:
+        if scope["path"].startswith(self.exclude_paths):
+            return False
+        header_value = None
+        for name, value in scope["headers"]:
+            if name == self.header:
+                header_value = value.decode("latin-1")
+                break
+        if header_value and settings.PROFILING_TOKEN and secrets.compare_digest(header_value, settings.PROFILING_TOKEN):
+            return True
+        state.refresh()
+        if not state.active:
+            return False
+        return header_value is not None or (state.sample_rate > 0 and random.random() < state.sample_rate)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or self._busy or not self._selected(scope):
+            await self.app(scope, receive, send)
+            return
+
+        slug = re.sub(r"[^A-Za-z0-9]+", "_", scope["path"]).strip("_")[:60] or "root"
+        profile_id = f"{{time.strftime('%Y%m%d-%H%M%S')}}-{{scope['method']}}-{{slug}}-{{secrets.token_hex(3)}}"
+        header = (b"x-profile-id", profile_id.encode("latin-1"))
+
+        async def send_with_id(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), header]
+            await send(message)
+
+        recorder = RECORDERS[state.engine]()
+        self._busy = True
+        recorder.start()
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            recorder.stop()
+            self._busy = False
+            # Rendu et écriture hors de la boucle asyncio (le HTML de pyinstrument pèse ~1 Mo)
+            await run_in_threadpool(self._save, recorder, profile_id)
+
+    def _save(self, recorder, profile_id: str):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        recorder.write(self.directory / profile_id)
+        prune_profiles(self.directory, settings.PROFILING_MAX_FILES)
+{token_dependency}
+
+def setup_profiling(app: FastAPI):
+    app.add_middleware(ProfilingMiddleware)
+'''
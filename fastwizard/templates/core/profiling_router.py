@@ -0,0 +1,57 @@
+"""Template pour le router d'administration du profilage"""
+def get_template(config):
+    selected_modules = config.get("selected_modules", [])
+
+    # Réservé aux admins si le module de permissions est présent, sinon au jeton PROFILING_TOKEN
+    if "auth-permissions" in selected_modules:
+        guard_import = "from app.core.permissions import require_admin\n"
+        guard = "require_admin"
+        profiling_import = "from app.core.profiling import Engine, list_profiles, settings, state"
+    else:
+        guard_import = ""
+        guard = "require_profiling_token"
+        profiling_import = "from app.core.profiling import Engine, list_profiles, require_profiling_token, settings, state"
+
+    return f'''"""
+Administration du profilage : état, activation temporaire, téléchargement des profils.
+Automatically generated by FastWizard 🧙‍♂️
+"""
+from pathlib import Path
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import FileResponse
+from pydantic import BaseModel, Field
+
+{guard_import}{profiling_import}
+
+router = APIRouter(dependencies=[Depends({guard})])
+
+
+class ProfilingUpdate(BaseModel):
+    enabled: bool
+    # Durée d'activation (secondes) : le profilage se coupe seul, même si on oublie de le désactiver
+    duration: int = Field(default=900, gt=0, le=86400)
+    sample_rate: Optional[float] = Field(default=None, ge=0.0, le=1.0)
+    engine: Optional[Engine] = None
+
+
+@router.get("/")
+async def get_profiling():
+    """État du profilage (tous workers) et profils enregistrés, du plus récent au plus ancien."""
+    return {{**state.as_dict(), "profiles": list_profiles()}}
+
+
+@router.put("/")
+async def update_profiling(update: ProfilingUpdate):
+    state.update(update.enabled, update.duration, update.sample_rate, update.engine)
+    return state.as_dict()
+
+
+@router.get("/profiles/{{name}}")
+async def download_profile(name: str):
+    # Seuls les fichiers listés sont servis : pas de chemin arbitraire
+    if name not in {{profile["name"] for profile in list_profiles()}}:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profil introuvable")
+    return FileResponse(Path(settings.PROFILING_DIR) / name)
+'''
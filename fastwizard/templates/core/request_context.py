@@ -0,0 +1,134 @@
+"""Template pour le contexte de requête injecté dans les logs"""
+def get_template(config):
+    return '''"""
+Contexte de la requête courante (request id, utilisateur, route) pour les logs.
+Automatically generated by FastWizard 🧙‍♂️
+
+RequestContextMiddleware ouvre un contexte par requête HTTP et écrit l'access log
+(logger "app.access", avec statut et latence) selon la décision de l'AccessLogSampler ;
+RequestContextFilter recopie le contexte sur chaque record au moment de l'appel de log
+(avant la file du QueueListener, où les contextvars ne sont plus accessibles).
+"""
+import logging
+import re
+import time
+import uuid
+from contextvars import ContextVar
+from typing import Any, Optional
+
+from app.core.routing import route_template
+
+REQUEST_ID_HEADER = b"x-request-id"
+# Un request id reçu du client n'est repris que s'il est court et sans caractère exotique
+_VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._-]{1,128}$")
+
+
+class RequestContext:
+    __slots__ = ("request_id", "method", "path", "user_id", "scope", "root_path")
+
+    def __init__(self, request_id: str, method: str, path: str, scope: dict):
+        self.request_id = request_id
+        self.method = method
+        self.path = path
+        self.user_id: Optional[Any] = None
+        self.scope = scope
+        # root_path à l'arrivée : le routage y ajoute le préfixe des routers montés
+        self.root_path = scope.get("root_path", "")
+
+    @property
+    def route(self) -> str:
+        # Gabarit complet (/api/v1/items/{item_id}) une fois le routage fait, sinon le chemin brut
+        return route_template(self.scope, self.root_path) or self.path
+
+
+_request_context: ContextVar[Optional[RequestContext]] = ContextVar("request_context", default=None)
+
+
+def get_request_context() -> Optional[RequestContext]:
+    return _request_context.get()
+
+
+def set_user_id(user_id: Any):
+    """Associe l'utilisateur authentifié à la requête courante (visible dans les logs)."""
+    context = _request_context.get()
+    if context is not None:
+        # Objet partagé : la modification est visible même depuis une dépendance exécutée en thread
+        context.user_id = user_id
+
+
+class RequestContextMiddleware:
+    """Middleware ASGI : request id (repris de X-Request-ID ou généré), renvoyé dans la réponse, et access log."""
+
+    def __init__(self, app, sampler=None):
+        self.app = app
+        # AccessLogSampler (app.core.logging) ; None = pas d'access log
+        self.sampler = sampler
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == REQUEST_ID_HEADER:
+                candidate = value.decode("latin-1")
+                if _VALID_REQUEST_ID.match(candidate):
+                    request_id = candidate
+                break
+        context = RequestContext(request_id or uuid.uuid4().hex, scope["method"], scope["path"], scope)
+        token = _request_context.set(context)
+        header = (REQUEST_ID_HEADER, context.request_id.encode("latin-1"))
+        status = 500
+        start = time.perf_counter()
+
+        async def send_with_request_id(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                message["headers"] = [*message.get("headers", []), header]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            if self.sampler is not None:
+                self._log_access(context, status, (time.perf_counter() - start) * 1000)
+            _request_context.reset(token)
+
+    def _log_access(self, context: RequestContext, status: int, duration_ms: float):
+        decision = self.sampler.decide(context.route, context.path, status, duration_ms)
+        if decision is None:
+            return
+        level, suppressed = decision
+        client = context.scope.get("client")
+        self.sampler.logger.log(
+            level,
+            "%s %s %d %.1fms",
+            context.method,
+            context.path,
+            status,
+            duration_ms,
+            extra={
+                "status_code": status,
+                "duration_ms": round(duration_ms, 2),
+                "client": client[0] if client else None,
+                "suppressed": suppressed,
+            },
+        )
+
+
+class RequestContextFilter(logging.Filter):
+    """Ajoute request_id, user_id, method et route à chaque record (None hors requête)."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        context = _request_context.get()
+        if context is None:
+            record.request_id = record.user_id = record.method = record.route = None
+        else:
+            record.request_id = context.request_id
+            record.user_id = context.user_id
+            record.method = context.method
+            record.route = context.route
+        return True
+'''
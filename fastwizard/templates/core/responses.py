@@ -0,0 +1,37 @@
+"""Template pour les réponses JSON rapides (orjson)"""
+def get_template(config):
+    return '''"""
+Réponses JSON rapides.
+Automatically generated by FastWizard 🧙‍♂️
+
+- ORJSONResponse : classe de réponse par défaut de l'application (main.py),
+  pour les routes qui renvoient des dict/list sans response_model.
+- json_response : pour les routes avec un schéma Pydantic, valide les données
+  (objets SQLAlchemy compris) et les sérialise en une passe dans le cœur Rust
+  de Pydantic, sans jsonable_encoder ni json.dumps.
+"""
+from typing import Any, Dict, Optional
+
+import orjson
+from fastapi.responses import JSONResponse, Response
+from pydantic import TypeAdapter
+
+
+class ORJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def json_response(
+    adapter: TypeAdapter,
+    data: Any,
+    status_code: int = 200,
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """Réponse déjà validée et encodée : FastAPI la renvoie telle quelle.
+
+    Garder `response_model` sur la route pour la documentation OpenAPI.
+    """
+    content = adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+    return Response(content, status_code=status_code, headers=headers, media_type="application/json")
+'''
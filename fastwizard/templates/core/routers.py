@@ -0,0 +1,112 @@
+"""Template pour la table statique des routers de l'application"""
+def get_template(config):
+    def tags(router):
+        names = [f'"{tag}"' for tag in router.get("tags", [])]
+        return f"({names[0]},)" if len(names) == 1 else f"({', '.join(names)})"
+
+    entries = "\n".join(
+        f'    RouterEntry("{router["module"]}", "{router["prefix"]}", {tags(router)}),'
+        for router in config.get("routers", [])
+    )
+    table = f"(\n{entries}\n)" if entries else "()"
+
+    return f'''"""
+Table des routers de l'application.
+Automatically generated by FastWizard 🧙‍♂️ — régénérée par `fastwizard update`.
+
+Les routers sont inclus dans l'ordre de ROUTERS, sans parcours de app/domains au
+démarrage : un router qui ne s'importe pas fait échouer le démarrage avec sa vraie erreur.
+
+- LAZY_ROUTERS=false (défaut) : tout est importé et inclus au démarrage.
+- LAZY_ROUTERS=true : chaque router est monté sous son préfixe et n'est importé qu'à sa
+  première requête (démarrage plus rapide en développement ; ces routes n'apparaissent
+  pas dans /docs).
+- ROUTER_IMPORT_BUDGET_MS : au-delà de ce temps d'import cumulé, un avertissement est loggé.
+"""
+import importlib
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from fastapi import APIRouter, FastAPI
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from starlette.routing import Mount
+
+logger = logging.getLogger(__name__)
+
+
+class RouterSettings(BaseSettings):
+    LAZY_ROUTERS: bool = False
+    # Temps d'import cumulé des routers toléré au démarrage (0 = pas de contrôle)
+    ROUTER_IMPORT_BUDGET_MS: float = 0
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+
+@dataclass(frozen=True)
+class RouterEntry:
+    module: str
+    prefix: str
+    tags: Tuple[str, ...] = ()
+
+
+ROUTERS: Tuple[RouterEntry, ...] = {table}
+
+# Temps d'import de chaque router (ms), renseigné au chargement
+IMPORT_TIMES: Dict[str, float] = {{}}
+
+
+def load_router(entry: RouterEntry) -> APIRouter:
+    start = time.perf_counter()
+    module = importlib.import_module(entry.module)
+    IMPORT_TIMES[entry.module] = (time.perf_counter() - start) * 1000
+    return module.router
+
+
+class LazyRouter:
+    """Application ASGI montée sous le préfixe d'un router, qui ne l'importe qu'à la première requête."""
+
+    def __init__(self, app: FastAPI, entry: RouterEntry):
+        self.app = app
+        self.entry = entry
+        self._router = None
+
+    async def __call__(self, scope, receive, send):
+        if self._router is None:
+            # Recopié dans un router rattaché à l'application : dependency_overrides s'applique
+            router = APIRouter(dependency_overrides_provider=self.app)
+            router.include_router(load_router(self.entry), tags=list(self.entry.tags))
+            self._router = router
+            logger.info("Router %s chargé (%.1f ms)", self.entry.module, IMPORT_TIMES[self.entry.module])
+        await self._router(scope, receive, send)
+
+
+def include_routers(app: FastAPI, lazy: Optional[bool] = None):
+    settings = RouterSettings()
+    if lazy is None:
+        lazy = settings.LAZY_ROUTERS
+
+    for entry in ROUTERS:
+        if lazy:
+            app.router.routes.append(Mount(entry.prefix, app=LazyRouter(app, entry)))
+        else:
+            app.include_router(load_router(entry), prefix=entry.prefix, tags=list(entry.tags))
+
+    total = sum(IMPORT_TIMES.values())
+    for module, elapsed in IMPORT_TIMES.items():
+        logger.debug("Router %s importé en %.1f ms", module, elapsed)
+    if settings.ROUTER_IMPORT_BUDGET_MS and total > settings.ROUTER_IMPORT_BUDGET_MS:
+        slowest = max(IMPORT_TIMES, key=IMPORT_TIMES.get)
+        logger.warning(
+            "Import des routers : %.0f ms (budget %.0f ms), le plus lent : %s (%.0f ms)",
+            total,
+            settings.ROUTER_IMPORT_BUDGET_MS,
+            slowest,
+            IMPORT_TIMES[slowest],
+        )
+'''
@@ -0,0 +1,40 @@
+"""Template pour la résolution du gabarit complet des routes"""
+def get_template(config):
+    return '''"""
+Gabarit complet de la route qui a traité une requête (/api/v1/food/foods/{id}).
+Automatically generated by FastWizard 🧙‍♂️
+
+Partagé par les access logs (app.core.request_context) et les métriques (app.core.metrics) :
+deux routers qui exposent le même sous-chemin ne partagent jamais un libellé.
+"""
+from typing import Dict, Optional, Tuple
+
+# id(route) -> (préfixe, gabarit complet) ; les routes vivent autant que l'application
+_templates: Dict[int, Tuple[str, str]] = {}
+
+
+def route_template(scope: dict, root_path: str = "") -> Optional[str]:
+    """Gabarit de la route avec les préfixes de include_router et des routers montés.
+
+    `root_path` est celui de la requête à son arrivée : ce que le routage y a ajouté est le
+    préfixe d'un router monté (LAZY_ROUTERS). None tant qu'aucune route n'a été trouvée.
+    """
+    route = scope.get("route")
+    if route is None:
+        return None
+    mount_prefix = scope.get("root_path", "")[len(root_path):]
+    path = scope["path"][len(scope.get("root_path", "")):]
+    cached = _templates.get(id(route))
+    if cached is not None and path.startswith(cached[0]):
+        return mount_prefix + cached[1]
+    # Selon la version de FastAPI, route.path inclut ou non le préfixe de include_router :
+    # le préfixe est la partie du chemin qui précède ce que reconnaît la route
+    prefix = ""
+    for index, char in enumerate(path):
+        if char == "/" and route.path_regex.match(path[index:]):
+            prefix = path[:index]
+            break
+    template = prefix + route.path
+    _templates[id(route)] = (prefix, template)
+    return mount_prefix + template
+'''
@@ -0,0 +1,138 @@
+"""Template pour le benchmark de sérialisation des schémas du projet"""
+
+def get_template(config):
+    return '''"""
+Benchmark de sérialisation JSON des schémas Pydantic du projet.
+Automatically generated by FastWizard 🧙‍♂️
+
+Pour chaque schéma de app/domains/*/schemas.py, encode une liste d'objets
+selon les chemins possibles d'une réponse FastAPI :
+- stdlib   : jsonable_encoder + json.dumps (JSONResponse, route sans response_model)
+- orjson   : jsonable_encoder + orjson.dumps (ORJSONResponse)
+- pydantic : TypeAdapter.dump_json (response_model, app.core.responses.json_response)
+- py+orjson: dump_python(mode="json") + orjson.dumps
+
+Usage :
+    python benchmarks/serialization.py --items 100 --repeat 200
+    python benchmarks/serialization.py --schema Food
+"""
+import argparse
+import importlib
+import json
+import sys
+import time
+import types
+import typing
+from datetime import date, datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import orjson  # noqa: E402
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from pydantic import BaseModel, TypeAdapter, ValidationError  # noqa: E402
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def project_schemas() -> dict:
+    """Schémas déclarés dans app/domains/*/schemas.py."""
+    schemas = {}
+    for path in sorted((ROOT / "app" / "domains").glob("*/schemas.py")):
+        module_name = f"app.domains.{path.parent.name}.schemas"
+        try:
+            module = importlib.import_module(module_name)
+        except Exception as exc:  # dépendance optionnelle absente, etc.
+            print(f"⚠️ {module_name} ignoré : {exc}")
+            continue
+        for name, value in vars(module).items():
+            if isinstance(value, type) and issubclass(value, BaseModel) and value.__module__ == module_name:
+                schemas[name] = value
+    return schemas
+
+
+def sample_value(annotation, i: int):
+    """Valeur plausible pour une annotation de champ."""
+    origin = typing.get_origin(annotation)
+    if origin in (typing.Union, types.UnionType):
+        args = [a for a in typing.get_args(annotation) if a is not type(None)]
+        return sample_value(args[0], i) if args else None
+    if origin in (list, typing.List):
+        args = typing.get_args(annotation)
+        return [sample_value(args[0], i + k) for k in range(3)] if args else []
+    if origin in (dict, typing.Dict):
+        return {"key": i}
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return sample_payload(annotation, i)
+    if annotation is bool:
+        return i % 2 == 0
+    if annotation is int:
+        return i
+    if annotation is float:
+        return i * 1.5
+    if annotation is datetime:
+        return datetime(2024, 1, 1, 12, 0, i % 60)
+    if annotation is date:
+        return date(2024, 1, 1 + i % 28)
+    if "email" in str(annotation).lower():
+        return f"user{i}@example.com"
+    return f"value {i}"
+
+
+def sample_payload(schema, i: int) -> dict:
+    payload = {}
+    for name, field in schema.model_fields.items():
+        value = sample_value(field.annotation, i)
+        if "email" in name and isinstance(value, str):
+            value = f"user{i}@example.com"
+        payload[name] = value
+    return payload
+
+
+def timed(fn, repeat: int) -> float:
+    fn()  # échauffement
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de sérialisation des schémas")
+    parser.add_argument("--items", type=int, default=100, help="objets par réponse")
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--schema", help="ne mesurer que ce schéma")
+    args = parser.parse_args()
+
+    schemas = project_schemas()
+    if args.schema:
+        schemas = {k: v for k, v in schemas.items() if k == args.schema}
+    if not schemas:
+        print("Aucun schéma trouvé dans app/domains/*/schemas.py")
+        return
+
+    print(f"{args.items} objets par réponse, {args.repeat} répétitions (µs par réponse, x = gain vs stdlib)")
+    print(f"{'schéma':<28} {'octets':>8} {'stdlib':>9} {'orjson':>14} {'pydantic':>14} {'py+orjson':>14}")
+    for name, schema in schemas.items():
+        adapter = TypeAdapter(list[schema])
+        try:
+            items = adapter.validate_python([sample_payload(schema, i) for i in range(args.items)])
+        except ValidationError:
+            continue  # contraintes non devinables (regex, bornes...) : schéma ignoré
+
+        results = {
+            "stdlib": timed(lambda: json.dumps(jsonable_encoder(items)).encode(), args.repeat),
+            "orjson": timed(lambda: orjson.dumps(jsonable_encoder(items)), args.repeat),
+            "pydantic": timed(lambda: adapter.dump_json(items), args.repeat),
+            "py+orjson": timed(lambda: orjson.dumps(adapter.dump_python(items, mode="json")), args.repeat),
+        }
+        base = results["stdlib"]
+        cells = [f"{base * 1e6:>9.1f}"] + [
+            f"{value * 1e6:>8.1f} x{base / value:>4.1f}" for key, value in results.items() if key != "stdlib"
+        ]
+        print(f"{name:<28} {len(adapter.dump_json(items)):>8} {' '.join(cells)}")
+
+
+if __name__ == "__main__":
+    main()
+'''
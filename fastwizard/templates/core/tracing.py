@@ -0,0 +1,128 @@
+"""Template pour les traces OpenTelemetry"""
+def get_template(config):
+    selected_modules = config.get("selected_modules", [])
+    has_db = any(m.startswith("db-") for m in selected_modules)
+    has_cache = "cache-redis" in selected_modules or "cache-valkey" in selected_modules
+    has_httpx = any(m.startswith("mail-") or m.startswith("auth-oauth") for m in selected_modules)
+
+    sources = ["- Requêtes HTTP et WebSocket (FastAPI)"]
+    imports = [
+        "from fastapi import FastAPI",
+        "from opentelemetry import trace",
+        "from opentelemetry.sdk.resources import SERVICE_NAME, Resource",
+        "from opentelemetry.sdk.trace import TracerProvider",
+        "from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter, SpanExporter",
+        "from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased",
+    ]
+    local_imports = ["from app.core.config import get_settings"]
+    instrument_calls = []
+
+    if has_db:
+        sources.append("- Requêtes SQL (moteur SQLAlchemy de app/database.py)")
+        imports.append("from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor")
+        local_imports.append("from app.database import engine")
+        instrument_calls.append("    SQLAlchemyInstrumentor().instrument(engine=engine, tracer_provider=provider)")
+    if has_cache:
+        cache_name = "Valkey" if "cache-valkey" in selected_modules else "Redis"
+        sources.append(f"- Commandes {cache_name} (client redis-py, synchrone et asyncio)")
+        imports.append("from opentelemetry.instrumentation.redis import RedisInstrumentor")
+        instrument_calls.append("    RedisInstrumentor().instrument(tracer_provider=provider)")
+    if has_httpx:
+        sources.append("- Appels HTTP sortants httpx (fournisseurs OAuth, API d'emails)")
+        imports.append("from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor")
+        instrument_calls.append("    HTTPXClientInstrumentor().instrument(tracer_provider=provider)")
+
+    libraries_block = ""
+    if instrument_calls:
+        libraries_block = "\n    # Instrumentation des bibliothèques (globale au processus)\n" + "\n".join(instrument_calls) + "\n"
+
+    return f'''"""
+Traces OpenTelemetry de l'application.
+Automatically generated by FastWizard 🧙‍♂️
+
+{chr(10).join(sources)}
+
+Exporteur (TRACING_EXPORTER dans app/core/config.py) :
+- otlp    : collecteur OpenTelemetry (Jaeger, Tempo, ...) en HTTP/protobuf
+- file    : une ligne JSON par span dans TRACING_FILE, sans réseau
+- console : spans affichés sur la sortie standard
+- none    : traces désactivées
+
+Échantillonnage (TRACING_SAMPLE_RATIO) : décidé une fois à l'entrée d'une trace ; les spans
+enfants et les services appelés (en-tête traceparent) suivent cette décision.
+"""
+import os
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Optional
+
+{chr(10).join(sorted(imports))}
+
+{chr(10).join(local_imports)}
+
+try:
+    # Versions récentes de FastAPI : spans HTTP intégrés, actifs dès qu'un TracerProvider est configuré
+    from fastapi.telemetry import TelemetryConfig  # noqa: F401
+
+    NATIVE_FASTAPI_TELEMETRY = True
+except ImportError:
+    NATIVE_FASTAPI_TELEMETRY = False
+
+provider: Optional[TracerProvider] = None
+
+
+def create_exporter(settings) -> SpanExporter:
+    if settings.TRACING_EXPORTER == "otlp":
+        # Import paresseux : inutile de charger protobuf pour les exporteurs locaux
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+        return OTLPSpanExporter(endpoint=settings.TRACING_OTLP_ENDPOINT)
+    if settings.TRACING_EXPORTER == "file":
+        path = Path(settings.TRACING_FILE)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Ajout en fin de fichier : plusieurs workers peuvent partager le même fichier
+        return ConsoleSpanExporter(
+            out=path.open("a", encoding="utf-8"),
+            formatter=lambda span: span.to_json(indent=None) + os.linesep,
+        )
+    return ConsoleSpanExporter()
+
+
+def fastapi_options() -> dict:
+    """Arguments de FastAPI() : chemins exclus des traces pour la télémétrie intégrée de FastAPI."""
+    if not NATIVE_FASTAPI_TELEMETRY:
+        return {{}}
+    excluded = frozenset(get_settings().TRACING_EXCLUDED_URLS)
+    return {{"telemetry": {{"exclude": lambda scope: scope["path"] in excluded}}}}
+
+
+def setup_tracing(app: FastAPI):
+    """Configure le TracerProvider global et instrumente l'application."""
+    global provider
+    settings = get_settings()
+    if not settings.TRACING_ENABLED or settings.TRACING_EXPORTER == "none":
+        return
+
+    provider = TracerProvider(
+        resource=Resource.create({{SERVICE_NAME: settings.APP_NAME}}),
+        sampler=ParentBased(TraceIdRatioBased(settings.TRACING_SAMPLE_RATIO)),
+    )
+    # Export par lots dans un thread : jamais sur le chemin de la requête
+    provider.add_span_processor(BatchSpanProcessor(create_exporter(settings)))
+    trace.set_tracer_provider(provider)
+
+    if not NATIVE_FASTAPI_TELEMETRY:
+        from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+
+        FastAPIInstrumentor.instrument_app(
+            app, tracer_provider=provider, excluded_urls=",".join(settings.TRACING_EXCLUDED_URLS)
+        )
+{libraries_block}
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    if provider is not None:
+        # Exporte les spans encore en file avant l'arrêt du worker
+        provider.shutdown()
+'''
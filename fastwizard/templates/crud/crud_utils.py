@@ -6,6 +6,22 @@ def get_template(config):
     ModelName = config["ModelName"]
     app_name = config["app_name"]
 
+    if "orjson" in config.get("selected_modules", []):
+        # Données validées et encodées une seule fois (cœur Rust de Pydantic)
+        response_imports = """from pydantic import TypeAdapter
+from app.core.responses import json_response
+"""
+        adapters = f"""
+{model_name}_adapter = TypeAdapter({ModelName})
+{model_name}_list_adapter = TypeAdapter(list[{ModelName}])
+"""
+        wrap_one = lambda expr: f"json_response({model_name}_adapter, {expr})"
+        wrap_list = lambda expr: f"json_response({model_name}_list_adapter, {expr})"
+    else:
+        response_imports = ""
+        adapters = ""
+        wrap_one = wrap_list = lambda expr: expr
+
     return f'''"""
 FastAPI router for {ModelName}
 Generated by FastWizard
@@ -15,30 +31,30 @@ from sqlalchemy.orm import Session
 from app.database import get_db
 from app.domains.{app_name} import services as {model_name}_services
 from app.domains.{app_name}.schemas import {ModelName}, {ModelName}Create, {ModelName}Update
-
+{response_imports}
 router = APIRouter(prefix="/{model_name}s", tags=["{ModelName}"])
-
+{adapters}
 @router.get("/", response_model=list[{ModelName}])
 def read_all(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return {model_name}_services.get_{model_name}(db, skip=skip, limit=limit)
+    return {wrap_list(f"{model_name}_services.get_{model_name}(db, skip=skip, limit=limit)")}
 
 @router.get("/{{id}}", response_model={ModelName})
 def read_one(id: int, db: Session = Depends(get_db)):
     obj = {model_name}_services.get_{model_name}_by_id(db, id=id)
     if not obj:
         raise HTTPException(status_code=404, detail="{ModelName} not found")
-    return obj
+    return {wrap_one("obj")}
 
 @router.post("/", response_model={ModelName})
 def create(obj_in: {ModelName}Create, db: Session = Depends(get_db)):
-    return {model_name}_services.create_{model_name}(db, obj_in)
+    return {wrap_one(f"{model_name}_services.create_{model_name}(db, obj_in)")}
 
 @router.put("/{{id}}", response_model={ModelName})
 def update(id: int, obj_in: {ModelName}Update, db: Session = Depends(get_db)):
     db_obj = {model_name}_services.get_{model_name}_by_id(db, id=id)
     if not db_obj:
         raise HTTPException(status_code=404, detail="{ModelName} not found")
-    return {model_name}_services.update_{model_name}(db, db_obj, obj_in)
+    return {wrap_one(f"{model_name}_services.update_{model_name}(db, db_obj, obj_in)")}
 
 @router.delete("/{{id}}")
 def delete(id: int, db: Session = Depends(get_db)):
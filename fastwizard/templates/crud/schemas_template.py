@@ -18,7 +18,7 @@ def get_template(config):
 Pydantic schemas for {config["ModelName"]}
 Generated by FastWizard
 """
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 
 class {config["ModelName"]}Base(BaseModel):
@@ -33,8 +33,7 @@ class {config["ModelName"]}Update({config["ModelName"]}Base):
 class {config["ModelName"]}InDBBase({config["ModelName"]}Base):
     id: int
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class {config["ModelName"]}({config["ModelName"]}InDBBase):
     pass
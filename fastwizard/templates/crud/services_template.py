@@ -20,14 +20,14 @@ def get_{model_name}_by_id(db: Session, id: int):
     return db.query({ModelName}).filter({ModelName}.id == id).first()
 
 def create_{model_name}(db: Session, obj_in: {ModelName}Create):
-    db_obj = {ModelName}(**obj_in.dict())
+    db_obj = {ModelName}(**obj_in.model_dump())
     db.add(db_obj)
     db.commit()
     db.refresh(db_obj)
     return db_obj
 
 def update_{model_name}(db: Session, db_obj: {ModelName}, obj_in: {ModelName}Update):
-    for field, value in obj_in.dict(exclude_unset=True).items():
+    for field, value in obj_in.model_dump(exclude_unset=True).items():
         setattr(db_obj, field, value)
     db.commit()
     db.refresh(db_obj)
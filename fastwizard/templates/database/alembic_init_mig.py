@@ -34,18 +34,11 @@ def get_template(config):
         sa.Column("oauth_account_created_at", sa.DateTime(), nullable=True),
     """
     
-    if "auth-oauth-google" in selected_modules and "auth-oauth-github" in selected_modules:
-        oauth_functions += """
-        sa.Column("google_id", sa.String(length=50), nullable=True, unique=True),
-        sa.Column("github_id", sa.String(length=50), nullable=True, unique=True),
-    """
-    elif "auth-oauth-google" in selected_modules:
-        oauth_functions += """
-        sa.Column("google_id", sa.String(length=50), nullable=True, unique=True),
-    """
-    elif "auth-oauth-github" in selected_modules:
-        oauth_functions += """
-        sa.Column("github_id", sa.String(length=50), nullable=True, unique=True),
+    for module_id in selected_modules:
+        if module_id.startswith("auth-oauth-"):
+            provider = module_id[len("auth-oauth-"):]
+            oauth_functions += f"""
+        sa.Column("{provider}_id", sa.String(length=50), nullable=True, unique=True),
     """
 
     # Paramètres
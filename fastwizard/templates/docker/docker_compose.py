@@ -7,6 +7,9 @@ def get_template(config):
     selected_modules = config.get("selected_modules", [])
     db_module = next((m for m in selected_modules if m.startswith("db-")), None)
     cache_module = next((m for m in selected_modules if m.startswith("cache-")), None)
+    has_tasks = "tasks" in selected_modules
+    # Sans module de cache, la file de tâches a son propre service Redis
+    redis_service = cache_module == "cache-redis" or (has_tasks and cache_module is None)
 
     # === Configuration Base de Données ===
     if db_module == "db-mysql":
@@ -43,7 +46,7 @@ def get_template(config):
     cache_dep = ""
     cache_env = ""
 
-    if cache_module == "cache-redis":
+    if redis_service:
         cache_service = f"""
   redis:
     image: redis:7.2
@@ -57,7 +60,7 @@ def get_template(config):
     restart: unless-stopped
 """
         cache_dep = "- redis"
-        cache_env = "      - REDIS_URL=redis://redis:6379/0"
+        cache_env = "      - REDIS_URL=redis://redis:6379/0" if cache_module else ""
 
     elif cache_module == "cache-valkey":
         cache_service = f"""
@@ -75,6 +78,10 @@ def get_template(config):
         cache_dep = "- valkey"
         cache_env = "      - VALKEY_URL=valkey://valkey:6379/0"
 
+    if has_tasks:
+        tasks_host = "valkey" if cache_module == "cache-valkey" else "redis"
+        cache_env = "\n".join(line for line in (cache_env, f"      - TASKS_REDIS_URL=redis://{tasks_host}:6379/0") if line)
+
     # === Service app ===
     depends = []
     if db_image:
@@ -93,6 +100,7 @@ services:
     environment:
       - DEBUG=True
       - DOCKER_ENV=True
+      - SERVER_PROFILE=dev  # rechargement automatique avec le volume monté ; prod dans l'image
       - DATABASE_URL={database_url if database_url else ""}
 {cache_env if cache_env else ""}
       - TERM=xterm-256color  # ✅ Force le support des couleurs
@@ -108,6 +116,28 @@ services:
       - fastapi-network
 '''
 
+    # === Worker des tâches en arrière-plan (même image, mêmes variables ; --scale worker=N) ===
+    if has_tasks:
+        compose += f'''
+  worker:
+    build: .
+    command: python -m app.worker
+    environment:
+      - DOCKER_ENV=True
+      - DATABASE_URL={database_url if database_url else ""}
+{cache_env}
+      - PYTHONUNBUFFERED=1
+    volumes:
+      - .:/app
+      - ./logs:/app/logs
+    restart: unless-stopped
+    stop_grace_period: 40s  # > TASKS_SHUTDOWN_TIMEOUT : les tâches en cours se terminent
+    depends_on:
+      {depends_block}
+    networks:
+      - fastapi-network
+'''
+
     # === DB Service ===
     if db_image:
         compose += f'''
@@ -147,7 +177,7 @@ services:
     compose += "  logs_data:\n"
     if db_image:
         compose += f"  {volume_declare}\n"
-    if cache_module == "cache-redis":
+    if redis_service:
         compose += "  redis_data:\n"
     elif cache_module == "cache-valkey":
         compose += "  valkey_data:\n"
@@ -3,30 +3,77 @@
 def get_template(config):
     python_version = config.get("python_version", "3.11")
     port = config.get("port", 8000)
-    
-    return f'''FROM python:{python_version}-slim
+    selected_modules = config.get("selected_modules", [])
 
-# Définir le répertoire de travail
-WORKDIR /app
+    # Paquets système selon la base choisie : en-têtes et compilateur pour construire la wheel
+    # (builder), bibliothèque partagée seule à l'exécution (runtime).
+    # psycopg2-binary (PostgreSQL) est distribué en wheel : aucun paquet système nécessaire.
+    if "db-mysql" in selected_modules:
+        build_packages = ["build-essential", "default-libmysqlclient-dev", "pkg-config"]
+        runtime_packages = ["libmariadb3"]
+    else:
+        build_packages = []
+        runtime_packages = []
+
+    builder_apt = ""
+    if build_packages:
+        builder_apt = f'''
+# Cache apt conservé entre les builds (BuildKit) : docker-clean le viderait après chaque install
+RUN rm -f /etc/apt/apt.conf.d/docker-clean
+RUN --mount=type=cache,target=/var/cache/apt,sharing=locked \\
+    --mount=type=cache,target=/var/lib/apt,sharing=locked \\
+    apt-get update && apt-get install -y --no-install-recommends {" ".join(build_packages)}
+'''
+
+    runtime_apt = ""
+    if runtime_packages:
+        runtime_apt = f'''
+RUN apt-get update \\
+    && apt-get install -y --no-install-recommends {" ".join(runtime_packages)} \\
+    && rm -rf /var/lib/apt/lists/*
+'''
+
+    return f'''# syntax=docker/dockerfile:1
+# Build multi-étapes (BuildKit) : les wheels sont construites dans "builder" ; l'image finale
+# ne contient ni compilateur, ni en-têtes, ni cache pip.
+
+# ---------- Étape 1 : construction des wheels ----------
+FROM python:{python_version}-slim AS builder
 
-# Installer les dépendances système
-RUN apt-get update && apt-get install -y \
-    default-libmysqlclient-dev \
-    build-essential \
-    pkg-config   
+ENV PIP_DISABLE_PIP_VERSION_CHECK=1
+{builder_apt}
+WORKDIR /build
 
-# Copier les fichiers de dépendances
+# Seul requirements.txt invalide cette couche : modifier le code ne reconstruit pas les wheels
 COPY requirements.txt .
+RUN --mount=type=cache,target=/root/.cache/pip \\
+    pip wheel --wheel-dir /wheels -r requirements.txt
 
-# Installer les dépendances Python
-RUN pip install --no-cache-dir -r requirements.txt
+# ---------- Étape 2 : image d'exécution ----------
+FROM python:{python_version}-slim
 
-# Copier le code source
+ENV PYTHONUNBUFFERED=1 \\
+    PIP_DISABLE_PIP_VERSION_CHECK=1 \\
+    PIP_NO_CACHE_DIR=1
+{runtime_apt}
+WORKDIR /app
+
+# Installation depuis les wheels du builder, montées le temps du RUN (absentes de l'image)
+COPY requirements.txt .
+RUN --mount=type=bind,from=builder,source=/wheels,target=/wheels \\
+    pip install --no-index --find-links=/wheels -r requirements.txt
+
+# Copier le code source puis précompiler le bytecode : pas de compilation au démarrage
 COPY . .
+RUN python -m compileall -q -j 0 .
+
+# Profil de production : workers selon le quota CPU, uvloop + httptools (voir server.py)
+ENV SERVER_PROFILE=prod \\
+    PORT={port}
 
 # Exposer le port
 EXPOSE {port}
 
-# Commande par défaut
-CMD ["uvicorn", "main:app", "--host", "0.0.0.0", "--port", "{port}", "--use-colors"]
-'''
\ No newline at end of file
+# Commande par défaut (exec : SIGTERM arrive directement à Uvicorn pour l'arrêt gracieux)
+CMD ["python", "server.py"]
+'''
@@ -4,9 +4,9 @@ def get_template(config):
 .git
 .gitignore
 
-# Python
-__pycache__/
-*.py[cod]
+# Python (à tous les niveaux : un .pyc local invaliderait la couche COPY)
+**/__pycache__/
+**/*.py[cod]
 *$py.class
 *.so
 .Python
@@ -28,6 +28,7 @@ wheels/
 MANIFEST
 
 # Virtual environments
+.venv/
 venv/
 env/
 ENV/
@@ -49,7 +50,10 @@ Thumbs.db
 .env.local
 .env.production
 *.log
+logs/
 temp/
+.mypy_cache/
+.ruff_cache/
 
 # Database
 *.db
@@ -2,15 +2,8 @@
 
 def get_template(config):
     return f'''
-from fastapi import APIRouter, HTTPException
-from .brevo_service import service  # doit correspondre au service généré
+from .brevo_service import outbox  # doit correspondre au service généré
+from .routes import build_mail_router
 
-router = APIRouter()
-
-@router.post("/send")
-async def send_email(to_email: str, subject: str, body: str):
-    success = service.send_email(to_email, subject, body)
-    if not success:
-        raise HTTPException(status_code=500, detail="Erreur lors de l'envoi")
-    return {{"status": "sent", "service": "brevo"}}
+router = build_mail_router("brevo", outbox)
 '''
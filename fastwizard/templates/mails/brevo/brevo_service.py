@@ -1,34 +1,63 @@
 """Template pour le service Brevo"""
 
 def get_template(config):
-    return f'''
-BREVO_API_KEY = "{config.get('brevo_api_key', 'YOUR_BREVO_API_KEY')}"
-BREVO_SENDER_EMAIL = "{config.get('brevo_sender_email', 'no-reply@example.com')}"
-BREVO_SENDER_NAME = "{config.get('brevo_sender_name', 'FastAPI App')}"
-
-import requests
-
-class BrevoService:
-    def send_email(self, to_email: str, subject: str, body: str):
-        url = "https://api.brevo.com/v3/smtp/email"
-        payload = {{
-            "sender": {{
-                "email": BREVO_SENDER_EMAIL,
-                "name": BREVO_SENDER_NAME
-            }},
-            "to": [{{"email": to_email}}],
-            "subject": subject,
-            "textContent": body
-        }}
-        headers = {{
-            "accept": "application/json",
-            "api-key": BREVO_API_KEY,
-            "content-type": "application/json"
+    return f'''"""
+Fournisseur Brevo (API v3) pour l'interface MailSender.
+Automatically generated by FastWizard 🧙‍♂️
+
+Un lot de l'outbox part en un seul appel : une version de message
+(messageVersions) par destinataire. MAIL_PROVIDER=file|smtp remplace
+Brevo par un bouchon local.
+"""
+import os
+from typing import Any, Dict, List, Optional
+
+import httpx
+from dotenv import load_dotenv
+
+from .outbox import MAIL_BATCH_SIZE, MailOutbox, mail_lifespan
+from .sender import HttpMailSender, MailMessage, create_sender, register_provider
+
+load_dotenv()
+
+BREVO_API_KEY = os.getenv("BREVO_API_KEY", "{config.get('brevo_api_key', 'YOUR_BREVO_API_KEY')}")
+BREVO_SENDER_EMAIL = os.getenv("BREVO_SENDER_EMAIL", "{config.get('brevo_sender_email', 'no-reply@example.com')}")
+BREVO_SENDER_NAME = os.getenv("BREVO_SENDER_NAME", "{config.get('brevo_sender_name', 'FastAPI App')}")
+# Surchargeable pour pointer vers un serveur bouchon local
+BREVO_API_URL = os.getenv("BREVO_API_URL", "https://api.brevo.com/v3")
+
+
+@register_provider("brevo")
+class BrevoSender(HttpMailSender):
+    path = "/smtp/email"
+    max_batch = 1000  # messageVersions par appel
+
+    def __init__(self, base_url: str = BREVO_API_URL, transport: Optional[httpx.AsyncBaseTransport] = None):
+        super().__init__(
+            base_url,
+            transport=transport,
+            headers={{"accept": "application/json", "api-key": BREVO_API_KEY}},
+        )
+
+    @staticmethod
+    def _content(message: MailMessage) -> Dict[str, Any]:
+        content = {{"subject": message.subject, "textContent": message.body}}
+        if message.html:
+            content["htmlContent"] = message.html
+        return content
+
+    def build_payload(self, messages: List[MailMessage]) -> Dict[str, Any]:
+        return {{
+            "sender": {{"email": BREVO_SENDER_EMAIL, "name": BREVO_SENDER_NAME}},
+            **self._content(messages[0]),
+            "messageVersions": [
+                {{"to": [{{"email": message.to_email}}], **self._content(message)}}
+                for message in messages
+            ],
         }}
-        response = requests.post(url, json=payload, headers=headers)
-        print("Statut:", response.status_code)
-        print("Réponse:", response.json())
-        return response.status_code == 200
 
-service = BrevoService()
-'''   
\ No newline at end of file
+
+service = create_sender("brevo")
+outbox = MailOutbox("brevo", service.send_batch, batch_size=min(MAIL_BATCH_SIZE, service.max_batch))
+lifespan = mail_lifespan(service, outbox)
+'''
@@ -0,0 +1,15 @@
+"""Template pour la version HTML de l'email d'exemple (Jinja2)"""
+
+def get_template(config):
+    return '''<!DOCTYPE html>
+<html lang="fr">
+  <body style="font-family: Arial, sans-serif; color: #222;">
+    <h1>Bonjour {{ username }},</h1>
+    <p>Votre compte a bien été créé.</p>
+    {% if login_url is defined %}
+    <p><a href="{{ login_url }}">Se connecter</a></p>
+    {% endif %}
+    <p>— L'équipe</p>
+  </body>
+</html>
+'''
@@ -0,0 +1,5 @@
+"""Template pour le sujet de l'email d'exemple (Jinja2)"""
+
+def get_template(config):
+    return '''Bienvenue {{ username }} !
+'''
@@ -0,0 +1,13 @@
+"""Template pour la version texte de l'email d'exemple (Jinja2)"""
+
+def get_template(config):
+    return '''Bonjour {{ username }},
+
+Votre compte a bien été créé.
+{% if login_url is defined %}
+Connectez-vous : {{ login_url }}
+{% endif %}
+
+--
+L'équipe
+'''
@@ -6,35 +6,62 @@ def get_template(config):
     mailjet_sender_email = config.get('mailjet_sender_email', 'no-reply@example.com')
     mailjet_sender_name = config.get('mailjet_sender_name', 'FastAPI App')
 
-    return f'''
-MAILJET_API_KEY = "{mailjet_api_key}"
-MAILJET_API_SECRET = "{mailjet_api_secret}"
-MAILJET_SENDER_EMAIL = "{mailjet_sender_email}"
-MAILJET_SENDER_NAME = "{mailjet_sender_name}"
-
-import requests
-
-class MailjetService:
-    def send_email(self, to_email: str, subject: str, body: str):
-        url = "https://api.mailjet.com/v3.1/send"
-        data = {{
-            "Messages": [
-                {{
-                    "From": {{
-                        "Email": MAILJET_SENDER_EMAIL,
-                        "Name": MAILJET_SENDER_NAME
-                    }},
-                    "To": [{{"Email": to_email}}],
-                    "Subject": subject,
-                    "TextPart": body
-                }}
-            ]
-        }}
-        auth = (MAILJET_API_KEY, MAILJET_API_SECRET)
-        response = requests.post(url, json=data, auth=auth)
-        print("Statut:", response.status_code)
-        print("Réponse:", response.json())
-        return response.status_code == 200
-
-service = MailjetService()
-'''   
\ No newline at end of file
+    return f'''"""
+Fournisseur Mailjet (API v3.1) pour l'interface MailSender.
+Automatically generated by FastWizard 🧙‍♂️
+
+Un lot de l'outbox part en un seul appel (plusieurs Messages).
+MAIL_PROVIDER=file|smtp remplace Mailjet par un bouchon local.
+"""
+import os
+from typing import Any, Dict, List, Optional
+
+import httpx
+from dotenv import load_dotenv
+
+from .outbox import MAIL_BATCH_SIZE, MailOutbox, mail_lifespan
+from .sender import HttpMailSender, MailMessage, create_sender, register_provider
+
+load_dotenv()
+
+MAILJET_API_KEY = os.getenv("MAILJET_API_KEY", "{mailjet_api_key}")
+MAILJET_API_SECRET = os.getenv("MAILJET_API_SECRET", "{mailjet_api_secret}")
+MAILJET_SENDER_EMAIL = os.getenv("MAILJET_SENDER_EMAIL", "{mailjet_sender_email}")
+MAILJET_SENDER_NAME = os.getenv("MAILJET_SENDER_NAME", "{mailjet_sender_name}")
+# Surchargeable pour pointer vers un serveur bouchon local
+MAILJET_API_URL = os.getenv("MAILJET_API_URL", "https://api.mailjet.com/v3.1")
+
+
+@register_provider("mailjet")
+class MailjetSender(HttpMailSender):
+    path = "/send"
+    max_batch = 50  # Messages par appel v3.1
+
+    def __init__(self, base_url: str = MAILJET_API_URL, transport: Optional[httpx.AsyncBaseTransport] = None):
+        super().__init__(
+            base_url,
+            transport=transport,
+            auth=(MAILJET_API_KEY, MAILJET_API_SECRET),
+            headers={{"accept": "application/json"}},
+        )
+
+    def build_payload(self, messages: List[MailMessage]) -> Dict[str, Any]:
+        payload = []
+        for message in messages:
+            item = {{
+                "From": {{"Email": MAILJET_SENDER_EMAIL, "Name": MAILJET_SENDER_NAME}},
+                "To": [{{"Email": message.to_email}}],
+                "Subject": message.subject,
+                "TextPart": message.body,
+                "CustomID": message.id,
+            }}
+            if message.html:
+                item["HTMLPart"] = message.html
+            payload.append(item)
+        return {{"Messages": payload}}
+
+
+service = create_sender("mailjet")
+outbox = MailOutbox("mailjet", service.send_batch, batch_size=min(MAIL_BATCH_SIZE, service.max_batch))
+lifespan = mail_lifespan(service, outbox)
+'''
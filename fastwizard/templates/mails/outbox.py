@@ -0,0 +1,501 @@
+"""Template pour la file d'envoi (outbox) des emails"""
+
+def get_template(config):
+    selected_modules = config.get("selected_modules", [])
+
+    # File durable Redis Streams : on réutilise l'instance du cache si elle existe
+    if "cache-valkey" in selected_modules:
+        redis_url = "redis://valkey:6379/0"
+    elif "cache-redis" in selected_modules:
+        redis_url = "redis://redis:6379/0"
+    else:
+        redis_url = "redis://localhost:6379/0"
+
+    has_db = any(module.startswith("db-") for module in selected_modules)
+
+    if has_db:
+        db_doc = '- "db"     : table mail_outbox (durable, SELECT ... FOR UPDATE SKIP LOCKED)\n'
+        db_imports = '''from datetime import datetime, timedelta
+
+from sqlalchemy import Column, DateTime, Integer, String, Text, UniqueConstraint, select, update
+from sqlalchemy.exc import IntegrityError
+
+from app.database import Base, SessionLocal, engine
+'''
+        db_queue = '''
+
+class MailOutboxRecord(Base):
+    __tablename__ = "mail_outbox"
+    __table_args__ = (UniqueConstraint("provider", "idempotency_key", name="uq_mail_outbox_idempotency"),)
+
+    id = Column(Integer, primary_key=True)
+    provider = Column(String(50), nullable=False, index=True)
+    idempotency_key = Column(String(255), nullable=True)
+    payload = Column(Text, nullable=False)
+    status = Column(String(20), nullable=False, default="pending", index=True)
+    error = Column(Text, nullable=True)
+    locked_until = Column(DateTime, nullable=True)
+    claimed_by = Column(String(32), nullable=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = Column(DateTime, nullable=True)
+
+
+class DatabaseQueue(OutboxQueue):
+    """Table mail_outbox : chaque worker réserve un lot de lignes pour MAIL_CLAIM_IDLE
+    secondes ; un lot non acquitté (worker arrêté) redevient visible ensuite.
+    La contrainte unique (provider, idempotency_key) assure la déduplication."""
+
+    durable = True
+
+    def __init__(self, name: str):
+        self.name = name
+
+    async def start(self):
+        # Session synchrone : les accès passent par un thread pour ne pas bloquer la boucle
+        await asyncio.to_thread(Base.metadata.create_all, bind=engine, tables=[MailOutboxRecord.__table__])
+
+    async def put(self, message: MailMessage) -> bool:
+        return await asyncio.to_thread(self._insert, message)
+
+    def _insert(self, message: MailMessage) -> bool:
+        with SessionLocal() as db:
+            db.add(MailOutboxRecord(
+                provider=self.name,
+                idempotency_key=message.idempotency_key,
+                payload=message.to_json(),
+            ))
+            try:
+                db.commit()
+            except IntegrityError:
+                db.rollback()
+                return False
+        return True
+
+    async def get_batch(self, max_size: int, wait: float) -> List[MailMessage]:
+        while True:
+            batch = await asyncio.to_thread(self._claim, max_size)
+            if batch:
+                return batch
+            await asyncio.sleep(MAIL_POLL_INTERVAL)
+
+    def _claim(self, max_size: int) -> List[MailMessage]:
+        now = datetime.utcnow()
+        token = uuid.uuid4().hex
+        available = (
+            (MailOutboxRecord.status == "pending")
+            & ((MailOutboxRecord.locked_until.is_(None)) | (MailOutboxRecord.locked_until < now))
+        )
+        with SessionLocal() as db:
+            ids = db.execute(
+                select(MailOutboxRecord.id)
+                .where(MailOutboxRecord.provider == self.name, available)
+                .order_by(MailOutboxRecord.id)
+                .limit(max_size)
+                .with_for_update(skip_locked=True)
+            ).scalars().all()
+            if not ids:
+                return []
+            # UPDATE conditionnel : sans SKIP LOCKED (SQLite), un seul worker gagne chaque ligne
+            db.execute(
+                update(MailOutboxRecord)
+                .where(MailOutboxRecord.id.in_(ids), available)
+                .values(locked_until=now + timedelta(seconds=MAIL_CLAIM_IDLE), claimed_by=token)
+            )
+            db.commit()
+            rows = db.execute(
+                select(MailOutboxRecord.id, MailOutboxRecord.payload)
+                .where(MailOutboxRecord.id.in_(ids), MailOutboxRecord.claimed_by == token)
+                .order_by(MailOutboxRecord.id)
+            ).all()
+        messages = []
+        for row_id, payload in rows:
+            message = MailMessage.from_json(payload)
+            message.receipt = row_id
+            messages.append(message)
+        return messages
+
+    def _mark(self, messages: List[MailMessage], status: str, error: Optional[str] = None):
+        now = datetime.utcnow()
+        with SessionLocal() as db:
+            db.execute(
+                update(MailOutboxRecord)
+                .where(MailOutboxRecord.id.in_([message.receipt for message in messages]))
+                .values(status=status, error=error, locked_until=None, updated_at=now)
+            )
+            # Les lignes envoyées ne servent plus qu'à la déduplication
+            db.execute(
+                MailOutboxRecord.__table__.delete().where(
+                    MailOutboxRecord.provider == self.name,
+                    MailOutboxRecord.status == "sent",
+                    MailOutboxRecord.updated_at < now - timedelta(seconds=MAIL_IDEMPOTENCY_TTL),
+                )
+            )
+            db.commit()
+
+    async def ack(self, messages: List[MailMessage]):
+        await asyncio.to_thread(self._mark, messages, "sent")
+
+    async def fail(self, messages: List[MailMessage], error: str):
+        await asyncio.to_thread(self._mark, messages, "failed", error)
+'''
+        db_factory = '''    if backend == "db":
+        return DatabaseQueue(name)
+'''
+    else:
+        db_doc = ""
+        db_imports = ""
+        db_queue = ""
+        db_factory = ""
+
+    return f'''"""
+File d'envoi (outbox) des emails.
+Automatically generated by FastWizard 🧙‍♂️
+
+Les routes /send déposent le message dans la file et répondent
+immédiatement (202). Des workers asynchrones regroupent les messages par
+lots, les envoient en un seul appel au fournisseur et réessaient avec un
+backoff exponentiel (jitter complet) en cas d'erreur transitoire.
+Un en-tête Idempotency-Key évite d'envoyer deux fois le même email.
+
+Backend de file choisi par MAIL_QUEUE_BACKEND :
+- "memory" : asyncio.Queue dans le processus (perdue au redémarrage)
+- "redis"  : Redis/Valkey Streams + groupe de consommateurs (durable, multi-workers)
+{db_doc}"""
+import asyncio
+import logging
+import os
+import random
+import socket
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import asynccontextmanager, suppress
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from dotenv import load_dotenv
+from fastapi import FastAPI
+{db_imports}
+from .sender import MailMessage, MailSender, PermanentMailError
+
+load_dotenv()
+
+MAIL_QUEUE_BACKEND = os.getenv("MAIL_QUEUE_BACKEND", "memory")
+MAIL_QUEUE_URL = os.getenv("MAIL_QUEUE_URL", "{redis_url}")
+MAIL_QUEUE_MAXSIZE = int(os.getenv("MAIL_QUEUE_MAXSIZE", "10000"))
+MAIL_WORKERS = int(os.getenv("MAIL_WORKERS", "2"))
+# Taille max d'un lot (Mailjet v3.1 : 50 messages par appel) et attente pour le remplir
+MAIL_BATCH_SIZE = int(os.getenv("MAIL_BATCH_SIZE", "50"))
+MAIL_BATCH_WAIT = float(os.getenv("MAIL_BATCH_WAIT", "0.05"))
+MAIL_MAX_RETRIES = int(os.getenv("MAIL_MAX_RETRIES", "5"))
+MAIL_RETRY_BASE = float(os.getenv("MAIL_RETRY_BASE", "0.5"))
+MAIL_RETRY_MAX = float(os.getenv("MAIL_RETRY_MAX", "30"))
+MAIL_IDEMPOTENCY_TTL = int(os.getenv("MAIL_IDEMPOTENCY_TTL", "86400"))
+# Files durables : délai avant reprise d'un lot non acquitté, et attente entre deux scrutations
+MAIL_CLAIM_IDLE = float(os.getenv("MAIL_CLAIM_IDLE", "60"))
+MAIL_POLL_INTERVAL = float(os.getenv("MAIL_POLL_INTERVAL", "1"))
+MAIL_DRAIN_TIMEOUT = float(os.getenv("MAIL_DRAIN_TIMEOUT", "10"))
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxFull(Exception):
+    """La file en mémoire a atteint MAIL_QUEUE_MAXSIZE."""
+
+
+def backoff_delay(attempt: int) -> float:
+    """Backoff exponentiel plafonné avec jitter complet."""
+    return random.uniform(0, min(MAIL_RETRY_MAX, MAIL_RETRY_BASE * 2 ** attempt))
+
+
+class OutboxQueue:
+    """Interface commune des files d'envoi."""
+
+    # Une file durable conserve les messages non acquittés après un arrêt
+    durable = False
+
+    async def start(self):
+        pass
+
+    async def stop(self):
+        pass
+
+    async def drain(self, timeout: float):
+        """Attend que les messages en attente soient traités (files non durables)."""
+
+    async def put(self, message: MailMessage) -> bool:
+        """Ajoute un message ; renvoie False si sa clé d'idempotence a déjà été vue."""
+        raise NotImplementedError
+
+    async def get_batch(self, max_size: int, wait: float) -> List[MailMessage]:
+        raise NotImplementedError
+
+    async def ack(self, messages: List[MailMessage]):
+        pass
+
+    async def fail(self, messages: List[MailMessage], error: str):
+        logger.error("Mail batch dropped (%d messages): %s", len(messages), error)
+
+    def depth(self) -> Optional[int]:
+        return None
+
+
+class MemoryQueue(OutboxQueue):
+    def __init__(self, maxsize: int = MAIL_QUEUE_MAXSIZE):
+        self.queue: "asyncio.Queue[MailMessage]" = asyncio.Queue(maxsize)
+        # Clés d'idempotence vues récemment -> expiration (ordre d'insertion = ordre d'expiration)
+        self.seen: "OrderedDict[str, float]" = OrderedDict()
+
+    def _is_duplicate(self, key: str) -> bool:
+        now = time.monotonic()
+        while self.seen:
+            oldest, expires = next(iter(self.seen.items()))
+            if expires > now:
+                break
+            self.seen.popitem(last=False)
+        if key in self.seen:
+            return True
+        self.seen[key] = now + MAIL_IDEMPOTENCY_TTL
+        return False
+
+    async def put(self, message: MailMessage) -> bool:
+        if message.idempotency_key and self._is_duplicate(message.idempotency_key):
+            return False
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.seen.pop(message.idempotency_key, None)
+            raise OutboxFull("mail outbox is full")
+        return True
+
+    async def get_batch(self, max_size: int, wait: float) -> List[MailMessage]:
+        batch = [await self.queue.get()]
+        # Lot incomplet : on laisse un court délai aux messages suivants
+        if self.queue.qsize() < max_size - 1 and wait > 0:
+            await asyncio.sleep(wait)
+        while len(batch) < max_size:
+            try:
+                batch.append(self.queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return batch
+
+    async def ack(self, messages: List[MailMessage]):
+        for _ in messages:
+            self.queue.task_done()
+
+    async def fail(self, messages: List[MailMessage], error: str):
+        await super().fail(messages, error)
+        await self.ack(messages)
+
+    async def drain(self, timeout: float):
+        with suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self.queue.join(), timeout)
+        if self.queue.qsize():
+            logger.warning("Mail outbox stopped with %d unsent messages", self.queue.qsize())
+
+    def depth(self) -> Optional[int]:
+        return self.queue.qsize()
+
+
+class RedisStreamQueue(OutboxQueue):
+    """Un stream par fournisseur lu par un groupe de consommateurs : chaque message
+    est traité par un seul worker, et les lots non acquittés d'un worker arrêté
+    sont repris (XAUTOCLAIM) après MAIL_CLAIM_IDLE secondes."""
+
+    durable = True
+
+    def __init__(self, name: str, url: str = MAIL_QUEUE_URL):
+        self.url = url
+        self.stream = f"mail:outbox:{{name}}"
+        self.dead_letters = f"mail:outbox:{{name}}:dead"
+        self.idempotency_prefix = f"mail:idempotency:{{name}}:"
+        self.group = "mail-workers"
+        self.consumer = f"{{socket.gethostname()}}-{{os.getpid()}}"
+        self.redis = None
+
+    async def start(self):
+        import redis.asyncio as redis
+
+        self.redis = redis.from_url(self.url, decode_responses=True)
+        try:
+            await self.redis.xgroup_create(self.stream, self.group, id="0", mkstream=True)
+        except redis.ResponseError as exc:
+            if "BUSYGROUP" not in str(exc):
+                raise
+
+    async def stop(self):
+        if self.redis is not None:
+            await self.redis.aclose()
+            self.redis = None
+
+    async def put(self, message: MailMessage) -> bool:
+        key = message.idempotency_key
+        if key and not await self.redis.set(self.idempotency_prefix + key, message.id, nx=True, ex=MAIL_IDEMPOTENCY_TTL):
+            return False
+        try:
+            await self.redis.xadd(self.stream, {{"data": message.to_json()}})
+        except Exception:
+            if key:
+                await self.redis.delete(self.idempotency_prefix + key)
+            raise
+        return True
+
+    async def get_batch(self, max_size: int, wait: float) -> List[MailMessage]:
+        claimed = await self.redis.xautoclaim(
+            self.stream, self.group, self.consumer,
+            min_idle_time=int(MAIL_CLAIM_IDLE * 1000), start_id="0-0", count=max_size,
+        )
+        entries = claimed[1]
+        if not entries:
+            response = await self.redis.xreadgroup(
+                self.group, self.consumer, {{self.stream: ">"}},
+                count=max_size, block=int(MAIL_POLL_INTERVAL * 1000),
+            )
+            entries = response[0][1] if response else []
+            # Lot incomplet : on laisse un court délai aux messages suivants
+            if entries and len(entries) < max_size and wait > 0:
+                await asyncio.sleep(wait)
+                response = await self.redis.xreadgroup(
+                    self.group, self.consumer, {{self.stream: ">"}}, count=max_size - len(entries),
+                )
+                entries += response[0][1] if response else []
+        batch = []
+        for entry_id, fields in entries:
+            if not fields:  # entrée supprimée entre-temps
+                continue
+            message = MailMessage.from_json(fields["data"])
+            message.receipt = entry_id
+            batch.append(message)
+        return batch
+
+    async def ack(self, messages: List[MailMessage]):
+        ids = [message.receipt for message in messages]
+        await self.redis.xack(self.stream, self.group, *ids)
+        await self.redis.xdel(self.stream, *ids)
+
+    async def fail(self, messages: List[MailMessage], error: str):
+        await super().fail(messages, error)
+        for message in messages:
+            await self.redis.xadd(self.dead_letters, {{"data": message.to_json(), "error": error}})
+        await self.ack(messages)
+{db_queue}
+
+def create_queue(name: str, backend: str = MAIL_QUEUE_BACKEND) -> OutboxQueue:
+    if backend == "redis":
+        return RedisStreamQueue(name)
+{db_factory}    if backend != "memory":
+        raise ValueError(f"Unknown MAIL_QUEUE_BACKEND: {{backend}}")
+    return MemoryQueue()
+
+
+SendBatch = Callable[[List[MailMessage]], Awaitable[None]]
+
+
+class MailOutbox:
+    """Workers qui vident une file d'envoi par lots vers un fournisseur."""
+
+    def __init__(
+        self,
+        name: str,
+        send_batch: SendBatch,
+        queue: Optional[OutboxQueue] = None,
+        workers: int = MAIL_WORKERS,
+        batch_size: int = MAIL_BATCH_SIZE,
+    ):
+        self.name = name
+        self.send_batch = send_batch
+        self.queue = queue or create_queue(name)
+        self.workers = workers
+        self.batch_size = batch_size
+        self.stats: Dict[str, int] = {{"queued": 0, "duplicates": 0, "batches": 0, "sent": 0, "retries": 0, "failed": 0}}
+        self._tasks: List[asyncio.Task] = []
+        self._closing = False
+
+    async def start(self):
+        if self._tasks:
+            return
+        self._closing = False
+        await self.queue.start()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self):
+        await self.queue.drain(MAIL_DRAIN_TIMEOUT)
+        self._closing = True
+        if self._tasks and self.queue.durable:
+            # Les lectures rendent la main après MAIL_POLL_INTERVAL : on laisse finir les lots
+            # en cours plutôt que de les annuler (ils seraient renvoyés après reprise)
+            await asyncio.wait(self._tasks, timeout=MAIL_DRAIN_TIMEOUT)
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+        self._tasks = []
+        await self.queue.stop()
+
+    async def enqueue(self, message: MailMessage) -> bool:
+        """Dépose un message ; renvoie False s'il s'agit d'un doublon."""
+        queued = await self.queue.put(message)
+        self.stats["queued" if queued else "duplicates"] += 1
+        return queued
+
+    async def _worker(self):
+        while not self._closing:
+            try:
+                batch = await self.queue.get_batch(self.batch_size, MAIL_BATCH_WAIT)
+                if batch:
+                    await self._deliver(batch)
+            except Exception:
+                # File indisponible (Redis, base) : on ne perd pas le worker
+                logger.exception("Mail outbox %s: queue error", self.name)
+                await asyncio.sleep(MAIL_POLL_INTERVAL)
+
+    async def _deliver(self, batch: List[MailMessage]):
+        self.stats["batches"] += 1
+        for attempt in range(MAIL_MAX_RETRIES + 1):
+            try:
+                await self.send_batch(batch)
+            except PermanentMailError as exc:
+                error = str(exc)
+                if len(batch) > 1:
+                    # Un seul destinataire invalide peut faire refuser tout le lot :
+                    # renvoi message par message, seul le fautif part en échec
+                    logger.warning("Mail outbox %s: batch of %d rejected (%s), sending one by one", self.name, len(batch), error)
+                    for message in batch:
+                        await self._deliver([message])
+                    return
+                break
+            except Exception as exc:
+                error = str(exc) or exc.__class__.__name__
+                if attempt == MAIL_MAX_RETRIES:
+                    break
+                self.stats["retries"] += 1
+                delay = backoff_delay(attempt)
+                logger.warning("Mail outbox %s: attempt %d failed (%s), retrying in %.2fs", self.name, attempt + 1, error, delay)
+                await asyncio.sleep(delay)
+            else:
+                self.stats["sent"] += len(batch)
+                await self.queue.ack(batch)
+                return
+        self.stats["failed"] += len(batch)
+        await self.queue.fail(batch, error)
+
+    def metrics(self) -> Dict[str, Any]:
+        return {{**self.stats, "backend": self.queue.__class__.__name__, "depth": self.queue.depth()}}
+
+
+def mail_lifespan(service: MailSender, outbox: MailOutbox):
+    """Lifespan FastAPI : client du fournisseur puis workers de l'outbox."""
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        await service.start()
+        await outbox.start()
+        try:
+            yield
+        finally:
+            await outbox.stop()
+            await service.close()
+
+    return lifespan
+'''
@@ -0,0 +1,120 @@
+"""Template pour le moteur de rendu Jinja2 des emails"""
+
+def get_template(config):
+    return '''"""
+Rendu des emails avec Jinja2.
+Automatically generated by FastWizard 🧙‍♂️
+
+Les gabarits vivent dans MAIL_TEMPLATES_DIR : `<nom>.txt` (obligatoire),
+`<nom>.html` et `<nom>.subject` (optionnels). Rien n'est reparsé à chaque message :
+- l'Environment garde les gabarits compilés en mémoire (MAIL_TEMPLATE_CACHE_SIZE),
+  et les parties statiques y sont déjà des chaînes constantes ;
+- MAIL_TEMPLATE_BYTECODE_DIR conserve le bytecode compilé entre deux démarrages ;
+- un gabarit sans aucune variable n'est rendu qu'une fois ;
+- l'absence d'un gabarit optionnel est mémorisée (pas d'accès disque par message).
+"""
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from dotenv import load_dotenv
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    StrictUndefined,
+    Template,
+    TemplateNotFound,
+    meta,
+    select_autoescape,
+)
+
+from .sender import MailMessage
+
+load_dotenv()
+
+MAIL_TEMPLATES_DIR = os.getenv("MAIL_TEMPLATES_DIR", str(Path(__file__).resolve().parents[2] / "templates" / "mails"))
+MAIL_TEMPLATE_CACHE_SIZE = int(os.getenv("MAIL_TEMPLATE_CACHE_SIZE", "400"))
+# En développement, relit les gabarits modifiés sur le disque
+MAIL_TEMPLATE_AUTO_RELOAD = os.getenv("MAIL_TEMPLATE_AUTO_RELOAD", "false").lower() == "true"
+MAIL_TEMPLATE_BYTECODE_DIR = os.getenv("MAIL_TEMPLATE_BYTECODE_DIR", "")
+
+
+class MailRenderer:
+    def __init__(self, directory: str = MAIL_TEMPLATES_DIR, globals: Optional[Dict[str, Any]] = None):
+        bytecode_cache = None
+        if MAIL_TEMPLATE_BYTECODE_DIR:
+            Path(MAIL_TEMPLATE_BYTECODE_DIR).mkdir(parents=True, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(MAIL_TEMPLATE_BYTECODE_DIR)
+        self.env = Environment(
+            loader=FileSystemLoader(directory),
+            autoescape=select_autoescape(["html"]),
+            undefined=StrictUndefined,
+            cache_size=MAIL_TEMPLATE_CACHE_SIZE,
+            auto_reload=MAIL_TEMPLATE_AUTO_RELOAD,
+            bytecode_cache=bytecode_cache,
+            trim_blocks=True,
+            lstrip_blocks=True,
+        )
+        self.env.globals.update(globals or {})
+        self._static: Dict[str, Optional[str]] = {}
+        self._exists: Dict[str, bool] = {}
+
+    def _static_output(self, name: str, template: Template) -> Optional[str]:
+        """Rendu mémorisé si le gabarit n'utilise ni variable ni autre gabarit."""
+        if name not in self._static:
+            source, _, _ = self.env.loader.get_source(self.env, name)
+            ast = self.env.parse(source)
+            if meta.find_undeclared_variables(ast) - set(self.env.globals) or list(meta.find_referenced_templates(ast)):
+                self._static[name] = None
+            else:
+                self._static[name] = template.render()
+        return self._static[name]
+
+    def render(self, name: str, context: Optional[Dict[str, Any]] = None) -> str:
+        template = self.env.get_template(name)
+        if not MAIL_TEMPLATE_AUTO_RELOAD:
+            output = self._static_output(name, template)
+            if output is not None:
+                return output
+        return template.render(**(context or {}))
+
+    def exists(self, name: str) -> bool:
+        if MAIL_TEMPLATE_AUTO_RELOAD or name not in self._exists:
+            if len(self._exists) >= MAIL_TEMPLATE_CACHE_SIZE:
+                self._exists.clear()  # noms arbitraires reçus par l'API : cache borné
+            try:
+                self.env.get_template(name)
+                self._exists[name] = True
+            except TemplateNotFound:
+                self._exists[name] = False
+        return self._exists[name]
+
+    def render_message(
+        self,
+        template: str,
+        to_email: str,
+        context: Optional[Dict[str, Any]] = None,
+        subject: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> MailMessage:
+        """Construit le MailMessage du gabarit `template`.
+
+        Le sujet vient de `<template>.subject` s'il existe ; sinon `subject` est
+        utilisé tel quel (jamais interprété comme un gabarit).
+        """
+        context = context or {}
+        if self.exists(f"{template}.subject"):
+            subject = self.render(f"{template}.subject", context).strip()
+        html = self.render(f"{template}.html", context) if self.exists(f"{template}.html") else None
+        return MailMessage(
+            to_email=to_email,
+            subject=subject or "",
+            body=self.render(f"{template}.txt", context),
+            html=html,
+            idempotency_key=idempotency_key,
+        )
+
+
+renderer = MailRenderer()
+'''
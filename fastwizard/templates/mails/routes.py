@@ -0,0 +1,57 @@
+"""Template pour les routes d'envoi d'emails communes aux fournisseurs"""
+
+def get_template(config):
+    return '''"""
+Routes d'envoi d'emails, identiques pour chaque fournisseur.
+Automatically generated by FastWizard 🧙‍♂️
+"""
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException
+from jinja2 import TemplateNotFound, UndefinedError
+
+from .outbox import MailOutbox, OutboxFull
+from .renderer import renderer
+from .schemas import MailQueuedResponse, TemplateMailRequest
+from .sender import MailMessage
+
+
+def build_mail_router(service: str, outbox: MailOutbox) -> APIRouter:
+    router = APIRouter()
+
+    async def enqueue(message: MailMessage) -> MailQueuedResponse:
+        try:
+            queued = await outbox.enqueue(message)
+        except OutboxFull:
+            raise HTTPException(status_code=503, detail="File d'envoi pleine, réessayez plus tard")
+        return MailQueuedResponse(status="queued" if queued else "duplicate", service=service)
+
+    @router.post("/send", status_code=202, response_model=MailQueuedResponse)
+    async def send_email(to_email: str, subject: str, body: str, idempotency_key: Optional[str] = Header(None)):
+        """Dépose l'email dans l'outbox et répond sans attendre le fournisseur."""
+        return await enqueue(MailMessage(to_email, subject, body, idempotency_key=idempotency_key))
+
+    @router.post("/send-template", status_code=202, response_model=MailQueuedResponse)
+    async def send_template(payload: TemplateMailRequest, idempotency_key: Optional[str] = Header(None)):
+        """Rend un gabarit Jinja2 (compilé une seule fois) puis dépose l'email dans l'outbox."""
+        try:
+            message = renderer.render_message(
+                payload.template,
+                payload.to_email,
+                payload.context,
+                subject=payload.subject,
+                idempotency_key=idempotency_key,
+            )
+        except TemplateNotFound:
+            raise HTTPException(status_code=404, detail=f"Gabarit introuvable : {payload.template}")
+        except UndefinedError as exc:
+            raise HTTPException(status_code=422, detail=f"Variable manquante dans le contexte : {exc.message}")
+        return await enqueue(message)
+
+    @router.get("/outbox")
+    async def outbox_metrics():
+        """Compteurs de l'outbox : messages en file, envoyés, réessais, échecs."""
+        return outbox.metrics()
+
+    return router
+'''
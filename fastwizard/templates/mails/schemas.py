@@ -0,0 +1,23 @@
+"""Template pour les schémas Pydantic du module mails"""
+
+def get_template(config):
+    return '''"""
+Schémas des routes d'envoi d'emails.
+Automatically generated by FastWizard 🧙‍♂️
+"""
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, Field
+
+
+class TemplateMailRequest(BaseModel):
+    to_email: str
+    template: str = Field(..., description="Nom du gabarit dans app/templates/mails (sans extension)")
+    context: Dict[str, Any] = Field(default_factory=dict)
+    subject: Optional[str] = Field(None, description="Utilisé si le gabarit n'a pas de fichier .subject")
+
+
+class MailQueuedResponse(BaseModel):
+    status: str
+    service: str
+'''
@@ -0,0 +1,222 @@
+"""Template pour l'interface MailSender commune aux fournisseurs d'emails"""
+
+def get_template(config):
+    return '''"""
+Interface d'envoi d'emails commune à tous les fournisseurs.
+Automatically generated by FastWizard 🧙‍♂️
+
+Chaque fournisseur implémente MailSender.send_batch et s'enregistre avec
+@register_provider. MAIL_PROVIDER permet de remplacer le fournisseur réel
+par un bouchon local :
+- "file" : écrit chaque email en .eml dans MAIL_FILE_DIR (tests)
+- "smtp" : envoie à un serveur SMTP local (MailHog, Mailpit, aiosmtpd)
+"""
+import asyncio
+import json
+import logging
+import os
+import smtplib
+import uuid
+from dataclasses import dataclass, field
+from email.message import EmailMessage
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Type
+
+import httpx
+from dotenv import load_dotenv
+
+load_dotenv()
+
+MAIL_PROVIDER = os.getenv("MAIL_PROVIDER", "")
+MAIL_HTTP_TIMEOUT = float(os.getenv("MAIL_HTTP_TIMEOUT", "10"))
+MAIL_FILE_DIR = os.getenv("MAIL_FILE_DIR", "logs/mails")
+MAIL_SMTP_HOST = os.getenv("MAIL_SMTP_HOST", "localhost")
+MAIL_SMTP_PORT = int(os.getenv("MAIL_SMTP_PORT", "1025"))
+MAIL_STUB_SENDER = os.getenv("MAIL_STUB_SENDER", "no-reply@example.com")
+
+logger = logging.getLogger(__name__)
+
+
+class TransientMailError(Exception):
+    """Erreur temporaire (réseau, 429, 5xx) : le lot sera réessayé."""
+
+
+class PermanentMailError(Exception):
+    """Erreur définitive (requête refusée) : le lot est abandonné."""
+
+
+def raise_for_mail_status(response, provider: str):
+    """Classe la réponse HTTP d'un fournisseur : succès, erreur transitoire ou définitive."""
+    if response.is_success:
+        return
+    detail = f"{provider} error {response.status_code}: {response.text}"
+    if response.status_code == 429 or response.status_code >= 500:
+        raise TransientMailError(detail)
+    raise PermanentMailError(detail)
+
+
+@dataclass
+class MailMessage:
+    to_email: str
+    subject: str
+    body: str
+    idempotency_key: Optional[str] = None
+    html: Optional[str] = None
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    # Référence interne à la file (id de stream, id de ligne), jamais sérialisée
+    receipt: Any = field(default=None, compare=False, repr=False)
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "to_email": self.to_email,
+            "subject": self.subject,
+            "body": self.body,
+            "idempotency_key": self.idempotency_key,
+            "html": self.html,
+            "id": self.id,
+        })
+
+    @classmethod
+    def from_json(cls, raw: str) -> "MailMessage":
+        return cls(**json.loads(raw))
+
+
+class MailSender:
+    """Interface d'un fournisseur : envoyer un lot de messages en un appel."""
+
+    name = "base"
+    # Nombre maximal de messages acceptés par send_batch
+    max_batch = 50
+
+    async def start(self):
+        pass
+
+    async def close(self):
+        pass
+
+    async def send_batch(self, messages: List[MailMessage]):
+        """Lève TransientMailError (à réessayer) ou PermanentMailError."""
+        raise NotImplementedError
+
+    async def send_email(self, to_email: str, subject: str, body: str, html: Optional[str] = None) -> bool:
+        """Envoi immédiat, sans passer par l'outbox."""
+        try:
+            await self.send_batch([MailMessage(to_email, subject, body, html=html)])
+        except Exception as exc:
+            logger.warning("%s", exc)
+            return False
+        return True
+
+
+PROVIDERS: Dict[str, Type[MailSender]] = {}
+
+
+def register_provider(name: str) -> Callable[[Type[MailSender]], Type[MailSender]]:
+    def decorator(cls: Type[MailSender]) -> Type[MailSender]:
+        cls.name = name
+        PROVIDERS[name] = cls
+        return cls
+    return decorator
+
+
+def create_sender(default: str) -> MailSender:
+    """Instancie le fournisseur `default`, ou celui imposé par MAIL_PROVIDER."""
+    name = MAIL_PROVIDER or default
+    if name not in PROVIDERS:
+        raise ValueError(f"Unknown mail provider: {name} (available: {', '.join(sorted(PROVIDERS))})")
+    return PROVIDERS[name]()
+
+
+class HttpMailSender(MailSender):
+    """Fournisseur HTTP : un httpx.AsyncClient partagé (keep-alive, HTTP/2, timeouts)."""
+
+    path = "/"
+
+    def __init__(self, base_url: str, transport: Optional[httpx.AsyncBaseTransport] = None, **client_options):
+        self.base_url = base_url
+        self.transport = transport
+        self.client_options = client_options
+        self.client: Optional[httpx.AsyncClient] = None
+
+    async def start(self):
+        """Crée le client HTTP partagé (pool de connexions keep-alive)."""
+        if self.client is None:
+            self.client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=httpx.Timeout(MAIL_HTTP_TIMEOUT, connect=5.0),
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30),
+                http2=True,
+                transport=self.transport,
+                **self.client_options,
+            )
+
+    async def close(self):
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+
+    def build_payload(self, messages: List[MailMessage]) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    async def send_batch(self, messages: List[MailMessage]):
+        await self.start()
+        try:
+            response = await self.client.post(self.path, json=self.build_payload(messages))
+        except httpx.HTTPError as exc:
+            raise TransientMailError(f"{self.name} request failed: {exc}") from exc
+        raise_for_mail_status(response, self.name)
+
+
+def to_email_message(message: MailMessage, sender: str = MAIL_STUB_SENDER) -> EmailMessage:
+    email = EmailMessage()
+    email["From"] = sender
+    email["To"] = message.to_email
+    email["Subject"] = message.subject
+    email["Message-ID"] = f"<{message.id}@fastwizard.local>"
+    email.set_content(message.body)
+    if message.html:
+        email.add_alternative(message.html, subtype="html")
+    return email
+
+
+@register_provider("file")
+class FileSender(MailSender):
+    """Bouchon de test : un fichier .eml par message, relisible avec le module email."""
+
+    max_batch = 1000
+
+    def __init__(self, directory: str = MAIL_FILE_DIR):
+        self.directory = Path(directory)
+
+    async def send_batch(self, messages: List[MailMessage]):
+        await asyncio.to_thread(self._write, messages)
+
+    def _write(self, messages: List[MailMessage]):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for message in messages:
+            (self.directory / f"{message.id}.eml").write_bytes(to_email_message(message).as_bytes())
+
+
+@register_provider("smtp")
+class SmtpSender(MailSender):
+    """Bouchon local : une connexion SMTP par lot vers MAIL_SMTP_HOST:MAIL_SMTP_PORT."""
+
+    max_batch = 100
+
+    def __init__(self, host: str = MAIL_SMTP_HOST, port: int = MAIL_SMTP_PORT):
+        self.host = host
+        self.port = port
+
+    async def send_batch(self, messages: List[MailMessage]):
+        try:
+            await asyncio.to_thread(self._send, messages)
+        except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused) as exc:
+            raise PermanentMailError(f"SMTP error: {exc}") from exc
+        except OSError as exc:  # SMTPException hérite d'OSError
+            raise TransientMailError(f"SMTP {self.host}:{self.port} unavailable: {exc}") from exc
+
+    def _send(self, messages: List[MailMessage]):
+        with smtplib.SMTP(self.host, self.port, timeout=MAIL_HTTP_TIMEOUT) as smtp:
+            for message in messages:
+                smtp.send_message(to_email_message(message))
+'''
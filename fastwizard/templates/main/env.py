@@ -11,6 +11,25 @@ def generate_env_example(selected_modules: List[str], db_config: Optional[Dict]
             "DEBUG=True",
             "ENVIRONMENT=development",
             "",
+            "# ===============================",
+            "# 🚀 Serveur (server.py)",
+            "# ===============================",
+            "SERVER_PROFILE=dev",
+            "PORT=8000",
+            "# Workers en prod (0 = un par CPU alloué au conteneur)",
+            "WEB_CONCURRENCY=0",
+            "SERVER_KEEPALIVE=5",
+            "SERVER_GRACEFUL_TIMEOUT=30",
+            "SERVER_LIMIT_CONCURRENCY=1000",
+            "SERVER_MAX_REQUESTS=0",
+            "FORWARDED_ALLOW_IPS=127.0.0.1",
+            "",
+            "# ===============================",
+            "# 🛣️ Routers (app/core/routers.py)",
+            "# ===============================",
+            "LAZY_ROUTERS=false",
+            "ROUTER_IMPORT_BUDGET_MS=0",
+            "",
         ]
 
         # --- Auth / JWT ---
@@ -84,10 +103,143 @@ def generate_env_example(selected_modules: List[str], db_config: Optional[Dict]
                 "# 📄 Logging",
                 "# ===============================",
                 "LOG_LEVEL=INFO",
+                "# plain | rich | json (une ligne JSON par record, avec request_id/user_id/route)",
                 "LOG_FORMAT=plain",
                 "LOG_FILE=logs/app.log",
                 "LOG_MAX_BYTES=5000000",
                 "LOG_BACKUP_COUNT=5",
+                "# File bornée vers le thread d'écriture ; pleine : newest | oldest est jeté",
+                "LOG_QUEUE_SIZE=10000",
+                "LOG_QUEUE_DROP=newest",
+                "# Access log (app.access) : statut + latence, échantillonné",
+                "LOG_ACCESS_LOG=true",
+                'LOG_ACCESS_SUPPRESS_PATHS=["/health"]',
+                "LOG_ACCESS_SAMPLE_RATE=1.0",
+                "LOG_ACCESS_RATE_LIMIT=0",
+                "LOG_ACCESS_ROUTE_LEVELS={}",
+                "LOG_ACCESS_ERROR_STATUS=500",
+                "LOG_ACCESS_SLOW_MS=1000",
+                "",
+            ])
+        # --- Traces OpenTelemetry ---
+        if "otel" in selected_modules:
+            env_vars.extend([
+                "# ===============================",
+                "# 🔭 Traces OpenTelemetry",
+                "# ===============================",
+                "# Désactivé par défaut ; l'exporteur file écrit un fichier qui grossit sans limite",
+                "TRACING_ENABLED=false",
+                "# otlp (collecteur) | file (JSON lines, hors ligne) | console | none",
+                "TRACING_EXPORTER=file",
+                "TRACING_OTLP_ENDPOINT=http://localhost:4318/v1/traces",
+                "TRACING_FILE=logs/traces.jsonl",
+                "# Part des traces conservées (0.0 à 1.0)",
+                "TRACING_SAMPLE_RATIO=1.0",
+                'TRACING_EXCLUDED_URLS=["/health", "/metrics"]',
+                "",
+            ])
+        # --- Profilage ---
+        if "profiling" in selected_modules:
+            token_note = "" if "auth-permissions" in selected_modules else " ; requis par l'endpoint d'administration"
+            env_vars.extend([
+                "# ===============================",
+                "# 🔬 Profilage des requêtes",
+                "# ===============================",
+                "# Actif en permanence ; sinon activation temporaire via PUT /api/v1/profiling/",
+                "PROFILING_ENABLED=false",
+                "# Part des requêtes profilées quand actif (0.0 = en-tête X-Profile seulement)",
+                "PROFILING_SAMPLE_RATE=0.0",
+                "# pyinstrument | cprofile",
+                "PROFILING_ENGINE=pyinstrument",
+                "PROFILING_HEADER=X-Profile",
+                f"# Jeton secret : X-Profile: <jeton> profile même si inactif{token_note}",
+                "PROFILING_TOKEN=",
+                'PROFILING_EXCLUDE_PATHS=["/api/v1/profiling", "/metrics"]',
+                "PROFILING_DIR=logs/profiles",
+                "PROFILING_MAX_FILES=200",
+                "",
+            ])
+        # --- Métriques ---
+        if "metrics" in selected_modules:
+            env_vars.extend([
+                "# ===============================",
+                "# 📈 Métriques Prometheus",
+                "# ===============================",
+                "METRICS_PATH=/metrics",
+                "# Chemins non mesurés (ex. sondes de santé)",
+                "METRICS_EXCLUDE_PATHS=[]",
+                "# Dossier partagé entre workers (défini par server.py en prod si absent)",
+                "# PROMETHEUS_MULTIPROC_DIR=/tmp/prometheus-multiproc",
+                "",
+            ])
+        # --- Compression ---
+        if "compression" in selected_modules:
+            env_vars.extend([
+                "# ===============================",
+                "# 🗜️ Compression des réponses",
+                "# ===============================",
+                "# Ordre de préférence (zstd, br, gzip) ; encodages non installés ignorés",
+                'COMPRESSION_ENCODINGS=["zstd", "br", "gzip"]',
+                "# Taille minimale du corps en octets (en dessous : envoyé tel quel)",
+                "COMPRESSION_MINIMUM_SIZE=1024",
+                'COMPRESSION_CONTENT_TYPES=["application/json", "application/problem+json", "application/javascript", "application/xml", "image/svg+xml", "text/"]',
+                "COMPRESSION_EXCLUDE_PATHS=[]",
+                "COMPRESSION_GZIP_LEVEL=6",
+                "COMPRESSION_BROTLI_QUALITY=4",
+                "COMPRESSION_ZSTD_LEVEL=3",
+                "# Au-delà (octets), compression dans un thread",
+                "COMPRESSION_THREADPOOL_SIZE=262144",
+                "",
+            ])
+        # --- WebSocket ---
+        if "websocket" in selected_modules:
+            has_cache = "cache-redis" in selected_modules or "cache-valkey" in selected_modules
+            cache_host = "valkey" if "cache-valkey" in selected_modules else "redis"
+            env_vars.extend([
+                "# ===============================",
+                "# 📡 WebSocket",
+                "# ===============================",
+                "# memory (un seul worker) | redis (pub/sub) | streams (Redis Streams)",
+                f"WS_BACKEND={'redis' if has_cache else 'memory'}",
+                f"WS_REDIS_URL=redis://{cache_host if has_cache else 'localhost'}:6379/0",
+                "WS_BATCH_SIZE=256",
+                "# File d'envoi par client et politique si elle est pleine : drop-oldest | drop-newest | disconnect",
+                "WS_SEND_QUEUE_SIZE=100",
+                "WS_SLOW_CONSUMER_POLICY=drop-oldest",
+                "# Ping applicatif des clients fw.json / fw.msgpack (secondes) et fermeture après M secondes sans activité (0 = jamais)",
+                "WS_PING_INTERVAL=20",
+                "WS_IDLE_TIMEOUT=0",
+                "# Protocoles structurés (sous-protocoles fw.json / fw.msgpack) et regroupement par tick (secondes, 0 = off)",
+                "WS_CODECS=json,msgpack",
+                "WS_COALESCE_INTERVAL=0",
+                "WS_COALESCE_MAX=100",
+                "",
+            ])
+        # --- Tâches en arrière-plan ---
+        if "tasks" in selected_modules:
+            env_vars.extend([
+                "# ===============================",
+                "# ⏱️ Tâches en arrière-plan",
+                "# ===============================",
+                "# Redis/Valkey de la file (docker compose : service du cache)",
+                "TASKS_REDIS_URL=redis://localhost:6379/0",
+                "# Tâches simultanées par worker, essais et durée max d'un essai (secondes)",
+                "TASKS_CONCURRENCY=10",
+                "TASKS_MAX_TRIES=5",
+                "TASKS_TIMEOUT=300",
+                "# Backoff entre essais : aléatoire entre 0 et min(MAX, BASE * 2^essai)",
+                "TASKS_RETRY_BASE=1.0",
+                "TASKS_RETRY_MAX=300",
+                "# Conservation des résultats et des tâches abandonnées (secondes)",
+                "TASKS_KEEP_RESULT=3600",
+                "TASKS_DEAD_LETTER_TTL=604800",
+                "# Reprise des tâches d'un worker arrêté sans prévenir (secondes)",
+                "TASKS_CLAIM_IDLE=60",
+                "TASKS_SHUTDOWN_TIMEOUT=30",
+                *([] if "auth-jwt" in selected_modules else [
+                    "# Jeton des routes /api/v1/tasks (en-tête X-Tasks-Token) ; vide = routes fermées",
+                    "TASKS_TOKEN=",
+                ]),
                 "",
             ])
         # --- Mail Brevo ---
@@ -99,6 +251,7 @@ def generate_env_example(selected_modules: List[str], db_config: Optional[Dict]
                 "BREVO_API_KEY=YOUR_BREVO_API_KEY",
                 "BREVO_SENDER_EMAIL=no-reply@example.com",
                 "BREVO_SENDER_NAME=FastAPI App",
+                "BREVO_API_URL=https://api.brevo.com/v3",
                 "",
             ])
         # --- Mail Mailjet ---
@@ -111,7 +264,80 @@ def generate_env_example(selected_modules: List[str], db_config: Optional[Dict]
                 "MAILJET_API_SECRET=YOUR_MAILJET_API_SECRET",
                 "MAILJET_SENDER_EMAIL=no-reply@example.com",
                 "MAILJET_SENDER_NAME=FastAPI App",
+                "MAILJET_API_URL=https://api.mailjet.com/v3.1",
+                "",
+            ])
+        # --- Outbox des mails ---
+        if "mail-brevo" in selected_modules or "mail-mailjet" in selected_modules:
+            has_db = any(m.startswith("db-") for m in selected_modules)
+            has_cache = "cache-redis" in selected_modules or "cache-valkey" in selected_modules
+            cache_host = "valkey" if "cache-valkey" in selected_modules else "redis"
+            env_vars.extend([
+                "# ===============================",
+                "# 📤 Envoi des mails : fournisseur, outbox, gabarits",
+                "# ===============================",
+                "# Vide = fournisseur du module ; file (fichiers .eml) | smtp (serveur local) pour les tests",
+                "MAIL_PROVIDER=",
+                "MAIL_FILE_DIR=logs/mails",
+                "MAIL_SMTP_HOST=localhost",
+                "MAIL_SMTP_PORT=1025",
+                "MAIL_HTTP_TIMEOUT=10",
+                "# Gabarits Jinja2 (app/templates/mails par défaut), cache des gabarits compilés",
+                "MAIL_TEMPLATE_CACHE_SIZE=400",
+                "MAIL_TEMPLATE_AUTO_RELOAD=false",
+                "MAIL_TEMPLATE_BYTECODE_DIR=",
+                f"# memory (en mémoire) | redis (Redis Streams, durable){' | db (table mail_outbox, durable)' if has_db else ''}",
+                "MAIL_QUEUE_BACKEND=memory",
+                f"MAIL_QUEUE_URL=redis://{cache_host if has_cache else 'localhost'}:6379/0",
+                "MAIL_QUEUE_MAXSIZE=10000",
+                "MAIL_WORKERS=2",
+                "# Taille max d'un lot et attente (secondes) pour le remplir",
+                "MAIL_BATCH_SIZE=50",
+                "MAIL_BATCH_WAIT=0.05",
+                "# Réessais : backoff exponentiel avec jitter, plafonné à MAIL_RETRY_MAX secondes",
+                "MAIL_MAX_RETRIES=5",
+                "MAIL_RETRY_BASE=0.5",
+                "MAIL_RETRY_MAX=30",
+                "# Durée de mémorisation des en-têtes Idempotency-Key (secondes)",
+                "MAIL_IDEMPOTENCY_TTL=86400",
+                "MAIL_CLAIM_IDLE=60",
+                "MAIL_POLL_INTERVAL=1",
+                "MAIL_DRAIN_TIMEOUT=10",
+                "",
+            ])
+
+        # --- OAuth ---
+        if any(m.startswith("auth-oauth") for m in selected_modules):
+            has_cache = "cache-redis" in selected_modules or "cache-valkey" in selected_modules
+            env_vars.extend([
+                "# ===============================",
+                "# 🔑 OAuth",
+                "# ===============================",
+                "# Timeout des appels aux providers (client HTTP partagé, keep-alive)",
+                "OAUTH_HTTP_TIMEOUT=10",
+                "# Stockage du state anti-CSRF : memory (un seul processus) ou redis (cache)",
+                f"OAUTH_STATE_BACKEND={'redis' if has_cache else 'memory'}",
+                "OAUTH_STATE_TTL=600",
                 "",
             ])
+            for module_id in selected_modules:
+                if module_id.startswith("auth-oauth-"):
+                    provider = module_id[len("auth-oauth-"):]
+                    env_vars.extend([
+                        f"{provider.upper()}_CLIENT_ID=YOUR_{provider.upper()}_CLIENT_ID",
+                        f"{provider.upper()}_CLIENT_SECRET=YOUR_{provider.upper()}_CLIENT_SECRET",
+                        f"{provider.upper()}_REDIRECT_URI=http://localhost:8000/api/v1/oauth/{provider}/callback",
+                        "",
+                    ])
+            if "auth-oauth-google" in selected_modules:
+                env_vars.extend([
+                    "# Découverte OIDC (ID tokens vérifiés localement avec le JWKS en cache)",
+                    "# Serveur factice local : python scripts/fake_oidc_server.py --port 9000",
+                    "GOOGLE_OIDC_ISSUER=https://accounts.google.com",
+                    "# Durée du cache JWKS si le provider n'envoie pas de Cache-Control (secondes)",
+                    "OIDC_CACHE_TTL=3600",
+                    "OIDC_MIN_REFRESH_INTERVAL=60",
+                    "",
+                ])
 
         return "\n".join(env_vars)
\ No newline at end of file
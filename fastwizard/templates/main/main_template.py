@@ -7,10 +7,8 @@ def get_main_template(project_name: str, selected_modules: List[str]) -> str:
         "from fastapi import FastAPI",
         "from contextlib import asynccontextmanager",
     ]
-    router_includes = []
     middleware_setup = []
-    lifespan_name = None
-    use_combined_lifespan = False
+    lifespans = []  # lifespans des modules, imbriqués dans l'ordre
 
     # === CORS ===
     if "cors" in selected_modules:
@@ -20,64 +18,102 @@ def get_main_template(project_name: str, selected_modules: List[str]) -> str:
     if "config" in selected_modules or "cors" in selected_modules:
         imports.append("from app.core.config import get_settings")
 
+    # === RÉPONSES JSON (orjson) ===
+    response_class_arg = ""
+    if "orjson" in selected_modules:
+        imports.append("from app.core.responses import ORJSONResponse")
+        response_class_arg = "\n    default_response_class=ORJSONResponse,"
+
     # === LOGGING ===
     if "logging" in selected_modules:
-        imports.append("from app.core.logging import setup_logging")
+        imports.append("from app.core.logging import create_access_sampler, setup_logging, stop_logging")
+        imports.append("from app.core.request_context import RequestContextMiddleware")
         imports.append("import logging")
 
+    # === TRACES OPENTELEMETRY (premier lifespan : fermé en dernier, exporte les derniers spans) ===
+    tracing_arg = ""
+    if "otel" in selected_modules:
+        imports.append("from app.core.tracing import fastapi_options as tracing_options, lifespan as tracing_lifespan, setup_tracing")
+        lifespans.append("tracing_lifespan")
+        tracing_arg = "\n    **tracing_options(),"
+
+    # === PROFILAGE ===
+    if "profiling" in selected_modules:
+        imports.append("from app.core.profiling import setup_profiling")
+
+    # === COMPRESSION DES RÉPONSES ===
+    if "compression" in selected_modules:
+        imports.append("from app.core.compression import setup_compression")
+
+    # === MÉTRIQUES PROMETHEUS ===
+    if "metrics" in selected_modules:
+        imports.append("from app.core.metrics import lifespan as metrics_lifespan, setup_metrics")
+        lifespans.append("metrics_lifespan")
+
     # === CACHE (redis / valkey) ===
     if "cache-redis" in selected_modules:
         imports.append("from app.core.cache import lifespan as redis_lifespan")
-        lifespan_name = "redis_lifespan"
+        lifespans.append("redis_lifespan")
     elif "cache-valkey" in selected_modules:
         imports.append("from app.core.cache import lifespan as valkey_lifespan")
-        lifespan_name = "valkey_lifespan"
-
-    # ✅ Determine if we need combined lifespan
-    if "logging" in selected_modules and lifespan_name:
-        use_combined_lifespan = True
-
-    # === ROUTERS ===
-    if "auth-jwt" in selected_modules:
-        imports.append("from app.domains.auth.router import router as auth_router")
-        router_includes.append("app.include_router(auth_router, prefix='/api/v1/auth', tags=['auth'])")
+        lifespans.append("valkey_lifespan")
 
+    # === WEBSOCKET (backend de diffusion) ===
     if "websocket" in selected_modules:
-        imports.append("from app.domains.ws.router import router as ws_router")
-        router_includes.append("app.include_router(ws_router, prefix='/ws', tags=['ws'])")
+        imports.append("from app.core.websocket import lifespan as websocket_lifespan")
+        lifespans.append("websocket_lifespan")
 
-    if "mail-brevo" in selected_modules:
-        imports.append("from app.domains.mails.brevo_router import router as brevo_router")
-        router_includes.append("app.include_router(brevo_router, prefix='/api/v1/brevo', tags=['mails'])")
+    # === TÂCHES EN ARRIÈRE-PLAN (connexion de l'API à la file) ===
+    if "tasks" in selected_modules:
+        imports.append("from app.core.tasks import lifespan as tasks_lifespan")
+        lifespans.append("tasks_lifespan")
 
+    # === MAILS (client HTTP partagé) ===
+    if "mail-brevo" in selected_modules:
+        imports.append("from app.domains.mails.brevo_service import lifespan as brevo_lifespan")
+        lifespans.append("brevo_lifespan")
     if "mail-mailjet" in selected_modules:
-        imports.append("from app.domains.mails.mailjet_router import router as mailjet_router")
-        router_includes.append("app.include_router(mailjet_router, prefix='/api/v1/mailjet', tags=['mails'])")
+        imports.append("from app.domains.mails.mailjet_service import lifespan as mailjet_lifespan")
+        lifespans.append("mailjet_lifespan")
+
+    # === OAUTH (client HTTP partagé par tous les providers) ===
+    has_oauth = any(m.startswith("auth-oauth") for m in selected_modules)
+    if has_oauth:
+        imports.append("from app.domains.oauth.services import lifespan as oauth_lifespan")
+        lifespans.append("oauth_lifespan")
 
-    if "auth-oauth-google" in selected_modules:
-        imports.append("from app.domains.oauth.google.oauth_router import router as google_oauth_router")
-        router_includes.append("app.include_router(google_oauth_router, prefix='/api/v1/google_oauth', tags=['google_oauth'])")
+    # ✅ Determine if we need combined lifespan
+    use_combined_lifespan = bool(lifespans) and ("logging" in selected_modules or len(lifespans) > 1)
 
-    # === Dynamic router loading ===
-    imports.append("import importlib")
-    imports.append("from pathlib import Path")
+    # === ROUTERS (table statique app/core/routers.py, régénérée par `fastwizard update`) ===
+    imports.append("from app.core.routers import include_routers")
 
     # ✅ Build lifespan block
     lifespan_def = ""
 
     if use_combined_lifespan:
-        lifespan_def = f"""
+        nested = ", ".join(f"{name}(app)" for name in lifespans)
+        if "logging" in selected_modules:
+            lifespan_def = f"""
 @asynccontextmanager
 async def combined_lifespan(app):
     setup_logging()
     logger = logging.getLogger(__name__)
     logger.info("✅ Logging initialized")
 
-    async with {lifespan_name}(app):
+    async with {nested}:
         logger.info("🚀 Application startup complete")
         yield
 
     logger.info("🛑 Application shutdown")
+    stop_logging()
+"""
+        else:
+            lifespan_def = f"""
+@asynccontextmanager
+async def combined_lifespan(app):
+    async with {nested}:
+        yield
 """
         lifespan_to_use = "combined_lifespan"
 
@@ -90,33 +126,41 @@ async def lifespan(app):
     logger.info("✅ Logging initialized")
     yield
     logger.info("🛑 Application shutdown")
+    stop_logging()
 """
         lifespan_to_use = "lifespan"
 
-    elif lifespan_name:
-        lifespan_to_use = lifespan_name
+    elif lifespans:
+        lifespan_to_use = lifespans[0]
 
     else:
         lifespan_to_use = "None"
 
+    # === Traces (avant les middlewares : provider global prêt pour toute la pile) ===
+    if "otel" in selected_modules:
+        middleware_setup.append("setup_tracing(app)")
+
+    # === Compression (middleware le plus interne : logs, profils et métriques incluent son coût) ===
+    if "compression" in selected_modules:
+        middleware_setup.append("setup_compression(app)")
+
+    # === Contexte de requête (request id, utilisateur, route) dans les logs ===
+    if "logging" in selected_modules:
+        middleware_setup.append("app.add_middleware(RequestContextMiddleware, sampler=create_access_sampler())")
+
     # === CORS setup ===
     if "cors" in selected_modules:
         middleware_setup.append("settings = get_settings()")
         middleware_setup.append("setup_cors(app)")
 
-    dynamic_router_code = '''
-# Inclusion dynamique de tous les routers CRUD dans app/domains
-domains_path = Path(__file__).parent / "app" / "domains"
-for domain_dir in domains_path.iterdir():
-    if domain_dir.is_dir():
-        try:
-            module = importlib.import_module(f"app.domains.{domain_dir.name}.router")
-            if hasattr(module, "router"):
-                app.include_router(module.router, prefix=f"/api/v1/{domain_dir.name}")
-                print(f"✅ Router '{domain_dir.name}' inclus")
-        except ModuleNotFoundError:
-            print(f"⚠️ Aucun router trouvé pour '{domain_dir.name}'")
-'''
+    # === Profilage (externe : le profil inclut les middlewares ajoutés avant) ===
+    if "profiling" in selected_modules:
+        middleware_setup.append("setup_profiling(app)")
+
+    # === Métriques (ajoutées en dernier : middleware le plus externe, mesure toute la pile) ===
+    if "metrics" in selected_modules:
+        middleware_setup.append("setup_metrics(app)")
+
 
     return f"""{chr(10).join(imports)}
 {lifespan_def}
@@ -126,7 +170,7 @@ app = FastAPI(
     description="API générée avec FastWizard 🧙‍♂️",
     version="0.1.0",
     docs_url="/docs",
-    redoc_url="/redoc",
+    redoc_url="/redoc",{response_class_arg}{tracing_arg}
     lifespan={lifespan_to_use}
 )
 
@@ -140,11 +184,11 @@ async def root():
 async def health_check():
     return {{"status": "healthy"}}
 
-{chr(10).join(router_includes)}
-
-{dynamic_router_code}
+# Routers des modules et des domaines (voir app/core/routers.py)
+include_routers(app)
 
 if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, log_config=None, reload=True)
+    # Profil dev par défaut ; voir server.py (--profile prod)
+    from server import main as serve
+    serve()
 """
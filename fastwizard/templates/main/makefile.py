@@ -5,13 +5,44 @@ def generate_makefile(selected_modules: List[str]) -> str:
         env_vars = [
             "# Makefile pour simplifier les commandes de développement",
             "",
-            ".PHONY: help venv deps activate up down migrate migrate-upgrade migrate-revision run",
+            ".PHONY: help venv deps activate up down migrate migrate-upgrade migrate-revision run run-prod test bench bench-compare load-test worker",
             "",
             "# Variables",
             "VENV_NAME ?= venv",
             "APP_NAME ?= app",
         ]
 
+        # Benchmarks des services (tests/benchmarks/, générés avec une base de données)
+        bench_help = []
+        bench_targets = []
+        if any(m in selected_modules for m in ("db-postgresql", "db-mysql")):
+            bench_help = [
+                "\t@echo \"  make bench      - Benchmarks des services, enregistrés comme référence\"",
+                "\t@echo \"  make bench-compare - Benchmarks comparés à la dernière référence\"",
+            ]
+            bench_targets = [
+                "# Benchmarks des services, enregistrés dans .benchmarks/",
+                "bench:",
+                "\tpytest tests/benchmarks --benchmark-only --benchmark-autosave",
+                "",
+                "# Échec si une médiane régresse de plus de 20 % par rapport à la dernière référence",
+                "bench-compare:",
+                "\tpytest tests/benchmarks --benchmark-only --benchmark-compare --benchmark-compare-fail=median:20%",
+                "",
+            ]
+
+        # Worker des tâches en arrière-plan (module tasks)
+        worker_help = []
+        worker_targets = []
+        if "tasks" in selected_modules:
+            worker_help = ["\t@echo \"  make worker     - Lancer le worker des tâches en arrière-plan\""]
+            worker_targets = [
+                "# Worker des tâches (ARGS='--burst' : vide la file puis s'arrête)",
+                "worker:",
+                "\tpython -m app.worker $(ARGS)",
+                "",
+            ]
+
         if "docker" in selected_modules:
             env_vars.extend([
                 "",
@@ -27,6 +58,11 @@ def generate_makefile(selected_modules: List[str]) -> str:
                 "\t@echo \"  make migrate    - Exécuter les migrations Alembic\"",
                 "\t@echo \"  make migrate-revision message='msg' - Créer une migration auto\"",
                 "\t@echo \"  make run        - Lancer Uvicorn en mode reload\"",
+                "\t@echo \"  make run-prod   - Lancer le profil de production\"",
+                *worker_help,
+                "\t@echo \"  make test       - Tests pytest (sans les benchmarks)\"",
+                *bench_help,
+                "\t@echo \"  make load-test  - Tests de charge (rapport dans tests/load/results)\"",
                 "",
                 "# Créer l'environnement virtuel",
                 "venv:",
@@ -65,7 +101,21 @@ def generate_makefile(selected_modules: List[str]) -> str:
                 "",
                 "# Lancer Uvicorn en mode développement",
                 "run:",
-                "\tuvicorn main:app --reload   ",
+                "\tpython server.py --profile dev",
+                "",
+                "# Lancer le profil de production (workers, uvloop, httptools)",
+                "run-prod:",
+                "\tpython server.py --profile prod",
+                "",
+                *worker_targets,
+                "# Tests pytest sur SQLite en mémoire (TEST_DATABASE=container : vrai moteur via Docker)",
+                "test:",
+                "\tpytest --benchmark-skip",
+                "",
+                *bench_targets,
+                "# Tests de charge sur une base SQLite temporaire (ARGS='--base-url http://localhost:8000')",
+                "load-test:",
+                "\tpython tests/load/run.py $(ARGS)",
             ])
         else:
             env_vars.extend([
@@ -77,6 +127,11 @@ def generate_makefile(selected_modules: List[str]) -> str:
                 "\t@echo \"  make activate   - Activer l'environnement (manuel)\"",
                 "\t@echo \"  make install    - Installer les dépendances dans l'environnement\"",
                 "\t@echo \"  make run        - Lancer Uvicorn en mode reload\"",
+                "\t@echo \"  make run-prod   - Lancer le profil de production\"",
+                *worker_help,
+                "\t@echo \"  make test       - Tests pytest (sans les benchmarks)\"",
+                *bench_help,
+                "\t@echo \"  make load-test  - Tests de charge (rapport dans tests/load/results)\"",
                 "",
                 "# Créer l'environnement virtuel",
                 "venv:",
@@ -106,6 +161,20 @@ def generate_makefile(selected_modules: List[str]) -> str:
                 "\tfi",
                 "# Lancer Uvicorn en mode développement",
                 "run:",
-                "\tuvicorn main:app --reload   ",
+                "\tpython server.py --profile dev",
+                "",
+                "# Lancer le profil de production (workers, uvloop, httptools)",
+                "run-prod:",
+                "\tpython server.py --profile prod",
+                "",
+                *worker_targets,
+                "# Tests pytest sur SQLite en mémoire (TEST_DATABASE=container : vrai moteur via Docker)",
+                "test:",
+                "\tpytest --benchmark-skip",
+                "",
+                *bench_targets,
+                "# Tests de charge sur une base SQLite temporaire (ARGS='--base-url http://localhost:8000')",
+                "load-test:",
+                "\tpython tests/load/run.py $(ARGS)",
             ])
         return "\n".join(env_vars)
\ No newline at end of file
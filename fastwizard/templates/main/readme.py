@@ -5,6 +5,53 @@ def generate_readme(project_name: str, selected_modules: List[str]) -> str:
         """Génère le README.md"""
         
         modules_list = "\n".join([f"- {module}" for module in selected_modules]) if selected_modules else "- Aucun module spécial"
+        # Tests section (base transactionnelle et benchmarks seulement avec une base de données)
+        tests_section = '''## 🧪 Tests
+
+```bash
+pip install -r requirements-dev.txt
+pytest
+```
+
+Les tests appellent l'application sans son lifespan : Redis et les autres services ne sont pas requis.
+
+'''
+        if any(m in selected_modules for m in ("db-postgresql", "db-mysql")):
+            tested = [name for module, name in (("auth-jwt", "routes d'authentification"), ("crud", "chaque entité CRUD"))
+                      if module in selected_modules]
+            pytest_scope = f"\nTests fonctionnels et benchmarks couvrent : {' et '.join(tested)}." if tested else ""
+            tests_section = f'''## 🧪 Tests
+
+```bash
+pip install -r requirements-dev.txt
+pytest --benchmark-skip                      # tests fonctionnels
+TEST_DATABASE=container pytest               # même moteur que la production (Docker requis)
+```
+
+`tests/conftest.py` remplace `get_db` par une session ouverte dans une transaction annulée
+après chaque test (SQLite en mémoire par défaut, conteneur jetable avec
+`TEST_DATABASE=container`, ou base dédiée avec `TEST_DATABASE_URL`).{pytest_scope}
+Les tests appellent l'application sans son lifespan : Redis et les autres services ne sont pas requis.
+
+`tests/benchmarks/` mesure les fonctions de service avec `pytest-benchmark`. Enregistrez une
+référence sur la branche principale, puis comparez-y chaque modification (en CI, sur la même
+machine) :
+```bash
+pytest tests/benchmarks --benchmark-only --benchmark-autosave
+pytest tests/benchmarks --benchmark-only --benchmark-compare --benchmark-compare-fail=median:20%
+```
+
+'''
+
+        load_scenarios = ["`health`"]
+        if "auth-jwt" in selected_modules:
+            load_scenarios.append("`auth` : inscription, connexion, rafraîchissement")
+        if "crud" in selected_modules:
+            load_scenarios.append("un scénario création + liste par entité CRUD")
+        if "websocket" in selected_modules:
+            load_scenarios.append("`ws_broadcast` : diffusion dans une room")
+        load_scenarios = " ; ".join(load_scenarios)
+
         permissions_section = ''
         if "auth-permissions" in selected_modules:
             permissions_section = '''
@@ -46,6 +93,31 @@ Le logging est configuré via `app/core/logging.py`. Les niveaux de log et le fo
 
 Les logs sont également écrits dans `logs/app.log` (configurable via .env).
 
+Les handlers console et fichier ne tournent pas dans la boucle asyncio : chaque record passe par
+une file bornée (`LOG_QUEUE_SIZE`) vidée par un `QueueListener` en arrière-plan. Si la file est
+pleine, le record le plus récent (ou le plus ancien, `LOG_QUEUE_DROP=oldest`) est abandonné et un
+avertissement indique le nombre de records perdus. La file est vidée à l'arrêt de l'application.
+
+Avec `LOG_FORMAT=json`, console et fichier écrivent une ligne JSON par record (orjson si installé,
+sinon `json`) : `time`, `level`, `logger`, `msg`, les champs passés via `extra={...}`, `exc` pour
+les exceptions, et le contexte de la requête posé par `RequestContextMiddleware` : `request_id`
+(repris de l'en-tête `X-Request-ID` ou généré, et renvoyé dans la réponse), `method`, `route`
+(gabarit complet, ex. `/api/v1/items/{item_id}`) et `user_id` une fois l'utilisateur authentifié.
+
+L'access log est écrit par le middleware (logger `app.access`, avec statut et `duration_ms`) et
+remplace celui d'Uvicorn. Pour les routes très sollicitées :
+
+| Variable | Effet |
+|----------|-------|
+| `LOG_ACCESS_SUPPRESS_PATHS` | Chemins jamais journalisés (par défaut `["/health"]`) |
+| `LOG_ACCESS_SAMPLE_RATE` | Fraction des requêtes journalisées (`0.01` = 1 %) |
+| `LOG_ACCESS_RATE_LIMIT` | Lignes maximum par route et par seconde (`0` = illimité) |
+| `LOG_ACCESS_ROUTE_LEVELS` | Niveau par route, ex. `{"/api/v1/items/{item_id}": "DEBUG"}` |
+| `LOG_ACCESS_ERROR_STATUS` / `LOG_ACCESS_SLOW_MS` | Toujours journalisées : erreurs (`ERROR`) et requêtes lentes (`WARNING`) |
+
+Chaque ligne indique dans `suppressed` combien de requêtes de la même route ont été écartées depuis
+la précédente. `LOG_ACCESS_LOG=false` désactive complètement l'access log.
+
 Exemple d'utilisation dans une route FastAPI :
 ```from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
@@ -76,7 +148,7 @@ def read_all(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
 - `app/domains/` : Dossiers par domaine métier (auth, users, ...). Chaque domaine peut contenir :
   - `model.py` (modèles SQLAlchemy)
   - `schemas.py` (schémas Pydantic)
-  - `router.py` (routes FastAPI du domaine)
+  - `router.py` (routes FastAPI du domaine, monté sous `/api/v1/<domaine>`)
   - `dependencies.py` (dépendances spécifiques au domaine)
 - `app/middleware/` : Middlewares custom.
 - `tests/` : Tests unitaires et d'intégration.
@@ -84,6 +156,22 @@ def read_all(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
 - `Dockerfile` & `docker-compose.yml` : Conteneurisation (si Docker activé).
 - `Makefile` : Simplifie les commandes de développement (si Makefile activé).
 
+### Routers
+`app/core/routers.py` liste les routers inclus par `main.py`, dans un ordre fixe : aucun
+parcours de `app/domains` au démarrage, et un router qui ne s'importe pas fait échouer le
+démarrage avec sa vraie erreur. Après avoir ajouté un domaine (`app/domains/<nom>/router.py`),
+régénérez la table :
+```bash
+fastwizard update
+```
+`LAZY_ROUTERS=true` n'importe chaque router qu'à sa première requête (démarrage plus rapide
+en développement, mais ces routes n'apparaissent pas dans `/docs`). `ROUTER_IMPORT_BUDGET_MS`
+logge un avertissement si l'import des routers dépasse ce budget. Pour mesurer le démarrage
+complet et échouer en CI au-delà d'un budget :
+```bash
+python benchmarks/startup.py --budget-ms 1500
+```
+
 '''
 
         cors_section = ''
@@ -110,6 +198,89 @@ Le cache est configuré via `app/core/cache.py`. Modifiez les paramètres de con
 ## 📡 WebSocket
 
 Le module WebSocket est activé. Les routes WebSocket sont définies dans `app/domains/ws/router.py`.
+
+Les rooms sont partagées entre workers via un backend de diffusion choisi par `WS_BACKEND` :
+- `memory` : en mémoire, un seul worker
+- `redis` : pub/sub Redis/Valkey (un canal par room)
+- `streams` : Redis Streams (un stream plafonné lu par chaque worker)
+
+Avec un module de cache, le défaut est `redis`, sur l'hôte du service docker compose. Pour lancer
+l'application sans Docker (`python server.py`), sans Redis local, mettez `WS_BACKEND=memory`
+dans `.env`. Un Redis injoignable ne bloque pas le démarrage : la diffusion entre workers reprend
+dès que la connexion est rétablie (erreurs dans les logs en attendant).
+
+Chaque client a sa propre file d'envoi bornée (`WS_SEND_QUEUE_SIZE`) vidée par une tâche dédiée :
+un client lent ne bloque plus la room. Quand sa file est pleine, `WS_SLOW_CONSUMER_POLICY`
+s'applique : `drop-oldest`, `drop-newest` ou `disconnect`.
+
+Les clients `fw.json` / `fw.msgpack` reçoivent `{"type":"ping"}` toutes les `WS_PING_INTERVAL`
+secondes et y répondent par `{"type":"pong"}`. Les clients texte ne reçoivent aucun ping applicatif :
+les sockets morts sont détectés par les pings du protocole WebSocket (uvicorn `--ws-ping-interval`).
+Avec `WS_IDLE_TIMEOUT > 0`, un client sans activité pendant ce délai est fermé (un message reçu,
+ou pour un client texte un message envoyé : un simple auditeur reste connecté).
+Un frame illisible pour le protocole négocié ferme la connexion avec le code 1007.
+
+Protocoles optionnels, négociés via le sous-protocole WebSocket demandé par le client :
+- `fw.json` : frames texte JSON
+- `fw.msgpack` : frames binaires msgpack
+
+Avec `WS_COALESCE_INTERVAL > 0`, les événements d'un même tick sont envoyés dans un seul
+frame (tableau JSON ou msgpack). La compression permessage-deflate est négociée par uvicorn
+(`--ws-per-message-deflate`, activée par défaut). Comparaison octets/CPU par message :
+```bash
+python benchmarks/ws_codecs.py --messages 20000 --batch 10
+```
+
+`GET /ws/metrics` expose par room : connexions, messages/s, profondeur des files d'envoi,
+latence d'envoi et messages abandonnés.
+
+Benchmark local du fan-out (messages/s sur N workers) :
+```bash
+WS_BACKEND=redis python benchmarks/ws_fanout.py --workers 4 --clients 50 --messages 2000
+```
+'''
+
+        # Tasks module section
+        tasks_section = ''
+        if "tasks" in selected_modules:
+            tasks_section = '''
+## ⏱️ Tâches en arrière-plan
+Les traitements lents sortent du chemin de la requête : la route dépose une tâche dans une file
+Redis/Valkey (`TASKS_REDIS_URL`) et répond aussitôt ; le worker (`python -m app.worker`, service
+`worker` de docker compose) l'exécute. Les tâches sont des fonctions décorées par `@task` dans
+`app/domains/tasks/jobs.py` :
+```python
+@task(max_tries=5, timeout=60, concurrency=2)
+async def generer_rapport(ctx, rapport_id: int): ...
+
+job_id = await enqueue(generer_rapport, 42)                    # depuis une route
+await enqueue(generer_rapport, 42, _defer=3600)                # dans une heure
+await enqueue(generer_rapport, 42, _job_id="rapport-42")       # au plus une fois
+```
+- **Réessais** : une exception relance la tâche après un backoff exponentiel avec jitter
+  (`TASKS_RETRY_BASE`, `TASKS_RETRY_MAX`), jusqu'à `max_tries` ; `TaskAbort` l'abandonne aussitôt.
+- **Tâches planifiées** : `@task(every=300)` s'exécute toutes les 5 minutes, une seule fois
+  quel que soit le nombre de workers.
+- **Concurrence** : `TASKS_CONCURRENCY` tâches par worker, `concurrency=` par type de tâche ;
+  `docker compose up --scale worker=4` pour plus de workers.
+- **Fiabilité** : une tâche dont le worker meurt est reprise par un autre après
+  `TASKS_CLAIM_IDLE` secondes ; SIGTERM laisse finir les tâches en cours.
+
+`GET /api/v1/tasks/` montre la file et les workers actifs, `GET /api/v1/tasks/jobs/{id}` l'état
+d'une tâche (essais, erreur, résultat).
+'''
+            if "auth-jwt" in selected_modules:
+                tasks_section += '''Ces routes sont réservées aux administrateurs. `POST /api/v1/tasks/users/import` importe
+des comptes en lot (jusqu'à 1000) sans faire attendre la requête pour le hash bcrypt de chaque
+mot de passe.
+'''
+            else:
+                tasks_section += '''Ces routes exigent l'en-tête `X-Tasks-Token` (= `TASKS_TOKEN`).
+'''
+            if "mail-brevo" in selected_modules or "mail-mailjet" in selected_modules:
+                tasks_section += '''
+La tâche `send_mail` envoie un email depuis le worker, avec réessais : contrairement à l'outbox
+en mémoire de l'API, elle survit à un redémarrage et son état reste consultable.
 '''
 
         # Mail module section
@@ -123,11 +294,51 @@ Le projet inclut un service d'envoi d'emails via
                 mail_section += '- Brevo (ex-Sendinblue) via `app/domains/mails/brevo_service.py`\n'
             if "mail-mailjet" in selected_modules:
                 mail_section += '- Mailjet via `app/domains/mails/mailjet_service.py`\n'
+            mail_prefix = "brevo" if "mail-brevo" in selected_modules else "mailjet"
             mail_section += '''
 Configurez les clés API dans le fichier `.env` :
 - Pour Brevo : `BREVO_API_KEY`
 - Pour Mailjet : `MAILJET_API_KEY` et `MAILJET_API_SECRET`
-Utilisez le service mail dans vos routes ou services pour envoyer des emails.
+
+Chaque fournisseur implémente l'interface `MailSender` (`app/domains/mails/sender.py`) et
+s'enregistre avec `@register_provider`. Pour les tests et le développement, `MAIL_PROVIDER`
+remplace le fournisseur réel par un bouchon local :
+- `MAIL_PROVIDER=file` : chaque email est écrit en `.eml` dans `MAIL_FILE_DIR`
+- `MAIL_PROVIDER=smtp` : envoi vers un serveur SMTP local (`MAIL_SMTP_HOST:MAIL_SMTP_PORT`, ex. Mailpit)
+
+Les appels à l'API passent par un `httpx.AsyncClient` unique (pool keep-alive, HTTP/2, timeouts)
+ouvert et fermé par le lifespan de l'application. Pour tester contre un serveur bouchon HTTP,
+pointez `BREVO_API_URL` / `MAILJET_API_URL` vers celui-ci, ou passez un `transport` httpx au service.
+
+### Gabarits Jinja2
+Les gabarits sont dans `app/templates/mails/` : `<nom>.txt` (obligatoire), `<nom>.html` et
+`<nom>.subject` (optionnels). Ils sont compilés une seule fois et gardés en cache
+(`MAIL_TEMPLATE_CACHE_SIZE`, `MAIL_TEMPLATE_BYTECODE_DIR` pour le bytecode entre deux démarrages) ;
+un gabarit sans variable n'est rendu qu'une fois. `MAIL_TEMPLATE_AUTO_RELOAD=true` en développement.
+```bash
+curl -X POST "http://localhost:8000/api/v1/''' + mail_prefix + '''/send-template" \\
+     -H "Content-Type: application/json" \\
+     -d '{"to_email": "a@example.com", "template": "welcome", "context": {"username": "Ada"}}'
+```
+
+### File d'envoi (outbox)
+`POST /send` et `POST /send-template` déposent l'email dans une file et répondent `202`
+sans attendre le fournisseur. Des workers (`MAIL_WORKERS`) envoient les messages par lots de
+`MAIL_BATCH_SIZE` en un seul appel API (plusieurs `Messages` Mailjet, `messageVersions` Brevo)
+et réessaient les erreurs transitoires (réseau, 429, 5xx) avec un backoff exponentiel et jitter.
+Un lot refusé définitivement (4xx) est renvoyé message par message : seul le message fautif
+part en échec.
+
+- `MAIL_QUEUE_BACKEND=memory` : file en mémoire, vidée à l'arrêt (`MAIL_DRAIN_TIMEOUT`)
+- `MAIL_QUEUE_BACKEND=redis` : Redis Streams + groupe de consommateurs, survit aux redémarrages
+- `MAIL_QUEUE_BACKEND=db` : table `mail_outbox` (si une base est configurée)
+
+Envoyez un en-tête `Idempotency-Key` pour qu'un même email ne parte qu'une fois :
+```bash
+curl -X POST "http://localhost:8000/api/v1/''' + mail_prefix + '''/send?to_email=a@example.com&subject=Hi&body=Hello" \\
+     -H "Idempotency-Key: order-42-confirmation"
+```
+`GET /outbox` expose les compteurs (en file, envoyés, réessais, échecs).
 '''
         
         # Oauth module section
@@ -135,7 +346,150 @@ Utilisez le service mail dans vos routes ou services pour envoyer des emails.
         if any(m.startswith('auth-oauth') for m in selected_modules):
             oauth_section = '''
 ## 🔐 Authentification OAuth
-Le module d'authentification OAuth est activé. Configurez les fournisseurs OAuth dans `app/core/config.py` et implémentez les routes nécessaires dans `app/domains/oauth/{provider}/router.py`.
+Le module d'authentification OAuth est activé. Tous les providers passent par le même moteur
+(`app/domains/oauth/`) : un client `httpx.AsyncClient` partagé (pool keep-alive, HTTP/2,
+`OAUTH_HTTP_TIMEOUT`), un stockage de `state` et un seul router :
+
+| Route | Description |
+|-------|-------------|
+| `GET /api/v1/oauth/providers` | Providers configurés |
+| `GET /api/v1/oauth/{provider}/login` | URL d'autorisation (avec un `state` à usage unique) |
+| `GET /api/v1/oauth/{provider}/callback` | Vérifie le `state`, échange le code, renvoie les tokens JWT |
+
+Identifiants : `<PROVIDER>_CLIENT_ID`, `<PROVIDER>_CLIENT_SECRET` et `<PROVIDER>_REDIRECT_URI`
+dans `.env`. Le `state` est gardé `OAUTH_STATE_TTL` secondes, en mémoire ou dans le cache Redis
+(`OAUTH_STATE_BACKEND=redis`, indispensable avec plusieurs workers).
+
+Ajouter un provider ne demande que de la configuration : un fichier dans
+`app/domains/oauth/providers/` qui appelle `register_provider(OAuthProvider(...))` avec ses URLs,
+ses scopes et la correspondance de ses claims (`subject`, `email`, `username`), plus une colonne
+`<provider>_id` sur le modèle `User`. Pour GitHub, `/user` et `/user/emails` sont appelés en parallèle.
+'''
+            if 'auth-oauth-google' in selected_modules:
+                oauth_section += '''
+Google est un provider OpenID Connect : au démarrage, le document de découverte
+(`GOOGLE_OIDC_ISSUER/.well-known/openid-configuration`) et le JWKS sont chargés puis gardés
+en cache (durée `Cache-Control` du JWKS, sinon `OIDC_CACHE_TTL`) et rafraîchis en tâche de fond.
+L'`id_token` renvoyé avec l'access token est vérifié localement (signature, `iss`, `aud`, `exp`,
+`at_hash`) : plus d'appel à `userinfo` pendant le callback. Un `kid` inconnu déclenche un
+rechargement du JWKS (au plus une fois par `OIDC_MIN_REFRESH_INTERVAL`).
+
+Pour tester sans Google, lancez le serveur OIDC factice :
+
+```bash
+python scripts/fake_oidc_server.py --port 9000
+GOOGLE_OIDC_ISSUER=http://127.0.0.1:9000 python main.py
+```
+'''
+
+        # Orjson module section
+        orjson_section = ''
+        if "orjson" in selected_modules:
+            orjson_section = '''
+## ⚡ Réponses JSON rapides
+`ORJSONResponse` (`app/core/responses.py`) est la classe de réponse par défaut : elle encode
+avec orjson les routes qui renvoient des dict/list sans `response_model`.
+
+Pour une route avec un schéma Pydantic, l'essentiel du coût est dans `jsonable_encoder`, pas
+dans l'encodeur JSON. Les routes CRUD renvoient donc `json_response(adapter, data)` : les données
+sont validées et sérialisées en une passe par `TypeAdapter.dump_json` (`response_model` est
+conservé pour la documentation OpenAPI). Mesurez sur vos propres schémas :
+```bash
+python benchmarks/serialization.py --items 100
+```
+'''
+
+        # Compression module section
+        compression_section = ''
+        if "compression" in selected_modules:
+            compression_section = '''
+## 🗜️ Compression des réponses
+`CompressionMiddleware` (`app/core/compression.py`) compresse les réponses en zstd, Brotli ou gzip,
+selon l'en-tête `Accept-Encoding` du client et l'ordre de `COMPRESSION_ENCODINGS`. Sont envoyés
+tels quels : les corps de moins de `COMPRESSION_MINIMUM_SIZE` octets, les types hors de
+`COMPRESSION_CONTENT_TYPES`, les réponses déjà encodées ou en streaming, et les WebSocket.
+
+La compression coûte du CPU à chaque réponse : elle n'est rentable que si le temps de transfert
+économisé dépasse ce coût. Comparez encodages et niveaux sur des listes CRUD ou sur une réponse
+réelle, au débit de vos clients :
+```bash
+python benchmarks/compression.py --bandwidth 50
+```
+'''
+
+        # Metrics module section
+        metrics_section = ''
+        if "metrics" in selected_modules:
+            metrics_section = '''
+## 📈 Métriques
+`app/core/metrics.py` expose les métriques au format Prometheus sur `/metrics` (`METRICS_PATH`) :
+latence et nombre de requêtes par gabarit de route (`/api/v1/food/foods/{id}`, jamais l'URL brute),
+requêtes en cours'''
+            if any(m.startswith("db-") for m in selected_modules):
+                metrics_section += ", pool de connexions SQLAlchemy"
+            if "cache-redis" in selected_modules or "cache-valkey" in selected_modules:
+                metrics_section += ", taux de succès du cache"
+            if "websocket" in selected_modules:
+                metrics_section += ", connexions WebSocket"
+            metrics_section += '''.
+
+En prod avec plusieurs workers, chaque worker écrit ses valeurs dans `PROMETHEUS_MULTIPROC_DIR`
+(créé et vidé par `server.py` au démarrage) et `/metrics` renvoie l'agrégat. Coût du middleware
+par requête et d'un scrape :
+```bash
+python benchmarks/metrics_overhead.py
+```
+'''
+
+        # Otel module section
+        tracing_section = ''
+        if "otel" in selected_modules:
+            traced = ["requêtes HTTP et WebSocket"]
+            if any(m.startswith("db-") for m in selected_modules):
+                traced.append("requêtes SQL")
+            if "cache-redis" in selected_modules or "cache-valkey" in selected_modules:
+                traced.append("commandes du cache")
+            if any(m.startswith("mail-") or m.startswith("auth-oauth") for m in selected_modules):
+                traced.append("appels httpx (OAuth, emails)")
+            tracing_section = f'''
+## 🔭 Traces
+`app/core/tracing.py` trace avec OpenTelemetry : {", ".join(traced)}.
+Désactivé par défaut : activez-le avec `TRACING_ENABLED=true` dans `.env`. Les tests
+(`tests/conftest.py`) le désactivent toujours. Réglages dans `app/core/config.py` (`TRACING_*`) :
+
+- `TRACING_EXPORTER=file` (défaut) : une ligne JSON par span dans `logs/traces.jsonl`, sans réseau
+  ni rotation ; à réserver au développement, avec un `TRACING_SAMPLE_RATIO` réduit si besoin
+- `TRACING_EXPORTER=otlp` : envoi à un collecteur, par exemple Jaeger en local :
+```bash
+docker run --rm -p 16686:16686 -p 4318:4318 jaegertracing/all-in-one
+# puis TRACING_EXPORTER=otlp et http://localhost:16686
+```
+- `TRACING_SAMPLE_RATIO=0.1` : garde 10 % des traces (décision prise à l'entrée de la trace)
+'''
+
+        # Profiling module section
+        profiling_section = ''
+        if "profiling" in selected_modules:
+            if "auth-permissions" in selected_modules:
+                profiling_auth = "réservé aux admins (`require_admin`)"
+                profiling_curl_auth = '-H "Authorization: Bearer $ADMIN_TOKEN"'
+            else:
+                profiling_auth = "protégé par l'en-tête `X-Profiling-Token` (= `PROFILING_TOKEN`)"
+                profiling_curl_auth = '-H "X-Profiling-Token: $PROFILING_TOKEN"'
+            profiling_section = f'''
+## 🔬 Profilage
+`app/core/profiling.py` profile des requêtes individuelles avec pyinstrument (défaut) ou cProfile.
+L'endpoint `/api/v1/profiling/` est {profiling_auth} :
+```bash
+# Activer pour 10 minutes, 1 % des requêtes en plus de celles portant l'en-tête X-Profile
+curl -X PUT localhost:8000/api/v1/profiling/ {profiling_curl_auth} \\
+     -H "Content-Type: application/json" -d '{{"enabled": true, "duration": 600, "sample_rate": 0.01}}'
+# Profiler une requête précise (son identifiant revient dans l'en-tête X-Profile-Id)
+curl -i localhost:8000/health -H "X-Profile: 1"
+```
+Les profils sont écrits dans `logs/profiles/` : `.html` (arbre d'appels), `.speedscope.json`
+(flamegraph sur https://www.speedscope.app), `.prof` pour cProfile (`snakeviz`). L'activation est
+partagée entre workers et se coupe d'elle-même après `duration` secondes.
 '''
 
         # Ajouter un rappel migrations dans démarrage rapide si DB active
@@ -162,8 +516,11 @@ pip install -r requirements.txt
 ### Lancement
 
 ```bash
-# Mode développement
-python main.py
+# Mode développement (rechargement automatique)
+python server.py
+
+# Profil de production : un worker par CPU alloué, uvloop + httptools
+python server.py --profile prod
 
 # Ou avec uvicorn
 uvicorn main:app --reload
@@ -179,6 +536,29 @@ make migrate
 
 L'API sera disponible sur [http://localhost:8000](http://localhost:8000)
 
+Le profil se choisit avec `--profile` ou `SERVER_PROFILE` (l'image Docker utilise `prod`,
+docker compose `dev`). En production, `WEB_CONCURRENCY` fixe le nombre de workers (sinon le
+quota CPU du conteneur), `SERVER_KEEPALIVE` doit dépasser le timeout d'inactivité du load
+balancer, et au-delà de `SERVER_LIMIT_CONCURRENCY` connexions par worker le serveur répond
+`503` immédiatement. Pour comparer les deux profils en local :
+```bash
+python benchmarks/server_load.py --duration 10 --connections 100
+```
+
+{tests_section}## 📈 Tests de charge
+
+`tests/load/` rejoue des scénarios construits d'après les modules du projet ({load_scenarios}),
+chaque utilisateur virtuel enchaînant les scénarios selon leur poids. Sans `--base-url`, le
+serveur est lancé en local sur une base SQLite temporaire ; avec `--base-url`, on vise une
+instance déjà démarrée (par exemple `docker compose up`, nécessaire si l'application dépend
+de Redis). Le rapport JSON (`tests/load/results/`) donne p50/p95/p99 et req/s par étape ;
+avec `--baseline`, toute régression au-delà de `--max-regression` fait échouer la commande.
+```bash
+python tests/load/run.py --users 20 --duration 30
+python tests/load/run.py --base-url http://localhost:8000
+python tests/load/run.py --baseline tests/load/results/reference.json --max-regression 0.2
+```
+
 ## 📚 Documentation
 
 - **Swagger UI**: [http://localhost:8000/docs](http://localhost:8000/docs)
@@ -252,17 +632,28 @@ curl -X GET "http://localhost:8000/api/v1/auth/me" \\
 │   ├── routers/         # Routeurs FastAPI
 │   ├── auth/            # Authentification
 │   └── middleware/      # Middleware personnalisés
-├── tests/               # Tests unitaires
+├── tests/               # Tests pytest, benchmarks/ des services, load/ (tests de charge)
 ├── main.py              # Point d'entrée
 ├── pyproject.toml       # Fichier .toml
 ├── pre-commit-config.yaml # Fichier .yaml
 ├── requirements.txt     # Dépendances
+├── requirements-dev.txt # Dépendances de test
 └── README.md            # Ce fichier
 ```
 
 {permissions_section}
 {cors_section}
 {logging_section}
+{orjson_section}
+{compression_section}
+{metrics_section}
+{tracing_section}
+{profiling_section}
+{cache_section}
+{websocket_section}
+{tasks_section}
+{mail_section}
+{oauth_section}
 {structure_details}
 
 ## 🛠️ Développement
@@ -0,0 +1,162 @@
+from typing import List
+
+def get_server_template(selected_modules: List[str]) -> str:
+        """Template pour server.py (profils de lancement dev / prod)"""
+
+        if "logging" in selected_modules:
+            # app.core.logging configure les loggers et remplace l'access log d'Uvicorn (app.access)
+            log_settings = ""
+            log_options = '''        # Loggers configurés par app.core.logging (access log : app.access)
+        "log_config": None,
+        "access_log": False,
+'''
+        else:
+            log_settings = '''    # Access log d'Uvicorn (une ligne par requête, coûteux sous forte charge)
+    SERVER_ACCESS_LOG: bool = True
+'''
+            log_options = '''        "access_log": settings.SERVER_ACCESS_LOG,
+'''
+
+        if "metrics" in selected_modules:
+            metrics_section = '''
+
+def prepare_metrics_dir(workers: int):
+    """Dossier partagé des métriques Prometheus, vidé à chaque démarrage (voir app/core/metrics.py)."""
+    if workers <= 1 and not os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        return
+    path = Path(os.environ.setdefault(
+        "PROMETHEUS_MULTIPROC_DIR", str(Path(tempfile.gettempdir()) / "prometheus-multiproc")
+    ))
+    path.mkdir(parents=True, exist_ok=True)
+    for stale in path.glob("*.db"):
+        stale.unlink()
+'''
+            metrics_call = '''
+    if args.profile == "prod":
+        # Avant le lancement des workers : ils héritent de PROMETHEUS_MULTIPROC_DIR
+        prepare_metrics_dir(options["workers"])'''
+            tempfile_import = "import tempfile\n"
+        else:
+            metrics_section = metrics_call = tempfile_import = ""
+
+        return f'''"""
+Lancement du serveur : profil développement ou production.
+Automatically generated by FastWizard 🧙‍♂️
+
+    python server.py                  # profil SERVER_PROFILE (défaut : dev)
+    python server.py --profile prod
+
+dev  : un processus, rechargement automatique, boucle asyncio et parseur h11 par défaut.
+prod : un worker par CPU alloué au conteneur (quota cgroup), uvloop + httptools,
+       keep-alive et arrêt gracieux bornés, --limit-concurrency par worker (au-delà,
+       réponse 503 immédiate plutôt qu'une file d'attente qui grossit sans limite).
+       Les workers sont supervisés par Uvicorn (redémarrés s'ils meurent).
+"""
+import argparse
+import os
+{tempfile_import}from pathlib import Path
+from typing import Literal, Optional
+
+import uvicorn
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class ServerSettings(BaseSettings):
+    SERVER_PROFILE: Literal["dev", "prod"] = "dev"
+    HOST: str = "0.0.0.0"
+    PORT: int = 8000
+    # Nombre de workers en prod (0 = un par CPU alloué)
+    WEB_CONCURRENCY: int = 0
+    # Durée de vie d'une connexion keep-alive inactive (à garder au-dessus du timeout du load balancer)
+    SERVER_KEEPALIVE: int = 5
+    # Délai laissé aux requêtes en cours à l'arrêt (SIGTERM)
+    SERVER_GRACEFUL_TIMEOUT: int = 30
+    # Connexions et tâches simultanées par worker avant de répondre 503 (0 = illimité)
+    SERVER_LIMIT_CONCURRENCY: int = 1000
+    SERVER_BACKLOG: int = 2048
+    # Redémarre un worker après N requêtes (0 = jamais), contre les fuites mémoire
+    SERVER_MAX_REQUESTS: int = 0
+    # Proxys dont les en-têtes X-Forwarded-* sont pris en compte
+    FORWARDED_ALLOW_IPS: str = "127.0.0.1"
+{log_settings}
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+
+def cgroup_cpu_limit() -> Optional[float]:
+    """Quota CPU du conteneur (cgroup v2 puis v1), None s'il n'y en a pas."""
+    try:
+        quota, period = Path("/sys/fs/cgroup/cpu.max").read_text().split()
+        return None if quota == "max" else int(quota) / int(period)
+    except (OSError, ValueError):
+        pass
+    try:
+        quota = int(Path("/sys/fs/cgroup/cpu/cpu.cfs_quota_us").read_text())
+        period = int(Path("/sys/fs/cgroup/cpu/cpu.cfs_period_us").read_text())
+        return quota / period if quota > 0 and period > 0 else None
+    except (OSError, ValueError):
+        return None
+
+
+def available_cpus() -> int:
+    """CPUs utilisables : affinité du processus, bornée par le quota cgroup (arrondi inférieur)."""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # macOS, Windows
+        cpus = os.cpu_count() or 1
+    limit = cgroup_cpu_limit()
+    if limit is not None:
+        # Plus de workers que le quota ne fait que provoquer du throttling
+        cpus = min(cpus, max(1, int(limit)))
+    return cpus
+
+
+def uvicorn_options(settings: ServerSettings, profile: str, reload: bool = True, workers: int = 0) -> dict:
+    options = {{
+        "host": settings.HOST,
+        "port": settings.PORT,
+        "proxy_headers": True,
+        "forwarded_allow_ips": settings.FORWARDED_ALLOW_IPS,
+{log_options}    }}
+    if profile == "dev":
+        options.update(reload=reload)
+        return options
+
+    options.update(
+        workers=workers or settings.WEB_CONCURRENCY or available_cpus(),
+        # Explicites : Uvicorn échoue au démarrage si uvloop/httptools manquent, au lieu de
+        # se rabattre silencieusement sur asyncio/h11
+        loop="uvloop",
+        http="httptools",
+        timeout_keep_alive=settings.SERVER_KEEPALIVE,
+        timeout_graceful_shutdown=settings.SERVER_GRACEFUL_TIMEOUT,
+        limit_concurrency=settings.SERVER_LIMIT_CONCURRENCY or None,
+        limit_max_requests=settings.SERVER_MAX_REQUESTS or None,
+        backlog=settings.SERVER_BACKLOG,
+        server_header=False,
+    )
+    return options
+{metrics_section}
+
+def main():
+    settings = ServerSettings()
+    parser = argparse.ArgumentParser(description="Lance l'application avec Uvicorn")
+    parser.add_argument("--profile", choices=["dev", "prod"], default=settings.SERVER_PROFILE)
+    parser.add_argument("--port", type=int, default=settings.PORT)
+    parser.add_argument("--workers", type=int, default=0, help="prod : remplace WEB_CONCURRENCY")
+    parser.add_argument("--no-reload", action="store_true", help="dev : sans rechargement automatique")
+    args = parser.parse_args()
+
+    settings.PORT = args.port
+    options = uvicorn_options(settings, args.profile, reload=not args.no_reload, workers=args.workers){metrics_call}
+    summary = ", ".join(f"{{key}}={{value}}" for key, value in options.items() if key not in ("host", "log_config"))
+    print(f"🚀 Profil {{args.profile}} : {{summary}}")
+    uvicorn.run("main:app", **options)
+
+
+if __name__ == "__main__":
+    main()
+'''
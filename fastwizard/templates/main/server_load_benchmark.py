@@ -0,0 +1,172 @@
+def get_server_load_template() -> str:
+        """Template pour benchmarks/server_load.py (profil dev contre profil prod)"""
+        return '''"""
+Test de charge local : profil dev contre profil prod de server.py.
+Automatically generated by FastWizard 🧙‍♂️
+
+Pour chaque profil, lance `python server.py --profile <profil> --no-reload` sur un port libre,
+ouvre --connections connexions keep-alive réparties sur --client-procs processus, et
+envoie des requêtes GET en boucle pendant --duration secondes. Affiche débit, latences
+et réponses 503 (--limit-concurrency). Le client tourne sur la même machine : gardez-lui
+des CPUs (--client-procs) et comparez les profils entre eux plutôt qu'en absolu.
+
+Usage :
+    python benchmarks/server_load.py --duration 10 --connections 100
+    python benchmarks/server_load.py --profiles prod --workers 4 --path /api/v1/food/foods/
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port: int, process: subprocess.Popen, timeout: float = 30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            sys.exit(f"❌ Le serveur s'est arrêté au démarrage (code {process.returncode})")
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    sys.exit("❌ Le serveur n'a pas démarré à temps")
+
+
+async def read_response(reader: asyncio.StreamReader) -> tuple:
+    """Lit une réponse HTTP/1.1 ; retourne (statut, connexion à fermer)."""
+    head = await reader.readuntil(b"\\r\\n\\r\\n")
+    lines = head.decode("latin-1").split("\\r\\n")
+    status = int(lines[0].split(" ", 2)[1])
+    headers = {}
+    for line in lines[1:]:
+        if ":" in line:
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip().lower()
+    if "content-length" in headers:
+        await reader.readexactly(int(headers["content-length"]))
+    elif headers.get("transfer-encoding") == "chunked":
+        while True:
+            size = int((await reader.readuntil(b"\\r\\n")).strip().split(b";")[0], 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    return status, headers.get("connection") == "close"
+
+
+async def connection_loop(port: int, request: bytes, deadline: float, latencies: list, statuses: Counter):
+    writer = None
+    while time.monotonic() < deadline:
+        try:
+            if writer is None:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            start = time.perf_counter()
+            writer.write(request)
+            status, close = await read_response(reader)
+            latencies.append(time.perf_counter() - start)
+            statuses[status] += 1
+        except (OSError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+            statuses["erreur"] += 1
+            close = True
+        if close and writer is not None:
+            writer.close()
+            writer = None
+    if writer is not None:
+        writer.close()
+
+
+def client_process(port: int, path: str, connections: int, duration: float) -> tuple:
+    request = f"GET {path} HTTP/1.1\\r\\nHost: 127.0.0.1:{port}\\r\\n\\r\\n".encode()
+    latencies: list = []
+    statuses: Counter = Counter()
+
+    async def run():
+        deadline = time.monotonic() + duration
+        await asyncio.gather(*(
+            connection_loop(port, request, deadline, latencies, statuses) for _ in range(connections)
+        ))
+
+    asyncio.run(run())
+    return latencies, statuses
+
+
+def load(profile: str, args) -> dict:
+    port = free_port()
+    command = [sys.executable, "server.py", "--profile", profile, "--no-reload", "--port", str(port)]
+    if args.workers:
+        command += ["--workers", str(args.workers)]
+    server = subprocess.Popen(command, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_for_port(port, server)
+        # Échauffement : imports paresseux, pools de connexions
+        client_process(port, args.path, 4, 1.0)
+
+        per_proc = max(1, args.connections // args.client_procs)
+        with multiprocessing.Pool(args.client_procs) as pool:
+            results = pool.starmap(
+                client_process, [(port, args.path, per_proc, args.duration)] * args.client_procs
+            )
+    finally:
+        server.send_signal(signal.SIGTERM)
+        try:
+            server.wait(timeout=40)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+    latencies = sorted(latency for result in results for latency in result[0])
+    statuses = sum((result[1] for result in results), Counter())
+    if not latencies:
+        sys.exit(f"❌ Aucune réponse du profil {profile} ({dict(statuses)})")
+
+    def percentile(p: float) -> float:
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000
+
+    return {
+        "rps": len(latencies) / args.duration,
+        "p50": percentile(0.50),
+        "p99": percentile(0.99),
+        "mean": statistics.fmean(latencies) * 1000,
+        "statuses": statuses,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Test de charge des profils de server.py")
+    parser.add_argument("--profiles", nargs="+", default=["dev", "prod"], choices=["dev", "prod"])
+    parser.add_argument("--path", default="/health")
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--connections", type=int, default=100, help="connexions keep-alive simultanées")
+    parser.add_argument("--client-procs", type=int, default=max(1, (os.cpu_count() or 2) // 2))
+    parser.add_argument("--workers", type=int, default=0, help="prod : nombre de workers (défaut : CPUs)")
+    args = parser.parse_args()
+
+    print(f"GET {args.path}, {args.connections} connexions, {args.duration:.0f} s, {args.client_procs} processus client")
+    print(f"{'profil':<8} {'req/s':>10} {'p50 ms':>9} {'p99 ms':>9} {'moy. ms':>9}  statuts")
+    for profile in args.profiles:
+        result = load(profile, args)
+        statuses = ", ".join(f"{status}: {count}" for status, count in sorted(result["statuses"].items(), key=str))
+        print(
+            f"{profile:<8} {result['rps']:>10.0f} {result['p50']:>9.1f} {result['p99']:>9.1f} "
+            f"{result['mean']:>9.1f}  {statuses}"
+        )
+
+
+if __name__ == "__main__":
+    main()
+'''
@@ -0,0 +1,89 @@
+def get_startup_benchmark_template() -> str:
+        """Template pour benchmarks/startup.py (budget de temps d'import)"""
+        return '''"""
+Mesure du temps d'import de l'application (python -X importtime -c "import main").
+Automatically generated by FastWizard 🧙‍♂️
+
+Chaque mesure tourne dans un interpréteur neuf ; la médiane de --repeat mesures est retenue.
+Affiche le total, le coût de chaque router de app/core/routers.py et les paquets les plus
+lents. Le code de sortie vaut 1 si le total dépasse --budget-ms (à lancer en CI).
+
+Usage :
+    python benchmarks/startup.py --budget-ms 1500
+    python benchmarks/startup.py --lazy       # avec LAZY_ROUTERS=true
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from app.core.routers import ROUTERS  # noqa: E402
+
+LINE = re.compile(r"^import time:\\s+(\\d+) \\|\\s+(\\d+) \\| *(\\S+)")
+# Les routers sont chargés par importlib (absent de -X importtime) : leurs temps viennent de IMPORT_TIMES
+SCRIPT = "import json, sys, main; from app.core.routers import IMPORT_TIMES; print(json.dumps(IMPORT_TIMES))"
+
+
+def measure(lazy: bool) -> tuple:
+    """Temps d'import (self, cumulé) en µs de chaque module et temps des routers en ms, à froid."""
+    env = {**os.environ, "LAZY_ROUTERS": "true" if lazy else "false"}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", SCRIPT],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        sys.exit(f"❌ Import de main impossible :\\n{result.stderr[-3000:]}")
+    modules = {}
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            modules[match.group(3)] = (int(match.group(1)), int(match.group(2)))
+    return modules, json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Temps d'import de l'application")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=0, help="échec au-delà (0 = pas de contrôle)")
+    parser.add_argument("--lazy", action="store_true", help="mesure avec LAZY_ROUTERS=true")
+    parser.add_argument("--top", type=int, default=10, help="paquets les plus lents affichés")
+    args = parser.parse_args()
+
+    runs = [measure(args.lazy) for _ in range(args.repeat)]
+    total = statistics.median(modules["main"][1] for modules, _ in runs) / 1000
+
+    print(f"Import de main : {total:.0f} ms (médiane de {args.repeat}, LAZY_ROUTERS={args.lazy})")
+    print("\\nRouters :")
+    for entry in ROUTERS:
+        times = [routers[entry.module] for _, routers in runs if entry.module in routers]
+        cost = f"{statistics.median(times):7.1f} ms" if times else "   différé"
+        print(f"  {cost}  {entry.prefix:<20} {entry.module}")
+
+    packages = defaultdict(int)
+    for name, (self_us, _) in runs[-1][0].items():
+        packages[name.split(".")[0]] += self_us
+    print("\\nPaquets les plus lents (temps propre) :")
+    for name, self_us in sorted(packages.items(), key=lambda item: item[1], reverse=True)[: args.top]:
+        print(f"  {self_us / 1000:7.1f} ms  {name}")
+
+    if args.budget_ms and total > args.budget_ms:
+        print(f"\\n❌ Budget dépassé : {total:.0f} ms > {args.budget_ms:.0f} ms")
+        sys.exit(1)
+    if args.budget_ms:
+        print(f"\\n✅ Dans le budget : {total:.0f} ms <= {args.budget_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
+'''
@@ -0,0 +1,518 @@
+"""Template pour la file de tâches en arrière-plan (Redis/Valkey)"""
+
+
+def get_redis_url(selected_modules):
+    """Même instance que le cache s'il existe (service docker compose « redis » sinon)."""
+    if "cache-valkey" in selected_modules:
+        return "redis://valkey:6379/0"
+    return "redis://redis:6379/0"
+
+
+def get_template(config):
+    selected_modules = config.get("selected_modules", [])
+    redis_url = get_redis_url(selected_modules)
+    has_auth = "auth-jwt" in selected_modules
+
+    if has_auth:
+        token_setting = ""
+        token_imports = ""
+        token_dependency = ""
+    else:
+        token_setting = '''    # Jeton exigé par les routes /api/v1/tasks (en-tête X-Tasks-Token) ; vide = routes fermées
+    TASKS_TOKEN: str = ""
+'''
+        token_imports = "import secrets\n"
+        token_dependency = '''
+
+def require_tasks_token(x_tasks_token: Optional[str] = Header(default=None)):
+    """Protège les routes /api/v1/tasks : en-tête X-Tasks-Token égal à TASKS_TOKEN."""
+    if not settings.TASKS_TOKEN or not x_tasks_token or not secrets.compare_digest(x_tasks_token, settings.TASKS_TOKEN):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Jeton de tâches invalide")
+'''
+    fastapi_import = "from fastapi import FastAPI" if has_auth else "from fastapi import FastAPI, Header, HTTPException, status"
+
+    return f'''"""
+File de tâches en arrière-plan sur Redis/Valkey.
+Automatically generated by FastWizard 🧙‍♂️
+
+- Côté API : `await enqueue(ma_tache, ...)` dépose la tâche et rend la main aussitôt.
+- Côté worker : `python -m app.worker` exécute les fonctions enregistrées avec @task
+  (app/domains/tasks/jobs.py), jusqu'à TASKS_CONCURRENCY à la fois par processus.
+
+Une tâche qui lève une exception est réessayée jusqu'à max_tries fois, avec un backoff
+exponentiel plafonné (jitter complet) ; `raise Retry(defer=...)` impose le délai et
+`raise TaskAbort(...)` l'abandonne aussitôt. Les tâches abandonnées vont dans la file des
+tâches mortes.
+
+Clés Redis (préfixe TASKS_PREFIX) :
+- <préfixe>:stream    : tâches prêtes, lues par un groupe de consommateurs ; une tâche dont le
+                        worker s'est arrêté est reprise par un autre après TASKS_CLAIM_IDLE s
+- <préfixe>:scheduled : tâches différées et réessais (score = date d'exécution)
+- <préfixe>:job:<id>  : état et résultat d'une tâche (expire TASKS_KEEP_RESULT s après la fin)
+- <préfixe>:dead      : tâches abandonnées (conservées TASKS_DEAD_LETTER_TTL s)
+- <préfixe>:workers   : dernier signe de vie de chaque worker
+"""
+import asyncio
+import inspect
+import json
+import logging
+import os
+import random
+{token_imports}import socket
+import time
+from contextlib import asynccontextmanager, nullcontext
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+from uuid import uuid4
+
+import redis.asyncio as redis
+{fastapi_import}
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from redis.exceptions import RedisError, ResponseError
+
+
+class TaskSettings(BaseSettings):
+    TASKS_REDIS_URL: str = "{redis_url}"
+    TASKS_PREFIX: str = "tasks"
+    # Tâches exécutées simultanément par un processus worker
+    TASKS_CONCURRENCY: int = Field(default=10, ge=1)
+    # Valeurs par défaut de @task : essais (premier compris) et durée maximale d'un essai
+    TASKS_MAX_TRIES: int = Field(default=5, ge=1)
+    TASKS_TIMEOUT: float = 300
+    # Délai entre deux essais : aléatoire entre 0 et min(RETRY_MAX, RETRY_BASE * 2^essai)
+    TASKS_RETRY_BASE: float = 1.0
+    TASKS_RETRY_MAX: float = 300
+    TASKS_KEEP_RESULT: int = 3600
+    TASKS_DEAD_LETTER_TTL: int = 7 * 86400
+    # Un worker renouvelle ses tâches en cours toutes les CLAIM_IDLE / 3 s : au-delà, elles
+    # sont considérées orphelines (worker tué) et reprises
+    TASKS_CLAIM_IDLE: float = 60
+    TASKS_POLL_INTERVAL: float = 1.0
+    # Arrêt du worker (SIGTERM) : attente maximale des tâches en cours
+    TASKS_SHUTDOWN_TIMEOUT: float = 30
+{token_setting}
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+
+settings = TaskSettings()
+logger = logging.getLogger(__name__)
+
+STREAM = f"{{settings.TASKS_PREFIX}}:stream"
+SCHEDULED = f"{{settings.TASKS_PREFIX}}:scheduled"
+DEAD = f"{{settings.TASKS_PREFIX}}:dead"
+WORKERS = f"{{settings.TASKS_PREFIX}}:workers"
+JOB_PREFIX = f"{{settings.TASKS_PREFIX}}:job:"
+GROUP = "workers"
+
+# Création atomique : un job_id déjà présent n'est pas redéposé (idempotence, tâches planifiées)
+ENQUEUE_SCRIPT = """
+if redis.call("EXISTS", KEYS[1]) == 1 then return 0 end
+local run_at = tonumber(ARGV[4])
+redis.call("HSET", KEYS[1], "name", ARGV[2], "payload", ARGV[3], "tries", 0,
+           "enqueued_at", ARGV[5], "status", run_at > 0 and "deferred" or "queued")
+if run_at > 0 then
+    redis.call("ZADD", KEYS[3], run_at, ARGV[1])
+else
+    redis.call("XADD", KEYS[2], "*", "id", ARGV[1])
+end
+return 1
+"""
+
+# Tâches différées arrivées à échéance -> stream ; atomique, donc une seule fois quel que soit
+# le nombre de workers
+PROMOTE_SCRIPT = """
+local ids = redis.call("ZRANGEBYSCORE", KEYS[1], "-inf", ARGV[1], "LIMIT", 0, tonumber(ARGV[2]))
+for _, id in ipairs(ids) do
+    redis.call("ZREM", KEYS[1], id)
+    redis.call("HSET", ARGV[3] .. id, "status", "queued")
+    redis.call("XADD", KEYS[2], "*", "id", id)
+end
+return #ids
+"""
+
+
+class Retry(Exception):
+    """Levée par une tâche pour être réessayée après `defer` secondes (compte comme un essai)."""
+
+    def __init__(self, defer: Optional[float] = None):
+        super().__init__(f"retry in {{defer}}s" if defer is not None else "retry")
+        self.defer = defer
+
+
+class TaskAbort(Exception):
+    """Échec définitif : la tâche n'est pas réessayée."""
+
+
+@dataclass
+class TaskDefinition:
+    name: str
+    func: Callable[..., Any]
+    max_tries: int
+    timeout: float
+    # Exécutions simultanées de cette tâche par processus worker (None = TASKS_CONCURRENCY)
+    concurrency: Optional[int]
+    # Tâche planifiée : lancée aux multiples de `every` secondes, par un seul worker
+    every: Optional[float]
+
+    async def call(self, ctx: Dict[str, Any], args: list, kwargs: dict) -> Any:
+        if inspect.iscoroutinefunction(self.func):
+            return await self.func(ctx, *args, **kwargs)
+        # Fonction synchrone (bcrypt, calcul, bibliothèque bloquante) : dans un thread
+        return await asyncio.to_thread(self.func, ctx, *args, **kwargs)
+
+
+TASKS: Dict[str, TaskDefinition] = {{}}
+
+
+def task(
+    name: Optional[str] = None,
+    *,
+    max_tries: Optional[int] = None,
+    timeout: Optional[float] = None,
+    concurrency: Optional[int] = None,
+    every: Optional[float] = None,
+):
+    """Enregistre `func(ctx, *args, **kwargs)` comme tâche ; ctx contient job_id, job_try et redis."""
+
+    def decorator(func):
+        definition = TaskDefinition(
+            name=name or func.__name__,
+            func=func,
+            max_tries=max_tries or settings.TASKS_MAX_TRIES,
+            timeout=timeout or settings.TASKS_TIMEOUT,
+            concurrency=concurrency,
+            every=every,
+        )
+        TASKS[definition.name] = definition
+        func.task_name = definition.name
+        return func
+
+    return decorator
+
+
+def backoff_delay(attempt: int) -> float:
+    """Backoff exponentiel plafonné avec jitter complet."""
+    return random.uniform(0, min(settings.TASKS_RETRY_MAX, settings.TASKS_RETRY_BASE * 2 ** attempt))
+
+
+def job_key(job_id: str) -> str:
+    return JOB_PREFIX + job_id
+
+
+def keep_seconds(definition: Optional[TaskDefinition]) -> int:
+    """Durée de conservation du résultat ; une tâche planifiée garde son id toute la période
+    (un worker qui démarre ne la relance pas)."""
+    every = definition.every if definition else None
+    return int(max(settings.TASKS_KEEP_RESULT, every or 0))
+
+
+def now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+# --- Côté API : dépôt des tâches et suivi ---
+
+_client: Optional[redis.Redis] = None
+
+
+def get_tasks_redis() -> redis.Redis:
+    global _client
+    if _client is None:
+        _client = redis.from_url(settings.TASKS_REDIS_URL, decode_responses=True)
+    return _client
+
+
+async def enqueue(
+    job: Union[str, Callable[..., Any]],
+    *args: Any,
+    _job_id: Optional[str] = None,
+    _defer: Union[float, timedelta, datetime, None] = None,
+    _redis: Optional[redis.Redis] = None,
+    **kwargs: Any,
+) -> Optional[str]:
+    """Dépose une tâche (nom ou fonction @task, arguments sérialisés en JSON) ; renvoie son id,
+    ou None si une tâche de même `_job_id` existe déjà. `_defer` : délai (s, timedelta) ou date."""
+    name = getattr(job, "task_name", job)
+    job_id = _job_id or uuid4().hex
+    if isinstance(_defer, datetime):
+        run_at = _defer.timestamp()
+    elif isinstance(_defer, timedelta):
+        run_at = time.time() + _defer.total_seconds()
+    else:
+        run_at = time.time() + _defer if _defer else 0
+    payload = json.dumps({{"args": args, "kwargs": kwargs}})
+    created = await (_redis or get_tasks_redis()).eval(
+        ENQUEUE_SCRIPT, 3, job_key(job_id), STREAM, SCHEDULED, job_id, name, payload, run_at, now_iso()
+    )
+    return job_id if created else None
+
+
+async def get_job(job_id: str) -> Optional[Dict[str, Any]]:
+    job = await get_tasks_redis().hgetall(job_key(job_id))
+    if not job:
+        return None
+    job.pop("payload", None)  # arguments non exposés (mots de passe d'un import, etc.)
+    if "result" in job:
+        job["result"] = json.loads(job["result"])
+    job["tries"] = int(job.get("tries", 0))
+    return {{"id": job_id, **job}}
+
+
+async def queue_stats(client: Optional[redis.Redis] = None) -> Dict[str, Any]:
+    client = client or get_tasks_redis()
+    async with client.pipeline(transaction=False) as pipe:
+        pipe.xlen(STREAM)
+        pipe.zcard(SCHEDULED)
+        pipe.xlen(DEAD)
+        pipe.hgetall(WORKERS)
+        ready, scheduled, dead, workers = await pipe.execute()
+    alive, stale = [], []
+    for worker_id, raw in workers.items():
+        info = json.loads(raw)
+        if time.time() - info["seen"] > 3 * settings.TASKS_CLAIM_IDLE:
+            stale.append(worker_id)
+        else:
+            alive.append({{"id": worker_id, **info}})
+    if stale:
+        await client.hdel(WORKERS, *stale)
+    return {{"ready_or_running": ready, "scheduled": scheduled, "dead": dead, "workers": alive}}
+{token_dependency}
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Ferme la connexion de l'API à la file ; elle s'ouvre au premier enqueue."""
+    global _client
+    yield
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+# --- Côté worker ---
+
+Hook = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+class Worker:
+    """Lit le stream, exécute les tâches, planifie les réessais et les tâches périodiques."""
+
+    def __init__(self, concurrency: int = settings.TASKS_CONCURRENCY):
+        self.concurrency = concurrency
+        self.consumer = f"{{socket.gethostname()}}-{{os.getpid()}}"
+        self.redis: Optional[redis.Redis] = None
+        # Ressources partagées par les tâches (clients HTTP...), remplies par on_startup
+        self.ctx: Dict[str, Any] = {{}}
+        self.on_startup: List[Hook] = []
+        self.on_shutdown: List[Hook] = []
+        self.running: Dict[str, asyncio.Task] = {{}}  # id d'entrée du stream -> exécution
+        self.limits = {{
+            name: asyncio.Semaphore(definition.concurrency)
+            for name, definition in TASKS.items()
+            if definition.concurrency
+        }}
+        self.stats = {{"complete": 0, "retried": 0, "failed": 0}}
+        self._stopping = False
+
+    def stop(self):
+        """Arrêt propre (SIGTERM) : plus de nouvelles tâches, celles en cours se terminent."""
+        self._stopping = True
+
+    async def run(self, burst: bool = False):
+        """Boucle principale ; en mode `burst`, s'arrête dès que la file est vide."""
+        self.redis = redis.from_url(settings.TASKS_REDIS_URL, decode_responses=True)
+        try:
+            await self.redis.xgroup_create(STREAM, GROUP, id="0", mkstream=True)
+        except ResponseError as exc:
+            if "BUSYGROUP" not in str(exc):
+                raise
+        self.ctx["redis"] = self.redis
+        for hook in self.on_startup:
+            await hook(self.ctx)
+        logger.info("Worker %s started: %d tasks, concurrency %d", self.consumer, len(TASKS), self.concurrency)
+        background = [asyncio.create_task(self._schedule_loop()), asyncio.create_task(self._heartbeat_loop())]
+        try:
+            await self._consume(burst)
+        finally:
+            await self._drain()
+            for job in background:
+                job.cancel()
+            await asyncio.gather(*background, return_exceptions=True)
+            for hook in self.on_shutdown:
+                await hook(self.ctx)
+            await self.redis.hdel(WORKERS, self.consumer)
+            await self.redis.aclose()
+            logger.info("Worker %s stopped: %s", self.consumer, self.stats)
+
+    async def _consume(self, burst: bool):
+        while not self._stopping:
+            free = self.concurrency - len(self.running)
+            if free <= 0:
+                await asyncio.wait(list(self.running.values()), return_when=asyncio.FIRST_COMPLETED)
+                continue
+            try:
+                if burst:
+                    await self._promote()
+                entries = await self._read(free)
+            except (RedisError, OSError):
+                logger.exception("Task queue unavailable")
+                await asyncio.sleep(settings.TASKS_POLL_INTERVAL)
+                continue
+            for entry_id, fields in entries:
+                if entry_id in self.running:
+                    continue
+                execution = asyncio.create_task(self._execute(entry_id, fields.get("id")))
+                self.running[entry_id] = execution
+                execution.add_done_callback(lambda _, entry_id=entry_id: self.running.pop(entry_id, None))
+            if burst and not entries and not self.running and not await self._due_soon():
+                break
+
+    async def _read(self, count: int) -> list:
+        # D'abord les tâches orphelines (worker arrêté sans acquitter), puis les nouvelles
+        claimed = await self.redis.xautoclaim(
+            STREAM, GROUP, self.consumer,
+            min_idle_time=int(settings.TASKS_CLAIM_IDLE * 1000), start_id="0-0", count=count,
+        )
+        entries = [(entry_id, fields) for entry_id, fields in claimed[1] if fields]
+        if entries:
+            return entries
+        response = await self.redis.xreadgroup(
+            GROUP, self.consumer, {{STREAM: ">"}}, count=count, block=int(settings.TASKS_POLL_INTERVAL * 1000)
+        )
+        return response[0][1] if response else []
+
+    async def _due_soon(self) -> bool:
+        """Mode burst : reste-t-il des tâches différées à moins d'un intervalle de scrutation ?"""
+        due = await self.redis.zrangebyscore(
+            SCHEDULED, "-inf", time.time() + settings.TASKS_POLL_INTERVAL, start=0, num=1
+        )
+        return bool(due)
+
+    async def _execute(self, entry_id: str, job_id: Optional[str]):
+        job = await self.redis.hgetall(job_key(job_id)) if job_id else {{}}
+        if not job:
+            await self._ack(entry_id)  # tâche expirée ou entrée invalide
+            return
+        key = job_key(job_id)
+        definition = TASKS.get(job["name"])
+        tries = await self.redis.hincrby(key, "tries", 1)
+        if definition is None:
+            await self._fail(entry_id, job_id, job, f"Tâche inconnue : {{job['name']}}")
+            return
+        await self.redis.hset(key, mapping={{"status": "running", "started_at": now_iso(), "worker": self.consumer}})
+        payload = json.loads(job["payload"])
+        ctx = {{**self.ctx, "job_id": job_id, "job_try": tries}}
+        started = time.perf_counter()
+        try:
+            async with self.limits.get(definition.name) or nullcontext():
+                # Une tâche synchrone dépassant le délai n'est pas interrompue : son thread se termine seul
+                result = await asyncio.wait_for(
+                    definition.call(ctx, payload["args"], payload["kwargs"]), definition.timeout
+                )
+        except TaskAbort as exc:
+            await self._fail(entry_id, job_id, job, str(exc) or "abandonnée")
+        except Exception as exc:
+            if isinstance(exc, asyncio.TimeoutError):
+                error = f"Durée maximale dépassée ({{definition.timeout}} s)"
+            else:
+                error = f"{{exc.__class__.__name__}}: {{exc}}"
+            if tries >= definition.max_tries:
+                logger.error("Task %s (%s) failed after %d tries: %s", definition.name, job_id, tries, error)
+                await self._fail(entry_id, job_id, job, error)
+                return
+            delay = exc.defer if isinstance(exc, Retry) and exc.defer is not None else backoff_delay(tries)
+            logger.warning("Task %s (%s) try %d failed (%s), retrying in %.1fs", definition.name, job_id, tries, error, delay)
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.hset(key, mapping={{"status": "retrying", "error": error}})
+                pipe.zadd(SCHEDULED, {{job_id: time.time() + delay}})
+                pipe.xack(STREAM, GROUP, entry_id)
+                pipe.xdel(STREAM, entry_id)
+                await pipe.execute()
+            self.stats["retried"] += 1
+        else:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.hset(key, mapping={{
+                    "status": "complete",
+                    "finished_at": now_iso(),
+                    "duration": round(time.perf_counter() - started, 4),
+                    "result": json.dumps(result, default=str),
+                }})
+                pipe.hdel(key, "payload", "error")
+                pipe.expire(key, keep_seconds(definition))
+                pipe.xack(STREAM, GROUP, entry_id)
+                pipe.xdel(STREAM, entry_id)
+                await pipe.execute()
+            self.stats["complete"] += 1
+        # CancelledError (arrêt du worker) n'est pas interceptée : non acquittée, la tâche sera reprise
+
+    async def _fail(self, entry_id: str, job_id: str, job: Dict[str, str], error: str):
+        key = job_key(job_id)
+        min_id = int((time.time() - settings.TASKS_DEAD_LETTER_TTL) * 1000)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            # Arguments conservés dans la file des tâches mortes pour un éventuel rejeu
+            pipe.xadd(DEAD, {{"id": job_id, "name": job["name"], "payload": job.get("payload", ""), "error": error}}, minid=min_id)
+            pipe.hset(key, mapping={{"status": "failed", "finished_at": now_iso(), "error": error}})
+            pipe.hdel(key, "payload")
+            pipe.expire(key, keep_seconds(TASKS.get(job["name"])))
+            pipe.xack(STREAM, GROUP, entry_id)
+            pipe.xdel(STREAM, entry_id)
+            await pipe.execute()
+        self.stats["failed"] += 1
+
+    async def _ack(self, entry_id: str):
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.xack(STREAM, GROUP, entry_id)
+            pipe.xdel(STREAM, entry_id)
+            await pipe.execute()
+
+    async def _promote(self) -> int:
+        return await self.redis.eval(PROMOTE_SCRIPT, 2, SCHEDULED, STREAM, time.time(), 100, JOB_PREFIX)
+
+    async def _schedule_loop(self):
+        """Réessais et tâches différées arrivés à échéance, puis tâches périodiques."""
+        periodic = [definition for definition in TASKS.values() if definition.every]
+        # Période en cours déjà entamée au démarrage : première exécution à la suivante
+        last_slot = {{definition.name: int(time.time() // definition.every) for definition in periodic}}
+        while True:
+            try:
+                while await self._promote() == 100:
+                    pass
+                now = time.time()
+                for definition in periodic:
+                    slot = int(now // definition.every)
+                    if slot != last_slot[definition.name]:
+                        # Même id pour tous les workers : une seule exécution par période
+                        await enqueue(definition.name, _job_id=f"{{definition.name}}:{{slot}}", _redis=self.redis)
+                        last_slot[definition.name] = slot
+            except (RedisError, OSError):
+                logger.exception("Task scheduler: queue unavailable")
+            await asyncio.sleep(settings.TASKS_POLL_INTERVAL)
+
+    async def _heartbeat_loop(self):
+        """Renouvelle les tâches en cours (sinon reprises par un autre worker) et signale le worker."""
+        while True:
+            try:
+                if self.running:
+                    await self.redis.xclaim(
+                        STREAM, GROUP, self.consumer, min_idle_time=0, message_ids=list(self.running), justid=True
+                    )
+                info = {{"seen": time.time(), "running": len(self.running), **self.stats}}
+                await self.redis.hset(WORKERS, self.consumer, json.dumps(info))
+            except (RedisError, OSError):
+                logger.exception("Task heartbeat: queue unavailable")
+            await asyncio.sleep(settings.TASKS_CLAIM_IDLE / 3)
+
+    async def _drain(self):
+        if not self.running:
+            return
+        logger.info("Waiting for %d running tasks", len(self.running))
+        done, pending = await asyncio.wait(list(self.running.values()), timeout=settings.TASKS_SHUTDOWN_TIMEOUT)
+        for execution in pending:
+            execution.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+'''
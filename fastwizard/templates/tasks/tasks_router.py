@@ -0,0 +1,77 @@
+"""Template pour le router de suivi des tâches en arrière-plan"""
+def get_template(config):
+    selected_modules = config.get("selected_modules", [])
+    has_auth = "auth-jwt" in selected_modules
+
+    # Réservé aux admins avec l'authentification, sinon au jeton TASKS_TOKEN
+    if "auth-permissions" in selected_modules:
+        guard_import = "from app.core.permissions import require_admin\n"
+        guard = "require_admin"
+        tasks_import = "from app.core.tasks import enqueue, get_job, queue_stats"
+    elif has_auth:
+        guard_import = "from app.domains.auth.dependencies import get_current_admin_user\n"
+        guard = "get_current_admin_user"
+        tasks_import = "from app.core.tasks import enqueue, get_job, queue_stats"
+    else:
+        guard_import = ""
+        guard = "require_tasks_token"
+        tasks_import = "from app.core.tasks import get_job, queue_stats, require_tasks_token"
+
+    import_section = ""
+    typing_import = ""
+    pydantic_import = ""
+    if has_auth:
+        typing_import = "from typing import List\n\n"
+        pydantic_import = "from pydantic import BaseModel, Field\n"
+        guard_import += "from app.domains.auth.schemas import UserCreate\nfrom app.domains.tasks.jobs import import_users\n"
+        import_section = '''
+
+class UserImport(BaseModel):
+    users: List[UserCreate] = Field(min_length=1, max_length=1000)
+
+
+@router.post("/users/import", status_code=status.HTTP_202_ACCEPTED)
+async def import_users_route(payload: UserImport):
+    """Import de comptes en lot par le worker : la requête ne paie pas le hash bcrypt de chaque
+    mot de passe. Les mots de passe transitent par Redis jusqu'à la fin de la tâche."""
+    try:
+        job_id = await enqueue(import_users, [user.model_dump() for user in payload.users])
+    except RedisError:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="File de tâches indisponible")
+    return {"job_id": job_id, "status_url": f"/api/v1/tasks/jobs/{job_id}"}
+'''
+
+    local_imports = "\n".join(sorted((guard_import + tasks_import).splitlines()))
+
+    return f'''"""
+Suivi des tâches en arrière-plan : état de la file, des workers et d'une tâche.
+Automatically generated by FastWizard 🧙‍♂️
+"""
+{typing_import}from fastapi import APIRouter, Depends, HTTPException, status
+{pydantic_import}from redis.exceptions import RedisError
+
+{local_imports}
+
+router = APIRouter(dependencies=[Depends({guard})])
+
+
+@router.get("/")
+async def tasks_status():
+    """Tâches prêtes ou en cours, différées, abandonnées, et workers actifs."""
+    try:
+        return await queue_stats()
+    except RedisError:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="File de tâches indisponible")
+
+
+@router.get("/jobs/{{job_id}}")
+async def job_status(job_id: str):
+    """État, nombre d'essais, dernière erreur et résultat (conservé TASKS_KEEP_RESULT s)."""
+    try:
+        job = await get_job(job_id)
+    except RedisError:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="File de tâches indisponible")
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Tâche introuvable ou expirée")
+    return job
+{import_section}'''
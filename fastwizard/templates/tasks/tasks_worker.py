@@ -0,0 +1,60 @@
+"""Template pour le point d'entrée du worker de tâches"""
+
+
+def get_template(config):
+    selected_modules = config.get("selected_modules", [])
+    has_mail = "mail-brevo" in selected_modules or "mail-mailjet" in selected_modules
+
+    if "logging" in selected_modules:
+        logging_import = "from app.core.logging import setup_logging, stop_logging\n"
+        logging_setup = "    setup_logging()\n"
+        logging_stop = "\n    stop_logging()"
+        std_logging = ""
+    else:
+        logging_import = ""
+        std_logging = "import logging\n"
+        logging_setup = '    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")\n'
+        logging_stop = ""
+
+    hooks = ""
+    if has_mail:
+        hooks = '''    # Client HTTP du fournisseur d'emails, ouvert une fois pour toutes les tâches
+    worker.on_startup.append(jobs.start_mail_service)
+    worker.on_shutdown.append(jobs.close_mail_service)
+'''
+
+    return f'''"""
+Worker des tâches en arrière-plan.
+Automatically generated by FastWizard 🧙‍♂️
+
+Usage :
+    python -m app.worker                   # en continu (service « worker » de docker compose)
+    python -m app.worker --burst           # vide la file puis s'arrête (CI, scripts)
+    python -m app.worker --concurrency 20  # tâches simultanées (défaut : TASKS_CONCURRENCY)
+
+Plusieurs workers peuvent tourner en parallèle (docker compose up --scale worker=4) :
+chaque tâche n'est exécutée que par l'un d'eux. SIGTERM laisse finir les tâches en cours.
+"""
+import argparse
+import asyncio
+{std_logging}import signal
+
+{logging_import}from app.core.tasks import Worker, settings
+from app.domains.tasks import jobs  # noqa: F401  (enregistre les tâches)
+
+
+async def main(burst: bool, concurrency: int):
+{logging_setup}    worker = Worker(concurrency=concurrency)
+{hooks}    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+    await worker.run(burst=burst){logging_stop}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Worker des tâches en arrière-plan")
+    parser.add_argument("--burst", action="store_true", help="s'arrêter quand la file est vide")
+    parser.add_argument("--concurrency", type=int, default=settings.TASKS_CONCURRENCY)
+    args = parser.parse_args()
+    asyncio.run(main(args.burst, args.concurrency))
+'''
@@ -0,0 +1,207 @@
+def get_load_harness_template() -> str:
+        """Template pour tests/load/harness.py (client HTTP, mesures et registre des scénarios)"""
+        return '''"""
+Outils des tests de charge : registre des scénarios, utilisateurs virtuels, client HTTP/1.1
+keep-alive minimal et enregistrement des mesures.
+Automatically generated by FastWizard 🧙‍♂️
+
+Le client n'a pas de dépendance (asyncio seul) : il doit coûter bien moins cher que le
+serveur mesuré, sinon c'est lui que le test de charge mesure.
+"""
+import asyncio
+import json
+import time
+from collections import Counter, defaultdict
+from contextlib import suppress
+from typing import Awaitable, Callable, Dict, List, Optional
+from urllib.parse import urlencode, urlsplit
+
+
+class LoadTestError(Exception):
+    """Réponse inattendue : l'itération du scénario s'arrête, l'étape est comptée en erreur."""
+
+
+class Scenario:
+    def __init__(self, name: str, weight: int, run: Callable[["HttpClient", "VirtualUser"], Awaitable[None]]):
+        self.name = name
+        self.weight = weight
+        self.run = run
+
+
+SCENARIOS: Dict[str, Scenario] = {}
+
+
+def scenario(name: str, weight: int = 1):
+    """Enregistre une coroutine `(client, user)` ; le poids règle sa fréquence relative."""
+    def register(run):
+        SCENARIOS[name] = Scenario(name, weight, run)
+        return run
+    return register
+
+
+class VirtualUser:
+    def __init__(self, index: int):
+        self.index = index
+        self.iteration = 0
+        self.state: dict = {}  # conservé d'une itération à l'autre (jetons, connexions WebSocket)
+        self.cleanups: List[Callable[[], Awaitable]] = []  # appelés à la fin du test
+
+    async def close(self):
+        for cleanup in self.cleanups:
+            with suppress(Exception):
+                await cleanup()
+
+
+class Recorder:
+    """Latences et statuts par étape (« POST /api/v1/auth/login »), pour tout le test."""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Dict[str, Counter] = defaultdict(Counter)
+        self.errors: Counter = Counter()
+        self.iterations: Counter = Counter()
+        self.failures: Counter = Counter()
+        self.recording = True  # False pendant l'échauffement
+
+    def record(self, step: str, latency: float, status, ok: bool):
+        if not self.recording:
+            return
+        self.latencies[step].append(latency)
+        self.statuses[step][str(status)] += 1
+        if not ok:
+            self.errors[step] += 1
+
+    def iteration(self, scenario_name: str, ok: bool):
+        if self.recording:
+            self.iterations[scenario_name] += 1
+            if not ok:
+                self.failures[scenario_name] += 1
+
+    def report(self, duration: float) -> dict:
+        steps = {}
+        for step in sorted(self.latencies):
+            steps[step] = summarize(self.latencies[step], duration)
+            steps[step]["errors"] = self.errors[step]
+            steps[step]["statuses"] = dict(self.statuses[step])
+        total = summarize([latency for values in self.latencies.values() for latency in values], duration)
+        total["errors"] = sum(self.errors.values())
+        scenarios = {
+            name: {"iterations": count, "failures": self.failures[name]} for name, count in sorted(self.iterations.items())
+        }
+        return {"total": total, "scenarios": scenarios, "steps": steps}
+
+
+def summarize(latencies: List[float], duration: float) -> dict:
+    values = sorted(latencies)
+    if not values:
+        return {"count": 0, "rps": 0.0}
+
+    def percentile(p: float) -> float:
+        return round(values[min(len(values) - 1, int(len(values) * p))] * 1000, 3)
+
+    return {
+        "count": len(values),
+        "rps": round(len(values) / duration, 1),
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+        "max_ms": round(values[-1] * 1000, 3),
+    }
+
+
+class Response:
+    __slots__ = ("status", "body")
+
+    def __init__(self, status: int, body: bytes):
+        self.status = status
+        self.body = body
+
+    def json(self):
+        return json.loads(self.body)
+
+
+class HttpClient:
+    """Une connexion keep-alive par utilisateur virtuel, rouverte si le serveur la ferme."""
+
+    def __init__(self, base_url: str, recorder: Recorder, timeout: float = 30):
+        self.base_url = base_url.rstrip("/")
+        url = urlsplit(base_url)
+        if url.scheme != "http":
+            raise ValueError("Seul http:// est pris en charge (visez l'application, pas le proxy TLS)")
+        self.host = url.hostname
+        self.port = url.port or 80
+        self.host_header = url.netloc
+        self.recorder = recorder
+        self.timeout = timeout
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+
+    def ws_url(self, path: str) -> str:
+        return "ws" + self.base_url[len("http"):] + path
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.reader = self.writer = None
+
+    async def request(self, method: str, path: str, json_body=None, form=None, headers=None,
+                      expected=(200,), step: Optional[str] = None) -> Response:
+        """Envoie la requête et enregistre sa latence sous `step` (par défaut « MÉTHODE chemin »)."""
+        step = step or f"{method} {path.split('?')[0]}"
+        body = b""
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {self.host_header}"]
+        if json_body is not None:
+            body = json.dumps(json_body).encode()
+            lines.append("Content-Type: application/json")
+        elif form is not None:
+            body = urlencode(form).encode()
+            lines.append("Content-Type: application/x-www-form-urlencoded")
+        if body or method in ("POST", "PUT", "PATCH"):
+            lines.append(f"Content-Length: {len(body)}")
+        for name, value in (headers or {}).items():
+            lines.append(f"{name}: {value}")
+        payload = ("\\r\\n".join(lines) + "\\r\\n\\r\\n").encode("latin-1") + body
+
+        start = time.perf_counter()
+        try:
+            if self.writer is None:
+                self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+            self.writer.write(payload)
+            status, response_body, close = await asyncio.wait_for(self._read_response(), self.timeout)
+        except (OSError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError, ValueError) as exc:
+            self.recorder.record(step, time.perf_counter() - start, "erreur", ok=False)
+            await self.close()
+            raise LoadTestError(f"{step} : {exc!r}") from exc
+        latency = time.perf_counter() - start
+        if close:
+            await self.close()
+
+        ok = status in expected
+        self.recorder.record(step, latency, status, ok)
+        if not ok:
+            raise LoadTestError(f"{step} : statut {status} ({response_body[:200]!r})")
+        return Response(status, response_body)
+
+    async def _read_response(self):
+        head = await self.reader.readuntil(b"\\r\\n\\r\\n")
+        lines = head.decode("latin-1").split("\\r\\n")
+        status = int(lines[0].split(" ", 2)[1])
+        headers = {}
+        for line in lines[1:]:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+        if "content-length" in headers:
+            body = await self.reader.readexactly(int(headers["content-length"]))
+        elif headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await self.reader.readuntil(b"\\r\\n")).strip().split(b";")[0], 16)
+                chunks.append((await self.reader.readexactly(size + 2))[:-2])
+                if size == 0:
+                    break
+            body = b"".join(chunks)
+        else:
+            body = b""
+        return status, body, headers.get("connection", "").lower() == "close"
+'''
@@ -0,0 +1,236 @@
+def get_load_runner_template() -> str:
+        """Template pour tests/load/run.py (lancement, rapport JSON, comparaison à une référence)"""
+        return '''"""
+Tests de charge du projet : scénarios de tests/load/scenarios.py.
+Automatically generated by FastWizard 🧙‍♂️
+
+Sans --base-url, lance l'application en local (`python server.py --no-reload`) sur une base
+SQLite temporaire (migrations Alembic puis tables manquantes), le backend WebSocket en
+mémoire. Avec --base-url, vise une instance déjà démarrée, par exemple `docker compose up`
+(nécessaire si l'application dépend de services externes : Redis, ...).
+
+Rapport JSON (--output) : p50/p95/p99/max et req/s par étape, par scénario et au total.
+Avec --baseline, compare au rapport de référence et sort en erreur (code 1) en cas de
+régression au-delà de --max-regression (p95 par étape, débit total).
+
+Usage :
+    python tests/load/run.py --users 20 --duration 30
+    python tests/load/run.py --base-url http://localhost:8000 --scenarios auth
+    python tests/load/run.py --baseline tests/load/results/reference.json --max-regression 0.2
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+ROOT = HERE.parent.parent
+sys.path.insert(0, str(HERE))
+
+from harness import SCENARIOS, HttpClient, LoadTestError, Recorder, VirtualUser  # noqa: E402
+import scenarios  # noqa: E402,F401  (enregistre les scénarios)
+
+# Création des tables absentes des migrations (domaines CRUD)
+CREATE_TABLES = """
+import importlib
+from pathlib import Path
+from app.database import Base, engine
+for model in sorted(Path("app/domains").glob("*/model.py")):
+    importlib.import_module(f"app.domains.{model.parent.name}.model")
+Base.metadata.create_all(bind=engine)
+"""
+# Sortie du serveur local (tracebacks des réponses 500)
+SERVER_LOG = HERE / "results" / "server.log"
+# En dessous, une étape est trop peu mesurée pour comparer son p95
+MIN_COUNT_FOR_COMPARISON = 20
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port: int, process: subprocess.Popen, timeout: float = 30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            sys.exit(f"❌ Le serveur s'est arrêté au démarrage (code {process.returncode})")
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    sys.exit("❌ Le serveur n'a pas démarré à temps")
+
+
+def run_step(label: str, command: list, env: dict):
+    result = subprocess.run(command, cwd=ROOT, env=env, capture_output=True, text=True)
+    if result.returncode:
+        sys.exit(f"❌ {label} : échec\\n{result.stderr}")
+
+
+def local_environment(directory: Path, args) -> dict:
+    """Variables d'environnement du serveur local : base SQLite jetable, services en mémoire."""
+    env = {**os.environ, "DOCKER_ENV": ""}
+    if (ROOT / "app" / "database.py").exists():
+        env["DATABASE_URL"] = f"sqlite:///{directory / 'load.db'}"
+        if (ROOT / "alembic.ini").exists():
+            run_step("Migrations Alembic", [sys.executable, "-m", "alembic", "upgrade", "head"], env)
+        run_step("Création des tables", [sys.executable, "-c", CREATE_TABLES], env)
+    if (ROOT / "app" / "core" / "websocket.py").exists() and args.workers <= 1:
+        env["WS_BACKEND"] = "memory"  # un seul worker : pas besoin de Redis pour la diffusion
+    return env
+
+
+def start_server(env: dict, args):
+    port = free_port()
+    command = [sys.executable, "server.py", "--profile", args.profile, "--no-reload", "--port", str(port)]
+    if args.workers:
+        command += ["--workers", str(args.workers)]
+    SERVER_LOG.parent.mkdir(parents=True, exist_ok=True)
+    with SERVER_LOG.open("w", encoding="utf-8") as log:
+        server = subprocess.Popen(command, cwd=ROOT, env=env, stdout=log, stderr=subprocess.STDOUT)
+    wait_for_port(port, server)
+    return server, f"http://127.0.0.1:{port}"
+
+
+def stop_server(server: subprocess.Popen):
+    server.send_signal(signal.SIGTERM)
+    try:
+        server.wait(timeout=40)
+    except subprocess.TimeoutExpired:
+        server.kill()
+
+
+async def user_loop(index: int, base_url: str, selected: list, recorder: Recorder, deadline: float):
+    user = VirtualUser(index)
+    client = HttpClient(base_url, recorder)
+    weights = [item.weight for item in selected]
+    try:
+        while time.monotonic() < deadline:
+            item = random.choices(selected, weights)[0]
+            try:
+                await item.run(client, user)
+                recorder.iteration(item.name, ok=True)
+            except LoadTestError:
+                recorder.iteration(item.name, ok=False)
+            user.iteration += 1
+    finally:
+        await user.close()
+        await client.close()
+
+
+async def run_load(base_url: str, selected: list, args) -> dict:
+    recorder = Recorder()
+    recorder.recording = args.warmup <= 0
+    start = time.monotonic()
+    deadline = start + args.warmup + args.duration
+    users = [
+        asyncio.create_task(user_loop(index, base_url, selected, recorder, deadline)) for index in range(args.users)
+    ]
+    if args.warmup > 0:
+        # Échauffement : connexions, imports paresseux, caches ; non mesuré
+        await asyncio.sleep(args.warmup)
+        recorder.recording = True
+    measured = time.monotonic()
+    await asyncio.gather(*users)
+    return recorder.report(time.monotonic() - measured)
+
+
+def compare(report: dict, baseline: dict, max_regression: float) -> list:
+    """Régressions par rapport à la référence : p95 d'une étape, débit total."""
+    regressions = []
+    for step, current in report["steps"].items():
+        previous = baseline.get("steps", {}).get(step)
+        if not previous or min(current["count"], previous["count"]) < MIN_COUNT_FOR_COMPARISON:
+            continue
+        if current["p95_ms"] > previous["p95_ms"] * (1 + max_regression):
+            regressions.append(f"{step} : p95 {previous['p95_ms']:.1f} ms → {current['p95_ms']:.1f} ms")
+    previous_rps = baseline.get("total", {}).get("rps", 0)
+    if previous_rps and report["total"]["rps"] < previous_rps * (1 - max_regression):
+        regressions.append(f"débit total : {previous_rps:.0f} → {report['total']['rps']:.0f} req/s")
+    return regressions
+
+
+def print_report(report: dict):
+    print(f"{'étape':<45} {'requêtes':>9} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'erreurs':>8}")
+    for step, stats in [*report["steps"].items(), ("TOTAL", report["total"])]:
+        if not stats["count"]:
+            continue
+        print(
+            f"{step:<45} {stats['count']:>9} {stats['rps']:>8.1f} {stats['p50_ms']:>8.1f} "
+            f"{stats['p95_ms']:>8.1f} {stats['p99_ms']:>8.1f} {stats['errors']:>8}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tests de charge du projet")
+    parser.add_argument("--base-url", help="instance déjà démarrée (défaut : serveur local sur SQLite)")
+    parser.add_argument("--profile", choices=["dev", "prod"], default="prod", help="profil du serveur local")
+    parser.add_argument("--workers", type=int, default=1, help="workers du serveur local (profil prod)")
+    parser.add_argument("--users", type=int, default=20, help="utilisateurs virtuels simultanés")
+    parser.add_argument("--duration", type=float, default=30, help="durée mesurée (secondes)")
+    parser.add_argument("--warmup", type=float, default=3, help="échauffement non mesuré (secondes)")
+    parser.add_argument("--scenarios", nargs="+", choices=sorted(SCENARIOS), default=sorted(SCENARIOS))
+    parser.add_argument("--output", type=Path, help="rapport JSON (défaut : tests/load/results/<horodatage>.json)")
+    parser.add_argument("--baseline", type=Path, help="rapport de référence à comparer")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="écart toléré (0.2 = 20 %%)")
+    args = parser.parse_args()
+
+    selected = [SCENARIOS[name] for name in args.scenarios]
+    timestamp = time.strftime("%Y%m%d-%H%M%S")
+    server = None
+    with tempfile.TemporaryDirectory(prefix="load-") as directory:
+        try:
+            if args.base_url:
+                base_url = args.base_url
+            else:
+                server, base_url = start_server(local_environment(Path(directory), args), args)
+            print(f"{base_url} : {args.users} utilisateurs, {args.duration:.0f} s, scénarios {', '.join(args.scenarios)}")
+            report = asyncio.run(run_load(base_url, selected, args))
+        finally:
+            if server is not None:
+                stop_server(server)
+
+    report = {
+        "meta": {
+            "project": ROOT.name,
+            "timestamp": timestamp,
+            "base_url": args.base_url or "local",
+            "profile": None if args.base_url else args.profile,
+            "users": args.users,
+            "duration": args.duration,
+            "scenarios": args.scenarios,
+        },
+        **report,
+    }
+    output = args.output or HERE / "results" / f"{timestamp}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    print_report(report)
+    print(f"Rapport : {output}")
+    if report["total"]["errors"] and not args.base_url:
+        print(f"⚠️  {report['total']['errors']} erreurs : voir {SERVER_LOG}")
+
+    if args.baseline:
+        regressions = compare(report, json.loads(args.baseline.read_text(encoding="utf-8")), args.max_regression)
+        if regressions:
+            print(f"❌ Régressions (> {args.max_regression:.0%}) par rapport à {args.baseline} :")
+            for regression in regressions:
+                print(f"   • {regression}")
+            sys.exit(1)
+        print(f"✅ Aucune régression par rapport à {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
+'''
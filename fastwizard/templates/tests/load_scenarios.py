@@ -0,0 +1,138 @@
+from typing import Dict, List
+
+# Valeur d'exemple par type de champ CRUD (expression Python évaluée dans le scénario)
+SAMPLE_VALUES = {
+    "str": 'f"load-{user.index}-{user.iteration}"',
+    "int": "user.iteration",
+    "float": "user.iteration * 1.5",
+    "bool": "user.iteration % 2 == 0",
+    "datetime": "datetime.now(timezone.utc).isoformat()",
+}
+
+
+def get_load_scenarios_template(selected_modules: List[str], crud_entities: Dict[str, dict]) -> str:
+        """Template pour tests/load/scenarios.py (scénarios construits d'après les modules choisis)"""
+
+        imports = ["import secrets"]
+        third_party = []
+        harness_imports = ["HttpClient", "VirtualUser", "scenario"]
+        sections = []
+
+        if "auth-jwt" in selected_modules:
+            sections.append('''
+
+PASSWORD = "LoadTest-Passw0rd!"
+
+
+@scenario("auth", weight=1)
+async def auth(client: HttpClient, user: VirtualUser):
+    """Inscription, connexion, rafraîchissement du jeton puis profil (hachage bcrypt : coûteux)."""
+    username = f"load_{RUN_ID}_{user.index}_{user.iteration}"
+    await client.request(
+        "POST", "/api/v1/auth/register",
+        json_body={"username": username, "email": f"{username}@example.com", "password": PASSWORD},
+        expected=(201,),
+    )
+    tokens = (await client.request(
+        "POST", "/api/v1/auth/login", form={"username": username, "password": PASSWORD}
+    )).json()
+    tokens = (await client.request(
+        "POST", "/api/v1/auth/refresh", json_body={"refresh_token": tokens["refresh_token"]}
+    )).json()
+    await client.request("GET", "/api/v1/auth/me", headers={"Authorization": f"Bearer {tokens['access_token']}"})
+''')
+
+        if "crud" in selected_modules:
+            for app_name, entity in crud_entities.items():
+                fields = entity.get("fields", {})
+                payload = ", ".join(
+                    f'"{name}": {SAMPLE_VALUES.get(field_type, SAMPLE_VALUES["str"])}'
+                    for name, field_type in fields.items()
+                )
+                if "datetime" in fields.values() and "from datetime import datetime, timezone" not in imports:
+                    imports.append("from datetime import datetime, timezone")
+                base = f"/api/v1/{app_name}/{entity['model_name']}s/"
+                sections.append(f'''
+
+@scenario("{app_name}", weight=2)
+async def crud_{app_name}(client: HttpClient, user: VirtualUser):
+    """Création d'un {entity["ModelName"]} puis liste paginée."""
+    await client.request("POST", "{base}", json_body={{{payload}}})
+    await client.request("GET", "{base}?limit=20")
+''')
+
+        if "websocket" in selected_modules:
+            imports = ["import asyncio", *imports, "import time"]
+            harness_imports.insert(1, "LoadTestError")
+            third_party.append('''try:
+    from websockets.asyncio.client import connect as ws_connect
+except ImportError:  # websockets < 13
+    from websockets import connect as ws_connect''')
+            sections.append('''
+
+# Connexions par room (émetteur compris) : chaque message est diffusé à toutes
+WS_LISTENERS = 5
+
+
+async def wait_for_message(socket, token: str):
+    while True:
+        message = await socket.recv()
+        if isinstance(message, str) and message.endswith(" " + token):  # "[room] <token>" ; ignore les pings
+            return
+
+
+@scenario("ws_broadcast", weight=1)
+async def ws_broadcast(client: HttpClient, user: VirtualUser):
+    """Un message envoyé dans une room de WS_LISTENERS connexions : latence jusqu'au dernier destinataire."""
+    sockets = user.state.get("ws")
+    if sockets is None:
+        room = f"load-{RUN_ID}-{user.index}"
+        start = time.perf_counter()
+        try:
+            sockets = [await ws_connect(client.ws_url(f"/ws/room/{room}")) for _ in range(WS_LISTENERS)]
+        except (OSError, asyncio.TimeoutError, ValueError) as exc:
+            client.recorder.record("WS connect /ws/room/{room}", time.perf_counter() - start, "erreur", ok=False)
+            raise LoadTestError(f"connexion WebSocket : {exc!r}") from exc
+        client.recorder.record("WS connect /ws/room/{room}", (time.perf_counter() - start) / WS_LISTENERS, 101, ok=True)
+        user.state["ws"] = sockets
+
+        async def close_sockets():
+            await asyncio.gather(*(socket.close() for socket in sockets), return_exceptions=True)
+
+        user.cleanups.append(close_sockets)
+
+    token = f"{RUN_ID}-{user.index}-{user.iteration}"
+    start = time.perf_counter()
+    try:
+        await sockets[0].send(token)
+        await asyncio.wait_for(asyncio.gather(*(wait_for_message(socket, token) for socket in sockets)), timeout=5)
+    except Exception as exc:  # délai dépassé ou connexion fermée : reconnexion à l'itération suivante
+        client.recorder.record("WS broadcast /ws/room/{room}", time.perf_counter() - start, "erreur", ok=False)
+        user.state.pop("ws", None)
+        await asyncio.gather(*(socket.close() for socket in sockets), return_exceptions=True)
+        raise LoadTestError(f"diffusion WebSocket : {exc!r}") from exc
+    client.recorder.record("WS broadcast /ws/room/{room}", time.perf_counter() - start, "ok", ok=True)
+''')
+
+        third_party_block = ("\n" + "\n".join(third_party) + "\n") if third_party else ""
+
+        return f'''"""
+Scénarios des tests de charge, construits d'après les modules du projet.
+Automatically generated by FastWizard 🧙‍♂️
+
+Chaque scénario est une coroutine `(client, user)` que chaque utilisateur virtuel exécute en
+boucle ; le poids règle sa fréquence relative. Une étape = une requête, mesurée sous
+« MÉTHODE chemin » (ou `step=...`). Ajoutez vos propres scénarios avec @scenario.
+"""
+{chr(10).join(imports)}
+{third_party_block}
+from harness import {", ".join(harness_imports)}
+
+# Suffixe des données créées : plusieurs exécutions sur la même base ne se marchent pas dessus
+RUN_ID = secrets.token_hex(3)
+
+
+@scenario("health", weight=1)
+async def health(client: HttpClient, user: VirtualUser):
+    await client.request("GET", "/health")
+{"".join(sections)}'''
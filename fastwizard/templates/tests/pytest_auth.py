@@ -0,0 +1,238 @@
+def get_auth_tests_template() -> str:
+        """Template pour tests/test_auth.py (routes d'authentification)"""
+        return '''"""
+Tests fonctionnels des routes d'authentification.
+Automatically generated by FastWizard 🧙‍♂️
+"""
+from app.domains.auth.model import Role, User
+
+API = "/api/v1/auth"
+
+
+def login(client, username: str, password: str):
+    return client.post(f"{API}/login", data={"username": username, "password": password})
+
+
+def test_register(client, db):
+    response = client.post(
+        f"{API}/register", json={"username": "bob", "email": "bob@example.com", "password": "Bob-Passw0rd!"}
+    )
+    assert response.status_code == 201
+    body = response.json()
+    assert body["username"] == "bob"
+    assert body["is_admin"] is False
+    assert "hashed_password" not in body
+    assert db.query(User).filter(User.username == "bob").count() == 1
+
+
+def test_register_duplicate_username(client, user):
+    response = client.post(
+        f"{API}/register", json={"username": user.username, "email": "other@example.com", "password": "Bob-Passw0rd!"}
+    )
+    assert response.status_code == 400
+
+
+def test_register_rejects_short_password(client):
+    response = client.post(f"{API}/register", json={"username": "bob", "email": "bob@example.com", "password": "short"})
+    assert response.status_code == 422
+
+
+def test_login(client, user, password):
+    response = login(client, user.username, password)
+    assert response.status_code == 200
+    tokens = response.json()
+    assert tokens["token_type"] == "bearer"
+    assert tokens["access_token"] and tokens["refresh_token"]
+
+
+def test_login_wrong_password(client, user):
+    assert login(client, user.username, "Wrong-Passw0rd!").status_code == 401
+
+
+def test_refresh(client, user, password):
+    refresh_token = login(client, user.username, password).json()["refresh_token"]
+    response = client.post(f"{API}/refresh", json={"refresh_token": refresh_token})
+    assert response.status_code == 200
+    assert response.json()["access_token"]
+
+
+def test_refresh_rejects_access_token(client, user, password):
+    access_token = login(client, user.username, password).json()["access_token"]
+    assert client.post(f"{API}/refresh", json={"refresh_token": access_token}).status_code == 401
+
+
+def test_me(client, user, auth_headers):
+    response = client.get(f"{API}/me", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["username"] == user.username
+
+
+def test_me_requires_token(client):
+    assert client.get(f"{API}/me").status_code in (401, 403)
+    assert client.get(f"{API}/me", headers={"Authorization": "Bearer invalide"}).status_code == 401
+
+
+def test_list_users_is_admin_only(client, auth_headers, admin_headers):
+    assert client.get(f"{API}/users", headers=auth_headers).status_code == 403
+    response = client.get(f"{API}/users", headers=admin_headers)
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+
+
+def test_update_me(client, db, user, auth_headers):
+    response = client.put(f"{API}/me", json={"email": "alice.new@example.com"}, headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["email"] == "alice.new@example.com"
+    db.refresh(user)
+    assert user.email == "alice.new@example.com"
+
+
+def test_update_me_password(client, user, auth_headers, password):
+    response = client.put(f"{API}/me", json={"password": "New-Passw0rd!"}, headers=auth_headers)
+    assert response.status_code == 200
+    assert login(client, user.username, "New-Passw0rd!").status_code == 200
+    assert login(client, user.username, password).status_code == 401
+
+
+def test_update_me_conflict(client, auth_headers, admin):
+    # Les contraintes d'unicité font foi : l'IntegrityError devient une 400 explicite
+    response = client.put(f"{API}/me", json={"username": admin.username}, headers=auth_headers)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Le nom d'utilisateur est déjà utilisé"
+    response = client.put(f"{API}/me", json={"email": admin.email}, headers=auth_headers)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "L'email est déjà utilisé"
+
+
+def test_update_me_keeps_own_values(client, user, auth_headers):
+    response = client.put(f"{API}/me", json={"username": user.username, "email": user.email}, headers=auth_headers)
+    assert response.status_code == 200
+
+
+def test_change_password(client, user, auth_headers, password):
+    response = client.post(
+        f"{API}/change-password",
+        json={"current_password": password, "new_password": "New-Passw0rd!"},
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    assert login(client, user.username, "New-Passw0rd!").status_code == 200
+    assert login(client, user.username, password).status_code == 401
+
+
+def test_change_password_wrong_current(client, auth_headers):
+    response = client.post(
+        f"{API}/change-password",
+        json={"current_password": "Wrong-Passw0rd!", "new_password": "New-Passw0rd!"},
+        headers=auth_headers,
+    )
+    assert response.status_code == 400
+
+
+def test_change_password_requires_token(client, password):
+    response = client.post(f"{API}/change-password", json={"current_password": password, "new_password": "New-Passw0rd!"})
+    assert response.status_code in (401, 403)
+
+
+def test_delete_user(client, db, user, admin_headers):
+    user_id = user.id
+    assert client.delete(f"{API}/users/{user_id}", headers=admin_headers).status_code == 200
+    assert db.query(User).filter(User.id == user_id).count() == 0
+    assert client.delete(f"{API}/users/{user_id}", headers=admin_headers).status_code == 404
+
+
+def test_delete_user_forbidden(client, db, admin, auth_headers, admin_headers):
+    assert client.delete(f"{API}/users/{admin.id}", headers=auth_headers).status_code == 403
+    # Un admin ne peut pas supprimer son propre compte
+    assert client.delete(f"{API}/users/{admin.id}", headers=admin_headers).status_code == 400
+    assert db.query(User).filter(User.id == admin.id).count() == 1
+
+
+def test_roles_crud(client, db, admin_headers):
+    response = client.post(f"{API}/roles/", json={"name": "support"}, headers=admin_headers)
+    assert response.status_code == 200
+    role_id = response.json()["id"]
+    assert client.post(f"{API}/roles/", json={"name": "support"}, headers=admin_headers).status_code == 400
+
+    assert "support" in [role["name"] for role in client.get(f"{API}/roles/").json()]
+    assert client.get(f"{API}/roles/{role_id}").json()["name"] == "support"
+
+    response = client.put(f"{API}/roles/{role_id}", json={"name": "helpdesk"}, headers=admin_headers)
+    assert response.status_code == 200
+    assert response.json()["name"] == "helpdesk"
+
+    assert client.delete(f"{API}/roles/{role_id}", headers=admin_headers).status_code == 200
+    assert db.query(Role).filter(Role.id == role_id).count() == 0
+    assert client.get(f"{API}/roles/{role_id}").status_code == 404
+    assert client.put(f"{API}/roles/{role_id}", json={"name": "x"}, headers=admin_headers).status_code == 404
+    assert client.delete(f"{API}/roles/{role_id}", headers=admin_headers).status_code == 404
+
+
+def test_roles_write_is_admin_only(client, db, auth_headers):
+    role = db.query(Role).filter(Role.name == "user").one()
+    assert client.post(f"{API}/roles/", json={"name": "support"}, headers=auth_headers).status_code == 403
+    assert client.put(f"{API}/roles/{role.id}", json={"name": "support"}, headers=auth_headers).status_code == 403
+    assert client.delete(f"{API}/roles/{role.id}", headers=auth_headers).status_code == 403
+    assert client.post(f"{API}/roles/", json={"name": "support"}).status_code in (401, 403)
+'''
+
+
+def get_auth_benchmarks_template() -> str:
+        """Template pour tests/benchmarks/test_auth_services.py"""
+        return '''"""
+Micro-benchmarks des services d'authentification (pytest-benchmark).
+Automatically generated by FastWizard 🧙‍♂️
+
+L'inscription et la connexion sont dominées par bcrypt (~0,2 s par hash) : peu de rounds.
+"""
+import asyncio
+import itertools
+
+import pytest
+from fastapi.security import OAuth2PasswordRequestForm
+
+from app.domains.auth.jwt_handler import create_token_pair
+from app.domains.auth.schemas import TokenRefresh, UserCreate, UserUpdate
+from app.domains.auth.services import (
+    login_user_service,
+    refresh_token_service,
+    register_user_service,
+    update_current_user_service,
+)
+
+pytestmark = pytest.mark.benchmark(group="auth")
+
+
+@pytest.fixture(scope="module")
+def run():
+    """Exécute une coroutine de service sur une boucle réutilisée (asyncio.run en crée une par appel)."""
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
+
+def test_register_user_service(benchmark, db, run, password):
+    counter = itertools.count()
+
+    def register():
+        username = f"bench{next(counter)}"
+        return run(register_user_service(UserCreate(username=username, email=f"{username}@example.com", password=password), db))
+
+    benchmark.pedantic(register, rounds=10)
+
+
+def test_login_user_service(benchmark, db, run, user, password):
+    form = OAuth2PasswordRequestForm(username=user.username, password=password)
+    tokens = benchmark.pedantic(lambda: run(login_user_service(form, db)), rounds=10)
+    assert tokens["access_token"]
+
+
+def test_refresh_token_service(benchmark, db, run, user):
+    token_data = TokenRefresh(refresh_token=create_token_pair(user.id, user.username)["refresh_token"])
+    assert benchmark(lambda: run(refresh_token_service(token_data, db)))["access_token"]
+
+
+def test_update_current_user_service(benchmark, db, run, user):
+    update = UserUpdate(email="alice.updated@example.com")
+    benchmark(lambda: run(update_current_user_service(update, user, db)))
+'''
@@ -0,0 +1,127 @@
+from typing import Dict
+
+# Valeurs d'exemple par type de champ (création, puis mise à jour), en JSON
+SAMPLE_VALUES = {
+    "str": ('"exemple"', '"modifié"'),
+    "int": ("1", "2"),
+    "float": ("1.5", "2.5"),
+    "bool": ("True", "False"),
+    "datetime": ('"2024-01-01T00:00:00"', '"2025-06-30T12:00:00"'),
+}
+
+
+def sample_payloads(fields: Dict[str, str]):
+    created = ", ".join(f'"{name}": {SAMPLE_VALUES.get(kind, SAMPLE_VALUES["str"])[0]}' for name, kind in fields.items())
+    updated = ", ".join(f'"{name}": {SAMPLE_VALUES.get(kind, SAMPLE_VALUES["str"])[1]}' for name, kind in fields.items())
+    return f"{{{created}}}", f"{{{updated}}}"
+
+
+def get_crud_tests_template(app_name: str, entity: dict) -> str:
+        """Template pour tests/test_<app>.py (routes CRUD d'une entité)"""
+        model_name = entity["model_name"]
+        ModelName = entity["ModelName"]
+        payload, update = sample_payloads(entity.get("fields", {}))
+
+        return f'''"""
+Tests fonctionnels des routes CRUD de {ModelName}.
+Automatically generated by FastWizard 🧙‍♂️
+"""
+BASE = "/api/v1/{app_name}/{model_name}s/"
+PAYLOAD = {payload}
+UPDATE = {update}
+
+
+def create(client) -> dict:
+    response = client.post(BASE, json=PAYLOAD)
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_create(client):
+    body = create(client)
+    assert body["id"]
+    assert {{field: body[field] for field in PAYLOAD}} == PAYLOAD
+
+
+def test_read_one(client):
+    created = create(client)
+    response = client.get(f"{{BASE}}{{created['id']}}")
+    assert response.status_code == 200
+    assert response.json() == created
+
+
+def test_read_one_not_found(client):
+    assert client.get(f"{{BASE}}999999").status_code == 404
+
+
+def test_read_all_is_paginated(client):
+    for _ in range(3):
+        create(client)
+    assert len(client.get(BASE).json()) == 3
+    assert len(client.get(BASE, params={{"skip": 1, "limit": 1}}).json()) == 1
+
+
+def test_update(client):
+    created = create(client)
+    response = client.put(f"{{BASE}}{{created['id']}}", json=UPDATE)
+    assert response.status_code == 200
+    assert {{field: response.json()[field] for field in UPDATE}} == UPDATE
+
+
+def test_delete(client):
+    created = create(client)
+    assert client.delete(f"{{BASE}}{{created['id']}}").status_code == 200
+    assert client.get(f"{{BASE}}{{created['id']}}").status_code == 404
+'''
+
+
+def get_crud_benchmarks_template(app_name: str, entity: dict) -> str:
+        """Template pour tests/benchmarks/test_<app>_services.py (services CRUD d'une entité)"""
+        model_name = entity["model_name"]
+        ModelName = entity["ModelName"]
+        payload, update = sample_payloads(entity.get("fields", {}))
+
+        return f'''"""
+Micro-benchmarks des services CRUD de {ModelName} (pytest-benchmark).
+Automatically generated by FastWizard 🧙‍♂️
+"""
+import pytest
+
+from app.domains.{app_name} import services
+from app.domains.{app_name}.schemas import {ModelName}Create, {ModelName}Update
+
+pytestmark = pytest.mark.benchmark(group="{app_name}")
+
+PAYLOAD = {payload}
+UPDATE = {update}
+# Une page pleine pour la liste (limite par défaut du router)
+PAGE_SIZE = 100
+
+
+@pytest.fixture
+def {model_name}s(db):
+    return [services.create_{model_name}(db, {ModelName}Create(**PAYLOAD)) for _ in range(PAGE_SIZE)]
+
+
+def test_create_{model_name}(benchmark, db):
+    benchmark(services.create_{model_name}, db, {ModelName}Create(**PAYLOAD))
+
+
+def test_get_{model_name}_page(benchmark, db, {model_name}s):
+    assert len(benchmark(services.get_{model_name}, db, skip=0, limit=PAGE_SIZE)) == PAGE_SIZE
+
+
+def test_get_{model_name}_by_id(benchmark, db, {model_name}s):
+    assert benchmark(services.get_{model_name}_by_id, db, {model_name}s[PAGE_SIZE // 2].id) is not None
+
+
+def test_update_{model_name}(benchmark, db, {model_name}s):
+    benchmark(services.update_{model_name}, db, {model_name}s[0], {ModelName}Update(**UPDATE))
+
+
+def test_delete_{model_name}(benchmark, db):
+    def setup():
+        return (db, services.create_{model_name}(db, {ModelName}Create(**PAYLOAD))), {{}}
+
+    benchmark.pedantic(services.delete_{model_name}, setup=setup, rounds=PAGE_SIZE)
+'''
@@ -0,0 +1,237 @@
+from typing import List
+
+# Image du conteneur de test : la même que docker compose
+TEST_CONTAINERS = {
+    "db-postgresql": ("postgres", "from testcontainers.postgres import PostgresContainer", 'PostgresContainer("postgres:15")', ""),
+    "db-mysql": ("mysql", "from testcontainers.mysql import MySqlContainer", 'MySqlContainer("mysql:8.0")', '.replace("+pymysql", "+mysqldb")'),
+}
+
+
+def get_database_module(selected_modules: List[str]):
+    return next((module for module in selected_modules if module in TEST_CONTAINERS), None)
+
+
+def get_conftest_template(selected_modules: List[str]) -> str:
+        """Template pour tests/conftest.py (base de test transactionnelle, client, utilisateurs)"""
+        db_module = get_database_module(selected_modules)
+        # Réglages lus à l'import de main, donc fixés avant lui
+        test_env = ""
+        if "otel" in selected_modules:
+            # Les traces sont installées à l'import de main : aucune ne doit partir pendant les tests
+            test_env += '\n# Pas de traces pendant les tests\nos.environ["TRACING_ENABLED"] = "false"\n'
+        if "websocket" in selected_modules:
+            test_env += '\n# Diffusion WebSocket en mémoire : les tests ne dépendent pas de Redis\nos.environ["WS_BACKEND"] = "memory"\n'
+
+        if db_module is None:
+            os_import = "import os\n\n" if test_env else ""
+            noqa = "  # noqa: E402" if test_env else ""
+            return f'''"""
+Fixtures pytest du projet.
+Automatically generated by FastWizard 🧙‍♂️
+
+L'application est testée sans son lifespan : les services externes ne sont pas requis.
+"""
+{os_import}import pytest
+from fastapi.testclient import TestClient
+{test_env}
+from main import app{noqa}
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+'''
+
+        engine_name, container_import, container, url_fix = TEST_CONTAINERS[db_module]
+        has_auth = "auth-jwt" in selected_modules
+
+        auth_imports = ""
+        seed_roles = ""
+        auth_fixtures = ""
+        if has_auth:
+            auth_imports = '''from app.domains.auth.jwt_handler import create_token_pair, get_password_hash  # noqa: E402
+from app.domains.auth.model import Role, User  # noqa: E402
+'''
+            seed_roles = '''
+    # Rôles par défaut (insérés par la migration initiale en production)
+    with SessionLocal(bind=engine) as session:
+        session.add_all(Role(name=name) for name in Role.DEFAULT_ROLES)
+        session.commit()
+'''
+            auth_fixtures = '''
+
+PASSWORD = "Test-Passw0rd!"
+
+
+@pytest.fixture(scope="session")
+def password_hash():
+    """Hash bcrypt calculé une seule fois (~0,2 s par hash)."""
+    return get_password_hash(PASSWORD)
+
+
+@pytest.fixture
+def password():
+    return PASSWORD
+
+
+def make_user(db, username: str, role_name: str, password_hash: str) -> User:
+    role = db.query(Role).filter(Role.name == role_name).one()
+    user = User(username=username, email=f"{username}@example.com", hashed_password=password_hash, role_id=role.id)
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+@pytest.fixture
+def user(db, password_hash):
+    return make_user(db, "alice", "user", password_hash)
+
+
+@pytest.fixture
+def admin(db, password_hash):
+    return make_user(db, "root_admin", "admin", password_hash)
+
+
+@pytest.fixture
+def auth_headers(user):
+    tokens = create_token_pair(user.id, user.username)
+    return {"Authorization": f"Bearer {tokens['access_token']}"}
+
+
+@pytest.fixture
+def admin_headers(admin):
+    tokens = create_token_pair(admin.id, admin.username)
+    return {"Authorization": f"Bearer {tokens['access_token']}"}
+'''
+
+        return f'''"""
+Fixtures pytest du projet.
+Automatically generated by FastWizard 🧙‍♂️
+
+Base de test :
+- par défaut                : SQLite en mémoire, aucune dépendance
+- TEST_DATABASE=container   : {engine_name} jetable via testcontainers (Docker requis), même moteur
+                              qu'en production
+- TEST_DATABASE_URL=<url>   : base existante dédiée aux tests (tables créées puis supprimées)
+
+Chaque test s'exécute dans une transaction annulée à la fin : les commit() des services
+deviennent des SAVEPOINT et la base est vide au début de chaque test.
+L'application est testée sans son lifespan : Redis et les autres services ne sont pas requis.
+"""
+import importlib
+import os
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import StaticPool
+
+# Avant l'import de app.database : son moteur ne doit viser ni la base de développement
+# (.env) ni le service « db » de docker compose
+os.environ["DATABASE_URL"] = os.getenv("TEST_DATABASE_URL", "sqlite://")
+os.environ["DOCKER_ENV"] = ""
+{test_env}
+from app.database import Base, SessionLocal, get_db  # noqa: E402
+{auth_imports}from main import app  # noqa: E402
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def import_models():
+    """Enregistre app/domains/*/model.py dans Base.metadata (comme alembic/env.py)."""
+    for model in sorted((ROOT / "app" / "domains").glob("*/model.py")):
+        importlib.import_module(f"app.domains.{{model.parent.name}}.model")
+
+
+def create_test_engine(url: str):
+    if not url.startswith("sqlite"):
+        return create_engine(url)
+    # Une seule connexion partagée : la base en mémoire vit aussi longtemps qu'elle
+    engine = create_engine(url, connect_args={{"check_same_thread": False}}, poolclass=StaticPool)
+
+    # pysqlite ouvre ses transactions lui-même et casse les SAVEPOINT : SQLAlchemy s'en charge
+    @event.listens_for(engine, "connect")
+    def disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def begin_transaction(connection):
+        connection.exec_driver_sql("BEGIN")
+
+    return engine
+
+
+@pytest.fixture(scope="session")
+def engine():
+    container = None
+    url = os.getenv("TEST_DATABASE_URL")
+    if not url and os.getenv("TEST_DATABASE") == "container":
+        {container_import}
+
+        container = {container}.start()
+        url = container.get_connection_url(){url_fix}
+    engine = create_test_engine(url or "sqlite://")
+    import_models()
+    Base.metadata.create_all(engine)
+{seed_roles}
+    yield engine
+
+    Base.metadata.drop_all(engine)
+    engine.dispose()
+    if container is not None:
+        container.stop()
+
+
+@pytest.fixture
+def db(engine):
+    """Session dans une transaction annulée à la fin du test."""
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = SessionLocal(bind=connection, join_transaction_mode="create_savepoint")
+    yield session
+    session.close()
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def client(db):
+    """Client HTTP dont les routes utilisent la session `db` du test."""
+    app.dependency_overrides[get_db] = lambda: db
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_db, None)
+{auth_fixtures}'''
+
+
+def get_pytest_ini_template() -> str:
+        """Template pour pytest.ini"""
+        return '''[pytest]
+testpaths = tests
+pythonpath = .
+'''
+
+
+def get_requirements_dev_template(selected_modules: List[str]) -> str:
+        """Template pour requirements-dev.txt (tests et benchmarks, hors image de production)"""
+        requirements = ["-r requirements.txt", "httpx==0.28.1", "pytest==9.1.1", "pytest-benchmark==5.3.0"]
+        db_module = get_database_module(selected_modules)
+        if db_module is not None:
+            requirements.append(f"testcontainers[{TEST_CONTAINERS[db_module][0]}]>=4.8")
+        return "\n".join(requirements) + "\n"
+
+
+def get_main_tests_template() -> str:
+        """Template pour tests/test_main.py"""
+        return '''"""
+Tests des routes de base.
+Automatically generated by FastWizard 🧙‍♂️
+"""
+
+
+def test_health(client):
+    response = client.get("/health")
+    assert response.status_code == 200
+    assert response.json() == {"status": "healthy"}
+'''
@@ -0,0 +1,58 @@
+def get_websocket_tests_template() -> str:
+        """Template pour tests/test_websocket.py (rooms, protocoles et frames invalides)"""
+        return '''"""
+Tests fonctionnels des rooms WebSocket.
+Automatically generated by FastWizard 🧙‍♂️
+
+Les deux sockets d'un test doivent partager la boucle d'événements de l'application :
+le client est ouvert avec son lifespan (diffusion en mémoire, voir conftest.py).
+"""
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from main import app
+
+ROOM = "/ws/room/test"
+
+
+@pytest.fixture
+def ws_client():
+    with TestClient(app) as client:
+        yield client
+
+
+def test_text_broadcast(ws_client):
+    with ws_client.websocket_connect(ROOM) as sender, ws_client.websocket_connect(ROOM) as listener:
+        sender.send_text("hello")
+        assert listener.receive_text() == "[test] hello"
+        assert sender.receive_text() == "[test] hello"
+
+
+def test_json_protocol_broadcast(ws_client):
+    with ws_client.websocket_connect(ROOM, subprotocols=["fw.json"]) as sender:
+        sender.send_text(json.dumps({"value": 1}))
+        assert json.loads(sender.receive_text()) == {"room": "test", "data": {"value": 1}}
+
+
+def test_binary_frame_on_text_protocol_closes(ws_client):
+    with ws_client.websocket_connect(ROOM) as sender, ws_client.websocket_connect(ROOM) as listener:
+        sender.send_bytes(b"\\x01\\x02")
+        with pytest.raises(WebSocketDisconnect) as exc_info:
+            sender.receive_text()
+        # 1007 = "Invalid frame payload data"
+        assert exc_info.value.code == 1007
+        # Rien n'a été diffusé pour le frame invalide : le premier message reçu est le suivant
+        listener.send_text("after")
+        assert listener.receive_text() == "[test] after"
+
+
+def test_malformed_json_frame_closes(ws_client):
+    with ws_client.websocket_connect(ROOM, subprotocols=["fw.json"]) as sender:
+        sender.send_text("{not json")
+        with pytest.raises(WebSocketDisconnect) as exc_info:
+            sender.receive_text()
+        assert exc_info.value.code == 1007
+'''
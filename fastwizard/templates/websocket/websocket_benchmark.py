@@ -0,0 +1,123 @@
+"""Template pour le benchmark local du fan-out WebSocket"""
+
+def get_template(config):
+    return '''"""
+Benchmark local du fan-out WebSocket entre plusieurs workers.
+Automatically generated by FastWizard 🧙‍♂️
+
+Chaque worker est un processus avec son propre ConnectionManager et des
+clients factices ; tous publient dans la même room puis attendent de
+recevoir les messages de tous les workers.
+
+Usage :
+    WS_BACKEND=redis python benchmarks/ws_fanout.py --workers 4 --clients 50 --messages 2000
+    python benchmarks/ws_fanout.py --queue-size 100 --policy drop-newest
+"""
+import argparse
+import asyncio
+import multiprocessing as mp
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+class FakeWebSocket:
+    """Client factice qui compte les messages reçus."""
+
+    def __init__(self):
+        self.received = 0
+        self.scope = {"subprotocols": []}
+
+    async def accept(self, subprotocol=None):
+        pass
+
+    async def send(self, message: dict):
+        self.received += 1
+
+    async def close(self, code: int = 1000):
+        pass
+
+
+async def run_worker(index: int, args, barrier, results):
+    os.environ["WS_BACKEND"] = args.backend
+    os.environ["WS_SEND_QUEUE_SIZE"] = str(args.queue_size)
+    os.environ["WS_SLOW_CONSUMER_POLICY"] = args.policy
+    from app.core.websocket import ConnectionManager, create_backend
+
+    manager = ConnectionManager(create_backend(args.backend))
+    await manager.start()
+    clients = [FakeWebSocket() for _ in range(args.clients)]
+    for client in clients:
+        await manager.connect(client, args.room)
+
+    # Sans backend partagé, un worker ne reçoit que ses propres messages
+    publishers = 1 if args.backend == "memory" else args.workers
+    expected = args.messages * publishers * args.clients
+
+    await asyncio.to_thread(barrier.wait)
+    start = time.perf_counter()
+    for i in range(args.messages):
+        await manager.broadcast(f"{index}:{i}", args.room)
+    published = time.perf_counter() - start
+
+    deadline = start + args.timeout
+    received = 0
+    while time.perf_counter() < deadline:
+        received = sum(client.received for client in clients)
+        if received >= expected:
+            break
+        await asyncio.sleep(0.001)
+    elapsed = time.perf_counter() - start
+
+    dropped = sum(connection.dropped for connection in manager.connections.values())
+    await manager.stop()
+    results.put((index, received, expected, published, elapsed, dropped))
+
+
+def worker_main(index: int, args, barrier, results):
+    asyncio.run(run_worker(index, args, barrier, results))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark du fan-out WebSocket")
+    parser.add_argument("--backend", default=os.getenv("WS_BACKEND", "memory"), choices=["memory", "redis", "streams"])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--clients", type=int, default=50, help="clients par worker")
+    parser.add_argument("--messages", type=int, default=1000, help="messages publiés par worker")
+    parser.add_argument("--room", default="bench")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--queue-size", type=int, default=10_000, help="file d'envoi par client")
+    parser.add_argument("--policy", default="drop-oldest", choices=["drop-oldest", "drop-newest", "disconnect"])
+    args = parser.parse_args()
+
+    barrier = mp.Barrier(args.workers)
+    results = mp.Queue()
+    processes = [
+        mp.Process(target=worker_main, args=(i, args, barrier, results))
+        for i in range(args.workers)
+    ]
+    for process in processes:
+        process.start()
+    rows = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+
+    received = sum(row[1] for row in rows)
+    expected = sum(row[2] for row in rows)
+    elapsed = max(row[4] for row in rows)
+    published = args.messages * args.workers
+
+    print(f"Backend            : {args.backend}")
+    print(f"Workers x clients  : {args.workers} x {args.clients}")
+    print(f"Messages publiés   : {published} ({published / max(row[3] for row in rows):,.0f} msg/s)")
+    print(f"Messages livrés    : {received}/{expected} ({sum(row[5] for row in rows)} abandonnés)")
+    print(f"Durée              : {elapsed:.3f} s")
+    print(f"Débit de livraison : {received / elapsed:,.0f} msg/s")
+
+
+if __name__ == "__main__":
+    main()
+'''
@@ -0,0 +1,106 @@
+"""Template pour le benchmark des protocoles WebSocket (codecs, regroupement, compression)"""
+
+def get_template(config):
+    return '''"""
+Benchmark des protocoles WebSocket : octets sur le fil et CPU par message.
+Automatically generated by FastWizard 🧙‍♂️
+
+Compare le protocole texte, fw.json et fw.msgpack, avec ou sans
+regroupement des événements par frame, avec ou sans permessage-deflate
+(deflate brut à contexte partagé, comme le négocie uvicorn).
+
+Usage :
+    python benchmarks/ws_codecs.py --messages 20000 --batch 10
+"""
+import argparse
+import json
+import random
+import sys
+import time
+import zlib
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.websocket import CODECS, TEXT_CODEC, OutgoingMessage  # noqa: E402
+
+
+def sample_events(count: int, seed: int = 42) -> list:
+    """Flux d'événements type « ticker » haute fréquence."""
+    rng = random.Random(seed)
+    symbols = ["BTC-USD", "ETH-USD", "SOL-USD", "EUR-USD"]
+    return [
+        {
+            "type": "tick",
+            "symbol": rng.choice(symbols),
+            "price": round(rng.uniform(10, 70_000), 2),
+            "size": round(rng.uniform(0.001, 5), 4),
+            "ts": 1_700_000_000_000 + i,
+        }
+        for i in range(count)
+    ]
+
+
+def frame_size(payload: bytes) -> int:
+    """Taille sur le fil, en-tête de frame serveur -> client inclus."""
+    length = len(payload)
+    header = 2 if length < 126 else 4 if length < 65_536 else 10
+    return header + length
+
+
+def run(codec, wires: list, batch: int, deflate: bool):
+    compressor = zlib.compressobj(wbits=-15) if deflate else None
+    total_bytes = 0
+    frames = 0
+    pending = []
+
+    def send(frame: dict):
+        nonlocal total_bytes, frames
+        data = frame["bytes"] if "bytes" in frame else frame["text"].encode()
+        if compressor is not None:
+            # permessage-deflate retire les 4 octets de fin du flush
+            data = (compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH))[:-4]
+        total_bytes += frame_size(data)
+        frames += 1
+
+    start = time.process_time()
+    for wire in wires:
+        frame = OutgoingMessage(wire).frame(codec)
+        if batch > 1:
+            pending.append(frame)
+            if len(pending) == batch:
+                send(codec.coalesce(pending))
+                pending = []
+        else:
+            send(frame)
+    if pending:
+        send(codec.coalesce(pending))
+    cpu = time.process_time() - start
+    return frames, total_bytes, cpu
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark des protocoles WebSocket")
+    parser.add_argument("--messages", type=int, default=20_000)
+    parser.add_argument("--batch", type=int, default=10, help="événements par frame regroupé")
+    args = parser.parse_args()
+
+    # Ce que broadcast() publie : un JSON par message
+    wires = [json.dumps(event, separators=(",", ":")) for event in sample_events(args.messages)]
+    codecs = [TEXT_CODEC] + list(CODECS.values())
+
+    print(f"{'protocole':<10} {'batch':>5} {'deflate':>7} {'frames':>8} {'octets/msg':>11} {'µs CPU/msg':>11}")
+    for codec in codecs:
+        batches = [1, args.batch] if codec.batched and args.batch > 1 else [1]
+        for batch in batches:
+            for deflate in (False, True):
+                frames, total_bytes, cpu = run(codec, wires, batch, deflate)
+                print(
+                    f"{codec.name:<10} {batch:>5} {'oui' if deflate else 'non':>7} {frames:>8} "
+                    f"{total_bytes / args.messages:>11.1f} {cpu / args.messages * 1e6:>11.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
+'''
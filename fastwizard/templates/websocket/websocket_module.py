@@ -1,47 +1,657 @@
 def get_template(config):
+    selected_modules = config.get("selected_modules", [])
+
+    # Par défaut, on partage les rooms via le cache s'il est présent
+    if "cache-valkey" in selected_modules:
+        default_backend = "redis"
+        redis_url = config.get("redis_url", "redis://valkey:6379/0")
+    elif "cache-redis" in selected_modules:
+        default_backend = "redis"
+        redis_url = config.get("redis_url", "redis://redis:6379/0")
+    else:
+        default_backend = "memory"
+        redis_url = config.get("redis_url", "redis://localhost:6379/0")
+
+    # Jauge Prometheus des connexions ouvertes (module metrics)
+    if "metrics" in selected_modules:
+        metrics_import = "\nfrom app.core.metrics import WS_CONNECTIONS"
+        connect_metric = "\n        WS_CONNECTIONS.inc()"
+        disconnect_metric = "\n        WS_CONNECTIONS.dec()"
+    else:
+        metrics_import = connect_metric = disconnect_metric = ""
+
     return f'''"""
 WebSocket module for FastAPI.
 Automatically generated by FastWizard 🧙‍♂️
+
+Rooms are shared between workers through a pluggable broadcast backend,
+selected with the WS_BACKEND environment variable:
+- "memory"  : in-process only (single worker)
+- "redis"   : Redis/Valkey pub/sub, one channel per room
+- "streams" : Redis/Valkey Streams, one capped stream read by every worker
+
+Clients may opt into a structured protocol through the WebSocket
+subprotocol header: "fw.json" (JSON text frames) or "fw.msgpack" (binary
+msgpack frames). With WS_COALESCE_INTERVAL > 0, events queued during one
+tick are sent as a single array frame. Clients without a subprotocol keep
+the plain text protocol. permessage-deflate is negotiated by uvicorn
+(--ws-per-message-deflate, enabled by default), as are protocol-level
+ping/pong frames (--ws-ping-interval / --ws-ping-timeout) that detect dead
+peers for every client.
 """
 
-from fastapi import WebSocket, WebSocketDisconnect
-from typing import List, Dict
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager, suppress
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
+
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect{metrics_import}
+
+WS_BACKEND = os.getenv("WS_BACKEND", "{default_backend}")
+WS_REDIS_URL = os.getenv("WS_REDIS_URL", "{redis_url}")
+WS_CHANNEL_PREFIX = os.getenv("WS_CHANNEL_PREFIX", "ws:room:")
+WS_STREAM_KEY = os.getenv("WS_STREAM_KEY", "ws:broadcast")
+WS_STREAM_MAXLEN = int(os.getenv("WS_STREAM_MAXLEN", "10000"))
+WS_BATCH_SIZE = int(os.getenv("WS_BATCH_SIZE", "256"))
+# File d'envoi bornée par client et politique appliquée quand elle est pleine :
+# "drop-oldest" | "drop-newest" | "disconnect"
+WS_SEND_QUEUE_SIZE = int(os.getenv("WS_SEND_QUEUE_SIZE", "100"))
+WS_SLOW_CONSUMER_POLICY = os.getenv("WS_SLOW_CONSUMER_POLICY", "drop-oldest")
+# Heartbeat applicatif, réservé aux protocoles fw.json / fw.msgpack : ping toutes les N secondes.
+# Fermeture optionnelle après M secondes sans activité (0 = jamais) ; pour un client texte,
+# chaque frame envoyé compte comme activité, un simple auditeur n'est donc pas fermé.
+WS_PING_INTERVAL = float(os.getenv("WS_PING_INTERVAL", "20"))
+WS_IDLE_TIMEOUT = float(os.getenv("WS_IDLE_TIMEOUT", "0"))
+PING_MESSAGE = '{{"type":"ping"}}'
+PONG_PAYLOAD = {{"type": "pong"}}
+# Protocoles structurés proposés aux clients, et regroupement des événements par tick
+WS_CODECS = [name.strip() for name in os.getenv("WS_CODECS", "json,msgpack").split(",") if name.strip()]
+WS_COALESCE_INTERVAL = float(os.getenv("WS_COALESCE_INTERVAL", "0"))
+WS_COALESCE_MAX = int(os.getenv("WS_COALESCE_MAX", "100"))
+
+logger = logging.getLogger(__name__)
+
+Batch = List[Tuple[str, str]]  # [(room, JSON-encoded message), ...]
+
+
+class BroadcastBackend:
+    """Transport used to fan room messages out to every worker."""
+
+    deliver: Optional[Callable[[Batch], Awaitable[None]]] = None
+
+    async def start(self, deliver: Callable[[Batch], Awaitable[None]]):
+        self.deliver = deliver
+
+    async def stop(self):
+        pass
+
+    async def publish(self, room: str, message: str):
+        raise NotImplementedError
+
+
+class MemoryBackend(BroadcastBackend):
+    """Single-process backend: messages never leave the current worker."""
+
+    async def publish(self, room: str, message: str):
+        await self.deliver([(room, message)])
+
+
+class RedisPubSubBackend(BroadcastBackend):
+    """Redis/Valkey pub/sub: one channel per room, pattern-subscribed by every worker."""
+
+    def __init__(self, url: str = WS_REDIS_URL, prefix: str = WS_CHANNEL_PREFIX):
+        self.url = url
+        self.prefix = prefix
+        self.redis = None
+        self.pubsub = None
+        self._subscribed = False
+        self._reader: Optional[asyncio.Task] = None
+
+    async def start(self, deliver):
+        from redis.asyncio import Redis
+
+        await super().start(deliver)
+        # Aucune connexion ici : Redis indisponible ne bloque pas le démarrage,
+        # l'abonnement est fait (et retenté) par la boucle de lecture
+        self.redis = Redis.from_url(self.url, decode_responses=True)
+        self.pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+        self._reader = asyncio.create_task(self._read_loop())
+
+    async def stop(self):
+        if self._reader:
+            self._reader.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._reader
+        if self.pubsub:
+            await self.pubsub.aclose()
+        if self.redis:
+            await self.redis.aclose()
+
+    async def publish(self, room: str, message: str):
+        await self.redis.publish(self.prefix + room, message)
+
+    async def _read_loop(self):
+        prefix_len = len(self.prefix)
+        while True:
+            try:
+                if not self._subscribed:
+                    # Une fois abonné, redis-py se réabonne seul après une reconnexion
+                    await self.pubsub.psubscribe(f"{{self.prefix}}*")
+                    self._subscribed = True
+                # Attend un message, puis draine ce qui est déjà bufferisé
+                msg = await self.pubsub.get_message(timeout=None)
+                if msg is None:
+                    continue
+                batch = [(msg["channel"][prefix_len:], msg["data"])]
+                while len(batch) < WS_BATCH_SIZE:
+                    msg = await self.pubsub.get_message(timeout=0.0)
+                    if msg is None:
+                        break
+                    batch.append((msg["channel"][prefix_len:], msg["data"]))
+                await self.deliver(batch)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("WebSocket pub/sub reader error: %s", exc)
+                await asyncio.sleep(1)
+
+
+class RedisStreamsBackend(BroadcastBackend):
+    """Redis/Valkey Streams: one capped stream, each worker reads from its own last id."""
+
+    def __init__(self, url: str = WS_REDIS_URL, stream: str = WS_STREAM_KEY):
+        self.url = url
+        self.stream = stream
+        self.redis = None
+        self._last_id: Optional[str] = None
+        self._reader: Optional[asyncio.Task] = None
+
+    async def start(self, deliver):
+        from redis.asyncio import Redis
+
+        await super().start(deliver)
+        # Aucune connexion ici : la position de départ est lue (et retentée) par la boucle de lecture
+        self.redis = Redis.from_url(self.url, decode_responses=True)
+        self._reader = asyncio.create_task(self._read_loop())
+
+    async def stop(self):
+        if self._reader:
+            self._reader.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._reader
+        if self.redis:
+            await self.redis.aclose()
+
+    async def publish(self, room: str, message: str):
+        await self.redis.xadd(
+            self.stream,
+            {{"room": room, "message": message}},
+            maxlen=WS_STREAM_MAXLEN,
+            approximate=True,
+        )
+
+    async def _read_loop(self):
+        while True:
+            try:
+                if self._last_id is None:
+                    # Démarre après la dernière entrée existante : rien de publié ensuite n'est perdu
+                    last = await self.redis.xrevrange(self.stream, count=1)
+                    self._last_id = last[0][0] if last else "0-0"
+                response = await self.redis.xread(
+                    {{self.stream: self._last_id}}, count=WS_BATCH_SIZE, block=1000
+                )
+                for _stream, entries in response:
+                    batch = []
+                    for entry_id, fields in entries:
+                        self._last_id = entry_id
+                        batch.append((fields["room"], fields["message"]))
+                    await self.deliver(batch)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("WebSocket stream reader error: %s", exc)
+                await asyncio.sleep(1)
+
+
+def create_backend(name: str = WS_BACKEND) -> BroadcastBackend:
+    """Instancie le backend de diffusion demandé."""
+    if name == "memory":
+        return MemoryBackend()
+    if name == "redis":
+        return RedisPubSubBackend()
+    if name == "streams":
+        return RedisStreamsBackend()
+    raise ValueError(f"WS_BACKEND inconnu '{{name}}' (memory, redis, streams)")
+
+
+class OutgoingMessage:
+    """A broadcast message, encoded at most once per codec on this worker."""
+
+    __slots__ = ("wire", "_payload", "_frames")
+
+    def __init__(self, wire: str):
+        self.wire = wire
+        self._payload: Any = self
+        self._frames: Dict[str, dict] = {{}}
+
+    @property
+    def payload(self) -> Any:
+        if self._payload is self:
+            self._payload = json.loads(self.wire)
+        return self._payload
+
+    def frame(self, codec: "Codec") -> dict:
+        frame = self._frames.get(codec.name)
+        if frame is None:
+            frame = self._frames[codec.name] = codec.frame(self)
+        return frame
+
+
+class Codec:
+    """Plain text protocol: strings are sent as-is, other payloads as JSON."""
+
+    name = "text"
+    subprotocol: Optional[str] = None
+    batched = False
+
+    def frame(self, message: OutgoingMessage) -> dict:
+        # Seules les chaînes JSON sont décodées, le reste est déjà du JSON
+        if message.wire.startswith('"'):
+            return {{"type": "websocket.send", "text": message.payload}}
+        return {{"type": "websocket.send", "text": message.wire}}
+
+    def coalesce(self, frames: List[dict]) -> dict:
+        raise NotImplementedError
+
+    def decode(self, event: dict) -> Any:
+        """Decode an inbound frame; raises ValueError on a malformed payload."""
+        data = event.get("text")
+        if data is None:
+            # Frame binaire sur le protocole texte : rien à diffuser
+            raise ValueError("binary frame on the plain text protocol")
+        return data
+
+
+class JsonCodec(Codec):
+    """JSON text frames; coalesced frames are JSON arrays of events."""
+
+    name = "json"
+    subprotocol = "fw.json"
+    batched = True
+
+    def frame(self, message: OutgoingMessage) -> dict:
+        return {{"type": "websocket.send", "text": message.wire}}
+
+    def coalesce(self, frames: List[dict]) -> dict:
+        # Concaténation des JSON déjà encodés : aucun ré-encodage
+        return {{"type": "websocket.send", "text": "[" + ",".join(frame["text"] for frame in frames) + "]"}}
+
+    def decode(self, event: dict) -> Any:
+        data = event.get("text")
+        return json.loads(data if data is not None else event.get("bytes") or b"null")
+
+
+class MsgpackCodec(Codec):
+    """Binary msgpack frames; coalesced frames are msgpack arrays of events."""
+
+    name = "msgpack"
+    subprotocol = "fw.msgpack"
+    batched = True
+
+    def __init__(self):
+        import msgpack
+
+        self._packb = msgpack.packb
+        self._unpackb = msgpack.unpackb
+        self._unpack_errors = (ValueError, TypeError, msgpack.UnpackException)
+
+    def frame(self, message: OutgoingMessage) -> dict:
+        return {{"type": "websocket.send", "bytes": self._packb(message.payload)}}
+
+    def coalesce(self, frames: List[dict]) -> dict:
+        # En-tête de tableau msgpack + éléments déjà encodés : aucun ré-encodage
+        count = len(frames)
+        if count < 16:
+            header = bytes((0x90 | count,))
+        elif count < 0x10000:
+            header = b"\\xdc" + count.to_bytes(2, "big")
+        else:
+            header = b"\\xdd" + count.to_bytes(4, "big")
+        return {{"type": "websocket.send", "bytes": header + b"".join(frame["bytes"] for frame in frames)}}
+
+    def decode(self, event: dict) -> Any:
+        data = event.get("bytes")
+        if data is None:
+            return json.loads(event.get("text") or "null")
+        try:
+            return self._unpackb(data)
+        except self._unpack_errors as exc:
+            # Tronqué, données en trop, clé de map non hashable... : même erreur que JSON
+            raise ValueError(f"invalid msgpack frame: {{exc}}") from exc
+
+
+TEXT_CODEC = Codec()
+
+
+def _load_codecs() -> Dict[str, Codec]:
+    """Instancie les codecs de WS_CODECS, indexés par sous-protocole."""
+    available = {{"json": JsonCodec, "msgpack": MsgpackCodec}}
+    codecs = {{}}
+    for name in WS_CODECS:
+        if name not in available:
+            logger.warning("Unknown WebSocket codec '%s' ignored", name)
+            continue
+        try:
+            codec = available[name]()
+        except ImportError:
+            logger.warning("WebSocket codec '%s' disabled: dependency not installed", name)
+            continue
+        codecs[codec.subprotocol] = codec
+    return codecs
+
+
+CODECS = _load_codecs()
+
+
+def negotiate_codec(websocket: WebSocket) -> Codec:
+    """Pick the first subprotocol offered by the client that we support."""
+    for subprotocol in websocket.scope.get("subprotocols", ()):
+        codec = CODECS.get(subprotocol)
+        if codec is not None:
+            return codec
+    return TEXT_CODEC
+
+
+class ClientConnection:
+    """WebSocket with a bounded outbound queue drained by its own writer task."""
+
+    __slots__ = ("websocket", "manager", "codec", "rooms", "queue", "dropped", "last_seen", "send_latency", "_writer")
+
+    def __init__(self, websocket: WebSocket, manager: "ConnectionManager", codec: Codec = TEXT_CODEC):
+        self.websocket = websocket
+        self.manager = manager
+        self.codec = codec
+        self.rooms: Set[str] = set()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=WS_SEND_QUEUE_SIZE)
+        self.dropped = 0
+        self.last_seen = time.monotonic()
+        self.send_latency = 0.0  # moyenne glissante, en secondes
+        self._writer = asyncio.create_task(self._write_loop())
+
+    def enqueue(self, frame: dict) -> bool:
+        """Queue a frame without waiting; returns False if the client must be disconnected."""
+        try:
+            self.queue.put_nowait(frame)
+            return True
+        except asyncio.QueueFull:
+            self.dropped += 1
+            if WS_SLOW_CONSUMER_POLICY == "drop-newest":
+                return True
+            if WS_SLOW_CONSUMER_POLICY == "drop-oldest":
+                self.queue.get_nowait()
+                self.queue.put_nowait(frame)
+                return True
+            return False
+
+    async def _write_loop(self):
+        coalesce = self.codec.batched and WS_COALESCE_INTERVAL > 0
+        try:
+            while True:
+                frame = await self.queue.get()
+                if coalesce:
+                    # Laisse les événements du tick s'accumuler, puis un seul frame
+                    await asyncio.sleep(WS_COALESCE_INTERVAL)
+                    frames = [frame]
+                    while len(frames) < WS_COALESCE_MAX and not self.queue.empty():
+                        frames.append(self.queue.get_nowait())
+                    frame = self.codec.coalesce(frames)
+                started = time.perf_counter()
+                await self.websocket.send(frame)
+                self.send_latency += (time.perf_counter() - started - self.send_latency) * 0.1
+                if self.codec is TEXT_CODEC:
+                    # Pas de ping applicatif en texte : un envoi réussi vaut activité
+                    self.last_seen = time.monotonic()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Socket fermé ou en erreur : seul ce client est retiré
+            self.manager.disconnect(self.websocket)
+
+    async def close(self, code: int = 1000):
+        self._writer.cancel()
+        with suppress(Exception):
+            await self.websocket.close(code=code)
+
+
+class RoomStats:
+    """Room counters: total messages and rate over the last one-second window."""
+
+    __slots__ = ("messages_total", "_window_start", "_window_count", "_rate")
 
-class ConnectionManager:
-    """Manage WebSocket connections and rooms."""
     def __init__(self):
-        self.active_connections: Dict[str, List[WebSocket]] = {{}}  # room_name -> connections
-
-    async def connect(self, websocket: WebSocket, room: str):
-        await websocket.accept()
-        if room not in self.active_connections:
-            self.active_connections[room] = []
-        self.active_connections[room].append(websocket)
-        print("✅ Client connected to room '{{room}}'")
-
-    def disconnect(self, websocket: WebSocket, room: str):
-        if room in self.active_connections and websocket in self.active_connections[room]:
-            self.active_connections[room].remove(websocket)
-            print("❌ Client disconnected from room '{{room}}'")
-
-    async def broadcast(self, message: str, room: str):
-        """Send message to all clients in a room."""
-        if room in self.active_connections:
-            for connection in self.active_connections[room]:
-                await connection.send_text(message)
+        self.messages_total = 0
+        self._window_start = time.monotonic()
+        self._window_count = 0
+        self._rate = 0.0
+
+    def record(self, count: int):
+        self.messages_total += count
+        now = time.monotonic()
+        elapsed = now - self._window_start
+        if elapsed >= 1.0:
+            self._rate = self._window_count / elapsed
+            self._window_start = now
+            self._window_count = 0
+        self._window_count += count
+
+    @property
+    def rate(self) -> float:
+        # Fenêtre périmée : aucun message depuis plus d'une seconde
+        if time.monotonic() - self._window_start >= 2.0:
+            return 0.0
+        return self._rate
+
+
+class ConnectionManager:
+    """Manage WebSocket connections and rooms.
+
+    Rooms are indexed both ways (room -> connections, connection -> rooms)
+    so join, leave and disconnect are O(1) per room; empty rooms are removed.
+    """
+    def __init__(self, backend: Optional[BroadcastBackend] = None):
+        self.rooms: Dict[str, Set[ClientConnection]] = {{}}
+        self.connections: Dict[WebSocket, ClientConnection] = {{}}
+        self.stats: Dict[str, RoomStats] = {{}}
+        self.backend = backend or create_backend()
+        self._started = False
+        self._heartbeat: Optional[asyncio.Task] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def start(self):
+        """Start listening to the broadcast backend and the heartbeat."""
+        if not self._started:
+            await self.backend.start(self._fan_out)
+            if WS_PING_INTERVAL > 0:
+                self._heartbeat = asyncio.create_task(self._heartbeat_loop())
+            self._started = True
+
+    async def stop(self):
+        if self._started:
+            if self._heartbeat:
+                self._heartbeat.cancel()
+                with suppress(asyncio.CancelledError):
+                    await self._heartbeat
+            await self.backend.stop()
+            self._started = False
+
+    async def connect(self, websocket: WebSocket, room: str) -> ClientConnection:
+        codec = negotiate_codec(websocket)
+        await websocket.accept(subprotocol=codec.subprotocol)
+        connection = ClientConnection(websocket, self, codec)
+        self.connections[websocket] = connection{connect_metric}
+        self.join(websocket, room)
+        logger.debug("Client connected to room '%s'", room)
+        return connection
+
+    def join(self, websocket: WebSocket, room: str):
+        connection = self.connections[websocket]
+        if room not in self.rooms:
+            self.rooms[room] = set()
+            self.stats[room] = RoomStats()
+        self.rooms[room].add(connection)
+        connection.rooms.add(room)
+
+    def leave(self, websocket: WebSocket, room: str):
+        connection = self.connections.get(websocket)
+        if connection is not None and room in connection.rooms:
+            connection.rooms.discard(room)
+            self._remove_from_room(connection, room)
+
+    def disconnect(self, websocket: WebSocket) -> Optional[ClientConnection]:
+        connection = self.connections.pop(websocket, None)
+        if connection is None:
+            return None{disconnect_metric}
+        for room in connection.rooms:
+            self._remove_from_room(connection, room)
+        connection.rooms.clear()
+        connection._writer.cancel()
+        logger.debug("Client disconnected")
+        return connection
+
+    def _remove_from_room(self, connection: ClientConnection, room: str):
+        members = self.rooms.get(room)
+        if members is None:
+            return
+        members.discard(connection)
+        if not members:
+            del self.rooms[room]
+            del self.stats[room]
+
+    async def broadcast(self, message: Union[str, dict, list], room: str):
+        """Send message to all clients in a room, on every worker.
+
+        The payload is JSON-encoded once here for the backend, then encoded
+        at most once per codec on each worker, never once per client.
+        """
+        await self.start()
+        await self.backend.publish(room, json.dumps(message, separators=(",", ":")))
+
+    async def _fan_out(self, batch: Batch):
+        """Deliver a batch of (room, message) to local clients, one pass per room.
+
+        Frames are built once per message and codec and only enqueued: a slow
+        client never blocks the others, it is handled by WS_SLOW_CONSUMER_POLICY.
+        """
+        by_room: Dict[str, List[OutgoingMessage]] = defaultdict(list)
+        for room, message in batch:
+            if room in self.rooms:
+                by_room[room].append(OutgoingMessage(message))
+        slow_consumers = []
+        for room, messages in by_room.items():
+            self.stats[room].record(len(messages))
+            for connection in self.rooms[room]:
+                for message in messages:
+                    if not connection.enqueue(message.frame(connection.codec)):
+                        slow_consumers.append(connection)
+                        break
+        for connection in slow_consumers:
+            logger.warning("Slow consumer disconnected from rooms %s", sorted(connection.rooms))
+            # 1013 = "Try Again Later"
+            self._close(connection, code=1013)
+
+    async def _heartbeat_loop(self):
+        """Ping structured-protocol clients and close those idle for more than WS_IDLE_TIMEOUT.
+
+        Plain text clients never receive an application ping: it would land in
+        their text stream. Their dead sockets are detected by uvicorn's
+        protocol-level pings.
+        """
+        ping = OutgoingMessage(PING_MESSAGE)
+        while True:
+            await asyncio.sleep(WS_PING_INTERVAL)
+            now = time.monotonic()
+            for connection in list(self.connections.values()):
+                if WS_IDLE_TIMEOUT > 0 and now - connection.last_seen > WS_IDLE_TIMEOUT:
+                    logger.info("Idle WebSocket client closed")
+                    # 1001 = "Going Away"
+                    self._close(connection, code=1001)
+                elif connection.codec is not TEXT_CODEC:
+                    connection.enqueue(ping.frame(connection.codec))
+
+    def _close(self, connection: ClientConnection, code: int):
+        if self.disconnect(connection.websocket) is None:
+            return
+        task = asyncio.create_task(connection.close(code=code))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def metrics(self) -> dict:
+        """Per-room gauges: connections, message rate, queue depth and send latency."""
+        rooms = {{}}
+        for room, members in self.rooms.items():
+            depths = [connection.queue.qsize() for connection in members]
+            latencies = [connection.send_latency for connection in members]
+            stats = self.stats[room]
+            rooms[room] = {{
+                "connections": len(members),
+                "messages_total": stats.messages_total,
+                "messages_per_second": round(stats.rate, 2),
+                "queue_depth": {{"total": sum(depths), "max": max(depths)}},
+                "send_latency_ms": {{
+                    "avg": round(sum(latencies) / len(latencies) * 1000, 3),
+                    "max": round(max(latencies) * 1000, 3),
+                }},
+                "dropped": sum(connection.dropped for connection in members),
+            }}
+        return {{"connections": len(self.connections), "rooms": rooms}}
 
 # Singleton manager
 manager = ConnectionManager()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """FastAPI lifespan context to start and stop the broadcast backend."""
+    await manager.start()
+    try:
+        yield
+    finally:
+        await manager.stop()
+
 # Example WebSocket endpoint
 async def websocket_endpoint(websocket: WebSocket, room: str):
     """A WebSocket endpoint for a specific room."""
-    await manager.connect(websocket, room)
+    connection = await manager.connect(websocket, room)
+    codec = connection.codec
     try:
         while True:
-            data = await websocket.receive_text()
+            event = await websocket.receive()
+            if event["type"] == "websocket.disconnect":
+                break
+            connection.last_seen = time.monotonic()
+            try:
+                data = codec.decode(event)
+            except ValueError:
+                logger.info("Malformed WebSocket frame for protocol '%s', closing", codec.name)
+                manager.disconnect(websocket)
+                # 1007 = "Invalid frame payload data"
+                await connection.close(code=1007)
+                break
+            if codec is not TEXT_CODEC and data == PONG_PAYLOAD:
+                continue
             # Echo the message to all clients in the room
-            await manager.broadcast(f"[{{room}}] {{data}}", room)
+            message = f"[{{room}}] {{data}}" if codec is TEXT_CODEC else {{"room": room, "data": data}}
+            try:
+                await manager.broadcast(message, room)
+            except Exception as exc:
+                # Backend injoignable (Redis arrêté) : le message est perdu, pas la connexion
+                logger.warning("WebSocket broadcast to room '%s' failed: %s", room, exc)
     except WebSocketDisconnect:
-        manager.disconnect(websocket, room)
+        pass
+    finally:
+        manager.disconnect(websocket)
 '''
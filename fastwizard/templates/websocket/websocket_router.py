@@ -1,15 +1,30 @@
 def get_template(config):
+    selected_modules = config.get("selected_modules", [])
+
+    # Les métriques sont réservées aux admins si le module de permissions est présent
+    if "auth-permissions" in selected_modules:
+        metrics_imports = "from fastapi import Depends\nfrom app.core.permissions import require_admin\n"
+        metrics_dependencies = ", dependencies=[Depends(require_admin)]"
+    else:
+        metrics_imports = ""
+        metrics_dependencies = ""
+
     return f'''"""
 WebSocket router for FastAPI.
 Automatically generated by FastWizard 🧙‍♂️
 """
 
 from fastapi import APIRouter, WebSocket
-from app.core.websocket import websocket_endpoint
+{metrics_imports}from app.core.websocket import manager, websocket_endpoint
 
 router = APIRouter()
 
 @router.websocket("/room/{{room}}")
 async def ws_room(websocket: WebSocket, room: str):
     await websocket_endpoint(websocket, room)
+
+@router.get("/metrics"{metrics_dependencies})
+async def ws_metrics():
+    """Per-room gauges: connections, message rate, queue depth, send latency."""
+    return manager.metrics()
 '''